@@ -1,5 +1,6 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import html
+import json
 import logging
 import subprocess
 from copy import copy
@@ -9,6 +10,7 @@ from astropy import units as u
 from astropy.coordinates import SkyCoord
 from astropy.io import fits
 from astropy import table
+import gammapy.utils.parallel as parallel
 import gammapy.utils.time as tu
 from gammapy.utils.pbar import progress_bar
 from gammapy.utils.scripts import make_path
@@ -188,7 +190,14 @@ class DataStore:
         return cls(hdu_table=hdu_table, obs_table=obs_table)
 
     @classmethod
-    def from_events_files(cls, events_paths, irfs_paths=None):
+    def from_events_files(
+        cls,
+        events_paths,
+        irfs_paths=None,
+        cache_filename=None,
+        n_jobs=None,
+        parallel_backend=None,
+    ):
         """Create from a list of event filenames.
 
         HDU and observation index tables will be created from the EVENTS header.
@@ -209,6 +218,15 @@ class DataStore:
             as `events_paths`. If None the events files have to contain CALDB and
             IRF header keywords to locate the IRF files, otherwise the IRFs are
             assumed to be contained in the events files.
+        cache_filename : str or `~pathlib.Path`, optional
+            JSON file caching the EVENTS headers, keyed by path, size and
+            modification time of the events files. When rerun, only new or
+            modified files are read. Default is None.
+        n_jobs : int, optional
+            Number of processes to read the EVENTS headers in parallel. Default is
+            one, unless `~gammapy.utils.parallel.N_JOBS_DEFAULT` was modified.
+        parallel_backend : {'multiprocessing', 'ray', 'threads'}, optional
+            Which backend to use for multiprocessing. Default is None.
 
         Returns
         -------
@@ -246,7 +264,13 @@ class DataStore:
         >>> data_store.hdu_table.write("hdu-index.fits.gz") # doctest: +SKIP
         >>> data_store.obs_table.write("obs-index.fits.gz") # doctest: +SKIP
         """
-        return DataStoreMaker(events_paths, irfs_paths).run()
+        return DataStoreMaker(
+            events_paths,
+            irfs_paths,
+            cache_filename=cache_filename,
+            n_jobs=n_jobs,
+            parallel_backend=parallel_backend,
+        ).run()
 
     def info(self, show=True):
         """Print some info."""
@@ -296,7 +320,7 @@ class DataStore:
             Observation container.
 
         """
-        if obs_id not in self.hdu_table["OBS_ID"]:
+        if obs_id not in self.hdu_table._obs_id_rows:
             raise ValueError(f"OBS_ID = {obs_id} not in HDU index table.")
 
         kwargs = {"obs_id": int(obs_id)}
@@ -403,21 +427,25 @@ class DataStore:
         observations : `~gammapy.data.Observations`
             Container holding a list of `~gammapy.data.Observation`.
         """
+        obs_ids = self.obs_ids
+
         if selection is None:
-            obs_id_selection = self.obs_ids
+            obs_id_selection = obs_ids
         else:
-            obs_id_selection = set(np.array(self.obs_ids)[selection])
+            obs_id_selection = np.array(obs_ids)[selection]
 
         if obs_id is None:
             obs_id = obs_id_selection
         else:
+            obs_ids_set = set(obs_ids.tolist())
             for _ in obs_id:
-                if _ not in self.obs_ids:
+                if _ not in obs_ids_set:
                     if skip_missing:
                         log.warning(f"Skipping missing obs_id: {_!r}")
                     else:
                         raise ValueError(f"Missing obs_id: {_!r}")
-            obs_id_selection = [_ for _ in obs_id if _ in obs_id_selection]
+            selected = set(obs_id_selection.tolist())
+            obs_id_selection = [_ for _ in obs_id if _ in selected]
 
         if len(np.unique(obs_id)) != len(obs_id):
             uniques = np.unique(obs_id, return_counts=True)
@@ -662,14 +690,37 @@ class DataStoreChecker(Checker):
             yield from ObservationChecker(obs).run()
 
 
-class DataStoreMaker:
+class DataStoreMaker(parallel.ParallelMixin):
     """Create data store index tables.
 
     This is a multistep process coded as a class.
     Users will usually call this via `DataStore.from_events_files`.
+
+    Parameters
+    ----------
+    events_paths : list of str or `~pathlib.Path`
+        List of paths to the events files.
+    irfs_paths : str, `~pathlib.Path` or list, optional
+        Path to the IRFs file. See `DataStore.from_events_files`. Default is None.
+    cache_filename : str or `~pathlib.Path`, optional
+        JSON file caching the EVENTS headers, keyed by path, size and modification
+        time of the events files. Only new or modified files are read and the cache
+        is updated. Default is None, which reads all the files.
+    n_jobs : int, optional
+        Number of processes to read the headers in parallel.
+        Default is one, unless `~gammapy.utils.parallel.N_JOBS_DEFAULT` was modified.
+    parallel_backend : {'multiprocessing', 'ray', 'threads'}, optional
+        Which backend to use for multiprocessing. Default is None.
     """
 
-    def __init__(self, events_paths, irfs_paths=None):
+    def __init__(
+        self,
+        events_paths,
+        irfs_paths=None,
+        cache_filename=None,
+        n_jobs=None,
+        parallel_backend=None,
+    ):
         if isinstance(events_paths, (str, Path)):
             raise TypeError("Need list of paths, not a single string or Path object.")
 
@@ -679,15 +730,90 @@ class DataStoreMaker:
         else:
             self.irfs_paths = [make_path(path) for path in irfs_paths]
 
+        if cache_filename is not None:
+            cache_filename = make_path(cache_filename)
+
+        self.cache_filename = cache_filename
+        self.n_jobs = n_jobs
+        self.parallel_backend = parallel_backend
+
         # Cache for EVENTS file header information, to avoid multiple reads
         self._events_info = {}
 
     def run(self):
         """Run all steps."""
+        self.read_events_headers()
         hdu_table = self.make_hdu_table()
         obs_table = self.make_obs_table()
         return DataStore(hdu_table=hdu_table, obs_table=obs_table)
 
+    @staticmethod
+    def _cache_key(events_path):
+        """Cache key and file status of an events file."""
+        stat = events_path.stat()
+        key = events_path.resolve().as_posix()
+        return key, {"size": stat.st_size, "mtime": stat.st_mtime_ns}
+
+    def _read_cache(self):
+        """Read the headers cache file."""
+        if self.cache_filename is None or not self.cache_filename.exists():
+            return {}
+
+        with self.cache_filename.open("r") as f:
+            return json.load(f)
+
+    def read_events_headers(self):
+        """Read the EVENTS headers of all files and fill the events information.
+
+        The headers are read in parallel. If `cache_filename` is set, only the
+        headers of files which are not in the cache, or whose size or modification
+        time changed, are read and the cache file is updated.
+        """
+        cache = self._read_cache()
+
+        headers, keys, to_read = {}, {}, []
+
+        for events_path in dict.fromkeys(self.events_paths):
+            if events_path in self._events_info:
+                continue
+
+            if self.cache_filename is not None:
+                key, status = self._cache_key(events_path)
+                entry = cache.get(key, {})
+                if all(entry.get(name) == value for name, value in status.items()):
+                    headers[events_path] = entry["header"]
+                    continue
+                keys[events_path] = key, status
+
+            to_read.append(events_path)
+
+        n_jobs = max(min(self.n_jobs, len(to_read)), 1)
+
+        results = parallel.run_multiprocessing(
+            self.read_events_header,
+            zip(to_read),
+            backend=self.parallel_backend,
+            pool_kwargs=dict(processes=n_jobs),
+            task_name="Read events headers",
+        )
+
+        for events_path, header in zip(to_read, results):
+            headers[events_path] = header
+
+            if events_path in keys:
+                key, status = keys[events_path]
+                cache[key] = {**status, "header": header}
+
+        if keys:
+            with self.cache_filename.open("w") as f:
+                json.dump(cache, f)
+
+        for events_path, irf_path in zip(self.events_paths, self.irfs_paths):
+            if events_path in headers and events_path not in self._events_info:
+                self._events_info[events_path] = self._events_info_from_header(
+                    headers[events_path], events_path, irf_path
+                )
+
     def get_events_info(self, events_path, irf_path=None):
         """Read events header information."""
         if events_path not in self._events_info:
@@ -703,13 +829,38 @@ class DataStoreMaker:
         return self.get_events_info(events_path, irf_path)
 
     @staticmethod
-    def read_events_info(events_path, irf_path=None):
-        """Read mandatory events header information."""
+    def read_events_header(events_path):
+        """Read the EVENTS header, without reading the data.
+
+        Parameters
+        ----------
+        events_path : `~pathlib.Path`
+            Path to the events file.
+
+        Returns
+        -------
+        header : dict
+            Header keywords with string, integer, float or boolean values.
+        """
         log.debug(f"Reading {events_path}")
+        header = fits.getheader(events_path, "EVENTS", memmap=False)
 
-        with fits.open(events_path, memmap=False) as hdu_list:
-            header = hdu_list["EVENTS"].header
+        return {
+            key: value
+            for key, value in header.items()
+            if key not in ["", "COMMENT", "HISTORY"]
+            and isinstance(value, (str, int, float, bool))
+        }
 
+    @staticmethod
+    def read_events_info(events_path, irf_path=None):
+        """Read mandatory events header information."""
+        header = DataStoreMaker.read_events_header(events_path)
+        return DataStoreMaker._events_info_from_header(header, events_path, irf_path)
+
+    @staticmethod
+    def _events_info_from_header(header, events_path, irf_path=None):
+        """Extract the events information from the EVENTS header keywords."""
         na_int, na_str = -1, "NOT AVAILABLE"
 
         info = {}
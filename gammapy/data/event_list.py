@@ -14,6 +14,7 @@ from astropy.visualization import quantity_support
 import matplotlib.pyplot as plt
 from gammapy.maps import MapAxis, MapCoord, RegionGeom, WcsNDMap
 from gammapy.maps.axes import UNIT_STRING_FORMAT
+from gammapy.maps.utils import _icrs_to_frame
 from gammapy.utils.fits import earth_location_from_dict
 from gammapy.utils.testing import Checker
 from gammapy.utils.time import time_ref_from_dict
@@ -34,7 +35,9 @@ class EventList:
 
     - ``RA`` - ICRS system reconstructed right ascension (deg)
     - ``DEC`` - ICRS system reconstructed declination (deg)
-    - ``TIME`` - event time as an `~astropy.time.Time` object
+    - ``TIME`` - event time as an `~astropy.time.Time` object, or as mission elapsed
+      time in a column with a time unit, relative to the reference time of the table
+      meta data
     - ``ENERGY`` - Reconstructed energy (usually MeV for Fermi and TeV for IACTs or WCDs)
 
 
@@ -109,6 +112,8 @@ class EventList:
         for name in reference_table.colnames:
             check = reference_table[name]
             if not isinstance(check, Column):
+                if EventList._is_time_met(table[name]):
+                    continue
                 if not isinstance(table[name], type(check)):
                     raise TypeError(f"Column {name} is not a {check} object.")
             else:
@@ -119,6 +124,11 @@ class EventList:
 
         return table
 
+    @staticmethod
+    def _is_time_met(column):
+        """Whether a time column is stored as mission elapsed time."""
+        return isinstance(column, Column) and u.Unit(column.unit).is_equivalent("s")
+
     def _repr_html_(self):
         try:
             return self.to_html()
@@ -126,7 +136,7 @@ class EventList:
             return f"<pre>{html.escape(str(self))}</pre>"
 
     @classmethod
-    def read(cls, filename, hdu="EVENTS", checksum=False, **kwargs):
+    def read(cls, filename, hdu="EVENTS", checksum=False, lazy=False, **kwargs):
         """Read from FITS file.
 
         Format specification: :ref:`gadf:iact-events`
@@ -139,10 +149,15 @@ class EventList:
             Name of events HDU. Default is "EVENTS".
         checksum : bool
             If True checks both DATASUM and CHECKSUM cards in the file headers. Default is False.
+        lazy : bool
+            If True, the columns are kept as read from the file, memory mapped when the
+            file is not compressed, and event times are kept as mission elapsed time.
+            `~astropy.time.Time` objects are then only created by `EventList.time`.
+            Default is False.
         """
         from gammapy.data.io import EventListReader
 
-        return EventListReader(hdu, checksum).read(filename)
+        return EventListReader(hdu, checksum, lazy=lazy).read(filename)
 
     def to_table_hdu(self, format="gadf"):
         """
@@ -232,13 +247,21 @@ class EventList:
     def time(self):
         """Event times as a `~astropy.time.Time` object.
 
+        If the times are stored as mission elapsed time, the `~astropy.time.Time`
+        object is created on each call.
+
         Notes
         -----
         Times are automatically converted to 64-bit floats.
         With 32-bit floats times will be incorrect by a few seconds
         when e.g. adding them to the reference time.
         """
-        return self.table["TIME"]
+        time = self.table["TIME"]
+
+        if self._is_time_met(time):
+            return self.time_ref + u.Quantity(time.astype("float64"), time.unit)
+
+        return time
 
     @property
     def observation_time_start(self):
@@ -332,7 +355,8 @@ class EventList:
         >>> energy_range =[1, 20] * u.TeV
         >>> event_list = event_list.select_energy(energy_range=energy_range)
         """
-        energy = self.energy
+        energy = self.table["ENERGY"]
+        energy_range = u.Quantity(energy_range).to_value(energy.unit)
         mask = energy_range[0] <= energy
         mask &= energy < energy_range[1]
         return self.select_row_subset(mask)
@@ -350,7 +374,11 @@ class EventList:
         events : `EventList`
             Copy of event list with selection applied.
         """
-        time = self.time
+        time = self.table["TIME"]
+
+        if self._is_time_met(time):
+            time_interval = (time_interval - self.time_ref).to_value(time.unit)
+
         mask = time_interval[0] <= time
         mask &= time < time_interval[1]
         return self.select_row_subset(mask)
@@ -373,7 +401,13 @@ class EventList:
             Copy of event list with selection applied.
         """
         geom = RegionGeom.from_regions(regions, wcs=wcs)
-        mask = geom.contains(self.radec)
+        lon, lat = _icrs_to_frame(
+            ra=u.Quantity(self.table["RA"], "deg").value,
+            dec=u.Quantity(self.table["DEC"], "deg").value,
+            frame=geom.frame,
+        )
+        pix = geom.wcs.wcs_world2pix(lon, lat, 0)
+        mask = geom.contains_wcs_pix(pix)
         return self.select_row_subset(mask)
 
     @deprecated_renamed_argument("band", "values", "2.0")
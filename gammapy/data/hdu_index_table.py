@@ -131,7 +131,7 @@ class HDUIndexTable(Table):
                 f"Invalid hdu_class: {hdu_class}. Valid values are: {valid}"
             )
 
-        if obs_id not in self["OBS_ID"]:
+        if obs_id not in self._obs_id_rows:
             raise IndexError(f"No entry available with OBS_ID = {obs_id}")
 
     def row_idx(self, obs_id, hdu_type=None, hdu_class=None):
@@ -151,18 +151,15 @@ class HDUIndexTable(Table):
         idx : list of int
             List of row indices matching the selection.
         """
-        selection = self["OBS_ID"] == obs_id
+        idx = self._obs_id_rows.get(obs_id, [])
 
         if hdu_class:
-            is_hdu_class = self._hdu_class_stripped == hdu_class
-            selection &= is_hdu_class
+            idx = [_ for _ in idx if self._hdu_class_stripped[_] == hdu_class]
 
         if hdu_type:
-            is_hdu_type = self._hdu_type_stripped == hdu_type
-            selection &= is_hdu_type
+            idx = [_ for _ in idx if self._hdu_type_stripped[_] == hdu_type]
 
-        idx = np.where(selection)[0]
-        return list(idx)
+        return idx
 
     def location_info(self, idx):
         """Create `HDULocation` for a given row index."""
@@ -175,6 +172,14 @@ class HDUIndexTable(Table):
             hdu_name=row["HDU_NAME"].strip(),
         )
 
+    @lazyproperty
+    def _obs_id_rows(self):
+        """Row indices of each observation ID, in table order."""
+        rows = {}
+        for idx, obs_id in enumerate(self["OBS_ID"].tolist()):
+            rows.setdefault(obs_id, []).append(idx)
+        return rows
+
     @lazyproperty
     def _hdu_class_stripped(self):
         return np.array([_.strip() for _ in self["HDU_CLASS"]])
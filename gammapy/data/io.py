@@ -2,12 +2,16 @@
 import warnings
 from astropy.io import fits
 from astropy.table import Table
+from astropy.time import Time
 import astropy.units as u
 from gammapy.data import EventListMetaData, EventList
 from gammapy.utils.scripts import make_path
 from gammapy.utils.metadata import CreatorMetaData
 from gammapy.utils.time import time_ref_from_dict
 
+# file suffixes of the compressions supported by `astropy.io.fits`
+COMPRESSED_SUFFIXES = (".gz", ".bz2", ".xz", ".zip")
+
 
 class EventListReader:
     """Reader class for EventList.
@@ -20,14 +24,19 @@ class EventListReader:
         Name of events HDU. Default is "EVENTS".
     checksum : bool
         If True checks both DATASUM and CHECKSUM cards in the file headers. Default is False.
+    lazy : bool
+        If True, the event table columns are kept as read from the file, memory mapped
+        when the file is not compressed, and the TIME column is kept as mission elapsed
+        time. See `~gammapy.data.EventList.time`. Default is False.
     """
 
-    def __init__(self, hdu="EVENTS", checksum=False):
+    def __init__(self, hdu="EVENTS", checksum=False, lazy=False):
         self.hdu = hdu
         self.checksum = checksum
+        self.lazy = lazy
 
     @staticmethod
-    def from_gadf_hdu(events_hdu):
+    def from_gadf_hdu(events_hdu, lazy=False):
         """Create EventList from gadf HDU."""
         table = Table.read(events_hdu)
         meta = EventListMetaData.from_header(table.meta)
@@ -40,6 +49,11 @@ class EventListReader:
                 f"GADF event table does not contain required columns {missing_columns}"
             )
 
+        if lazy:
+            table["TIME"].unit = table["TIME"].unit or u.s
+            table.remove_columns([_ for _ in ["GLON", "GLAT"] if _ in table.colnames])
+            return EventList(table, meta)
+
         met = u.Quantity(table["TIME"].astype("float64"), "second")
         time = time_ref_from_dict(table.meta) + met
 
@@ -92,10 +106,48 @@ class EventListReader:
                 format = self.identify_format_from_hduclass(events_hdu)
 
             if format == "gadf" or format == "ogip":
-                return self.from_gadf_hdu(events_hdu)
+                return self.from_gadf_hdu(events_hdu, lazy=self.lazy)
             else:
                 raise ValueError(f"Unknown format :{format}")
 
+    def iter_chunks(self, filename, chunk_size):
+        """Iterate over the events of a file in chunks of rows.
+
+        Only the rows of the current chunk are read from the file, which is memory
+        mapped. Compressed files cannot be memory mapped: the events HDU is then
+        decompressed in memory at once, with a warning, and only the event lists
+        are built in chunks. The chunks are returned as lazy event lists, see
+        `~gammapy.data.EventList.read`.
+
+        Parameters
+        ----------
+        filename : `pathlib.Path`, str
+            Filename
+        chunk_size : int
+            Maximum number of events per chunk.
+
+        Yields
+        ------
+        events : `~gammapy.data.EventList`
+            Event list of the chunk.
+        """
+        filename = make_path(filename)
+
+        if filename.suffix in COMPRESSED_SUFFIXES:
+            warnings.warn(
+                f"{filename} is compressed, its events are loaded at once.",
+                UserWarning,
+            )
+
+        with fits.open(filename, memmap=True) as hdulist:
+            events_hdu = hdulist[self.hdu]
+            n_rows = events_hdu.header["NAXIS2"]
+
+            for start in range(0, n_rows, chunk_size):
+                data = events_hdu.data[start : start + chunk_size]
+                chunk_hdu = fits.BinTableHDU(data=data, header=events_hdu.header)
+                yield self.from_gadf_hdu(chunk_hdu, lazy=True)
+
 
 class EventListWriter:
     """Writer class for EventList."""
@@ -107,10 +159,11 @@ class EventListWriter:
     def _to_gadf_table_hdu(event_list):
         """Convert input event list to a `~astropy.io.fits.BinTableHDU` according gadf."""
         gadf_table = event_list.table.copy()
-        gadf_table.remove_column("TIME")
 
-        reference_time = time_ref_from_dict(gadf_table.meta)
-        gadf_table["TIME"] = (event_list.time - reference_time).to("s")
+        if isinstance(gadf_table["TIME"], Time):
+            gadf_table.remove_column("TIME")
+            reference_time = time_ref_from_dict(gadf_table.meta)
+            gadf_table["TIME"] = (event_list.time - reference_time).to("s")
 
         bin_table = fits.BinTableHDU(gadf_table, name="EVENTS")
 
@@ -123,6 +123,8 @@ class Observation:
                 and self._meta.optional["CREATOR"] == "SASH FITS::EventListWriter"
                 and self._meta.optional["HDUVERS"] == "0.2"
             ):
+                # the background can be shared with other observations
+                bkg = copy.copy(bkg)
                 bkg._fov_alignment = FoVAlignment.REVERSE_LON_RADEC
         except KeyError:
             pass
@@ -189,6 +191,17 @@ class Observation:
             raise TypeError(f"events must be an EventList instance, got: {type(value)}")
         self._events = value
 
+    @property
+    def events_hdu_location(self):
+        """HDU location of the events as a `~gammapy.utils.fits.HDULocation`.
+
+        None if the events are not read from a file, e.g. if they were set in memory.
+        """
+        if "_events" in self.__dict__:
+            return None
+
+        return type(self)._events.hdu_location(self)
+
     @property
     def gti(self):
         """GTI of the observation as a `~gammapy.data.GTI`."""
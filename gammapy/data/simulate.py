@@ -21,7 +21,7 @@ class ObservationsEventsSampler(parallel.ParallelMixin):
     n_jobs : int, optional
         Number of processes to run in parallel.
         Default is one, unless `~gammapy.utils.parallel.N_JOBS_DEFAULT` was modified.
-    parallel_backend : {'multiprocessing', 'ray'}, optional
+    parallel_backend : {'multiprocessing', 'ray', 'threads'}, optional
         Which backend to use for multiprocessing.
         Default is None.
     """
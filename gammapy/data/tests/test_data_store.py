@@ -173,6 +173,46 @@ def test_data_store_from_events(data_store_dc1):
         _ = DataStore.from_events_files([path, path2])
 
 
+@requires_data()
+def test_data_store_from_events_cache(data_store_dc1, tmp_path, monkeypatch):
+    paths = []
+    for obs_id in [110380, 111140]:
+        filename = f"gps_baseline_{obs_id:06d}.fits"
+        path = make_path("$GAMMAPY_DATA/cta-1dc/data/baseline/gps") / filename
+        (tmp_path / filename).write_bytes(path.read_bytes())
+        paths.append(tmp_path / filename)
+
+    cache_filename = tmp_path / "cache.json"
+    data_store = DataStore.from_events_files(paths, cache_filename=cache_filename)
+
+    assert cache_filename.exists()
+    assert_allclose(data_store.obs_table["OBS_ID"], [110380, 111140])
+    assert len(data_store.hdu_table) == 12
+
+    read_paths = []
+    read_events_header = DataStoreMaker.read_events_header
+
+    def read_events_header_counted(events_path):
+        read_paths.append(events_path)
+        return read_events_header(events_path)
+
+    monkeypatch.setattr(
+        DataStoreMaker, "read_events_header", staticmethod(read_events_header_counted)
+    )
+
+    cached = DataStore.from_events_files(paths, cache_filename=cache_filename)
+    assert read_paths == []
+    assert cached.obs_table.colnames == data_store.obs_table.colnames
+    assert_allclose(cached.obs_table["TSTART"], data_store.obs_table["TSTART"])
+    assert_allclose(cached.obs_table["RA_PNT"], data_store.obs_table["RA_PNT"])
+
+    stat = paths[1].stat()
+    os.utime(paths[1], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    DataStore.from_events_files(paths, cache_filename=cache_filename)
+    assert read_paths == [paths[1]]
+
+
 @requires_data()
 def test_read_events_cta_1dc(data_store_dc1):
     path = make_path("$GAMMAPY_DATA/cta-1dc/data/baseline/gps/gps_baseline_110380.fits")
@@ -4,11 +4,13 @@ import numpy as np
 from numpy.testing import assert_allclose
 from astropy import units as u
 from astropy.coordinates import SkyCoord
+from astropy.io import fits
 from astropy.table import QTable, Table
 from astropy.time import Time
 from regions import CircleSkyRegion, RectangleSkyRegion
 from gammapy.data import GTI, EventList, Observation, FixedPointingInfo
 from gammapy.maps import MapAxis, WcsGeom
+from gammapy.utils.scripts import make_path
 from gammapy.utils.testing import mpl_plot_check, requires_data
 
 
@@ -54,6 +56,34 @@ def test_validation(simple_event_table):
         EventList(bad)
 
 
+def test_event_list_time_met():
+    table = Table()
+    table["RA"] = [0.0, 0.0, 0.0, 10.0] * u.deg
+    table["DEC"] = [0.0, 0.9, 10.0, 10.0] * u.deg
+    table["ENERGY"] = [1.0, 1.5, 1.5, 10.0] * u.TeV
+    table["TIME"] = [0.1, 0.5, 1.0, 1.5] * u.s
+    table.meta = {"MJDREFI": 51910, "MJDREFF": 7.428703703703703e-4}
+
+    events = EventList(table)
+    time_ref = Time(51910, 7.428703703703703e-4, format="mjd", scale="tt")
+    assert isinstance(events.time, Time)
+    assert_allclose((events.time - time_ref).to_value("s"), [0.1, 0.5, 1.0, 1.5])
+
+    selected = events.select_time(time_ref + [0.4, 1.2] * u.s)
+    assert_allclose(selected.table["TIME"], [0.5, 1.0])
+
+    selected = events.select_energy([1.2, 10] * u.TeV)
+    assert_allclose(selected.table["ENERGY"], [1.5, 1.5])
+
+    region = CircleSkyRegion(SkyCoord(0, 0, unit="deg"), radius=1 * u.deg)
+    selected = events.select_region(region)
+    assert_allclose(selected.table["DEC"], [0, 0.9])
+
+    table["TIME"] = [0.1, 0.5, 1.0, 1.5] * u.m
+    with pytest.raises(TypeError):
+        EventList(table)
+
+
 @requires_data()
 class TestEventListBase:
     def setup_class(self):
@@ -130,6 +160,52 @@ class TestEventListBase:
             obs = Observation(events=self.events, gti=gti.table, pointing=pointing)
             obs.write("test.fits", overwrite=True)
 
+    def test_read_lazy(self):
+        events = EventList.read(
+            "$GAMMAPY_DATA/hess-dl3-dr1/data/hess_dl3_dr1_obs_id_020136.fits.gz",
+            lazy=True,
+        )
+        assert not isinstance(events.table["TIME"], Time)
+        assert_allclose(events.time.mjd, self.events.time.mjd)
+
+        time_interval = self.events.time[[10, 100]]
+        selected = events.select_time(time_interval)
+        assert len(selected.table) == len(self.events.select_time(time_interval).table)
+
+        region = CircleSkyRegion(self.events.radec[0], radius=0.5 * u.deg)
+        selected = events.select_region(region)
+        assert len(selected.table) == len(self.events.select_region(region).table)
+
+        hdu = events.to_table_hdu()
+        assert_allclose(hdu.data["TIME"], events.table["TIME"])
+
+    def test_read_lazy_uncompressed(self, tmp_path):
+        filename = tmp_path / "events.fits"
+        path = "$GAMMAPY_DATA/hess-dl3-dr1/data/hess_dl3_dr1_obs_id_020136.fits.gz"
+
+        with fits.open(make_path(path)) as hdulist:
+            hdulist.writeto(filename)
+
+        expected = EventList.read(filename)
+        events = EventList.read(filename, lazy=True)
+
+        assert not isinstance(events.table["TIME"], Time)
+        assert len(events.table) == len(expected.table)
+        assert_allclose(events.time.mjd, expected.time.mjd)
+
+        time_interval = expected.time[[10, 100]]
+        selected = events.select_time(time_interval)
+        assert_allclose(selected.time.mjd, expected.select_time(time_interval).time.mjd)
+
+        region = CircleSkyRegion(expected.radec[0], radius=0.5 * u.deg)
+        selected = events.select_region(region)
+        assert_allclose(selected.time.mjd, expected.select_region(region).time.mjd)
+
+        selected = events.select_energy((1, 10) * u.TeV)
+        assert_allclose(
+            selected.time.mjd, expected.select_energy((1, 10) * u.TeV).time.mjd
+        )
+
     def test_eventlist_hdu_creation_metadata(self):
         hdu = self.events.to_table_hdu(format="gadf")
         assert "CREATOR" in hdu.header
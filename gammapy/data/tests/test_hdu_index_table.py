@@ -1,6 +1,7 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 from pathlib import Path
 import pytest
+import numpy as np
 from gammapy.data import HDUIndexTable
 from gammapy.utils.scripts import make_path
 from gammapy.utils.testing import requires_data
@@ -48,6 +49,42 @@ def test_hdu_index_table(hdu_index_table):
     assert hdu_index_table.summary().startswith("HDU index table")
 
 
+def test_hdu_index_table_row_idx():
+    n_obs = 1000
+    hdu_types = ["events", "gti", "aeff", "edisp", "psf", "bkg", "rad_max"]
+    obs_id = np.repeat(np.arange(n_obs)[::-1], len(hdu_types))
+    hdu_type = np.tile([f"{_:<10}" for _ in hdu_types], n_obs)
+
+    table = HDUIndexTable(
+        {
+            "OBS_ID": obs_id,
+            "HDU_TYPE": hdu_type,
+            "HDU_CLASS": hdu_type,
+            "FILE_DIR": np.full(len(obs_id), "data"),
+            "FILE_NAME": [f"obs_{_}.fits" for _ in obs_id],
+            "HDU_NAME": np.char.upper(hdu_type),
+        }
+    )
+
+    idx = table.row_idx(obs_id=998, hdu_type="psf")
+    assert idx == [11]
+
+    idx = table.row_idx(obs_id=998, hdu_class="bkg")
+    assert idx == [12]
+
+    idx = table.row_idx(obs_id=998)
+    assert idx == list(range(7, 14))
+
+    location = table.hdu_location(obs_id=3, hdu_type="edisp")
+    assert location.file_name == "obs_3.fits"
+    assert location.hdu_name == "EDISP"
+
+    assert table.row_idx(obs_id=n_obs, hdu_type="events") == []
+
+    with pytest.raises(IndexError):
+        table.hdu_location(obs_id=n_obs, hdu_type="events")
+
+
 @requires_data()
 def test_hdu_index_table_hd_hap(capfd):
     """Test HESS HAP-HD data access."""
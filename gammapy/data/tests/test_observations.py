@@ -53,6 +53,19 @@ def test_observation(data_store):
     assert_skycoord_allclose(obs.target_radec, c)
 
 
+@requires_data()
+def test_observation_events_hdu_location(data_store):
+    obs = data_store.obs(23523)
+
+    hdu_location = obs.events_hdu_location
+    assert isinstance(hdu_location, HDULocation)
+    assert hdu_location.hdu_class == "events"
+    assert hdu_location.path().name == "hess_dl3_dr1_obs_id_023523.fits.gz"
+
+    obs.events = obs.events.select_energy([1, 10] * u.TeV)
+    assert obs.events_hdu_location is None
+
+
 @requires_data()
 def test_observation_get_fov_frame(data_store):
     """Test Observation class"""
@@ -51,6 +51,10 @@ class DatasetsActor(Datasets):
         # trigger actors auto_init_wrapper (so overhead so appears on init)
         self.name
 
+    def _init_copy(self, datasets):
+        """Create new datasets actor, the parallel options are not used."""
+        return self.__class__(datasets)
+
     def insert(self, idx, dataset):
         if isinstance(dataset, Dataset):
             if dataset.name in self.names:
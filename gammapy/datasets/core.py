@@ -4,9 +4,11 @@ import collections.abc
 import copy
 import html
 import logging
+import operator
 import numpy as np
 from astropy import units as u
 from astropy.table import Table, vstack
+import gammapy.utils.parallel as parallel
 from gammapy.data import GTI
 from gammapy.modeling.models import DatasetModels, Models
 from gammapy.utils.scripts import make_name, make_path, read_yaml, to_yaml, write_yaml
@@ -91,6 +93,14 @@ class Dataset(abc.ABC):
         """Statistic array, one value per data point."""
         return self._fit_statistic.stat_array_dataset(self)
 
+    def _has_stat_sum_gradient(self, parameters):
+        """Whether the statistic derivatives can be computed analytically."""
+        return False
+
+    def _stat_sum_gradient(self, parameters):
+        """Statistic derivatives wrt the parameter values, without the priors."""
+        return self._fit_statistic.stat_sum_gradient_dataset(self, parameters)
+
     def copy(self, name=None):
         """Deep copy.
 
@@ -127,16 +137,35 @@ class Dataset(abc.ABC):
         return residuals
 
 
-class Datasets(collections.abc.MutableSequence):
+class Datasets(collections.abc.MutableSequence, parallel.ParallelMixin):
     """Container class that holds a list of datasets.
 
     Parameters
     ----------
     datasets : `Dataset` or list of `Dataset`
         Datasets.
+    n_jobs : int, optional
+        Number of threads used to evaluate the statistic of the datasets in
+        parallel. Only used with the "threads" parallel backend.
+        Default is None, which uses `~gammapy.utils.parallel.N_JOBS_DEFAULT`.
+    parallel_backend : {"multiprocessing", "ray", "threads"}, optional
+        Parallel backend. The datasets are evaluated in parallel only with the
+        "threads" backend, in which case the predicted counts of each dataset
+        are computed in a separate thread at each likelihood evaluation.
+        Default is None, which uses `~gammapy.utils.parallel.BACKEND_DEFAULT`.
+
+    Examples
+    --------
+    ::
+
+        datasets = Datasets([dataset_1, dataset_2], n_jobs=2, parallel_backend="threads")
+        result = Fit().run(datasets)
     """
 
-    def __init__(self, datasets=None):
+    _n_jobs = None
+    _parallel_backend = None
+
+    def __init__(self, datasets=None, n_jobs=None, parallel_backend=None):
         if datasets is None:
             datasets = []
 
@@ -155,6 +184,8 @@ class Datasets(collections.abc.MutableSequence):
 
         self._datasets = datasets
         self._covariance = None
+        self.n_jobs = n_jobs
+        self.parallel_backend = parallel_backend
 
     @property
     def parameters(self):
@@ -247,19 +278,113 @@ class Datasets(collections.abc.MutableSequence):
         if self.models is not None:
             prior_stat_sum = self.models.parameters.prior_stat_sum()
 
-        stat_sum = 0.0
-        for dataset in self:
-            stat_sum += dataset.stat_sum()
-
+        stat_sum = self._stat_sum_datasets(method="stat_sum")
         return stat_sum + prior_stat_sum
 
     def _stat_sum_likelihood(self):
         """Total statistic given the current model parameters without the priors."""
-        stat_sum = 0
+        return self._stat_sum_datasets(method="_stat_sum_likelihood")
+
+    @property
+    def has_stat_sum_gradient(self):
+        """Whether the derivatives of the joint statistic can be computed analytically.
+
+        This requires all datasets to use the Cash statistic, all free parameters
+        to be parameters of spectral models defining ``evaluate_gradient`` and no
+        priors on the free parameters.
+        """
+        parameters = self.parameters.free_parameters
+
+        if any(par.prior is not None for par in parameters):
+            return False
+
+        return all(dataset._has_stat_sum_gradient(parameters) for dataset in self)
+
+    def stat_sum_gradient(self):
+        """Compute the derivatives of the joint statistic.
+
+        See `has_stat_sum_gradient` for the conditions to compute them analytically.
+
+        Returns
+        -------
+        gradient : `~numpy.ndarray`
+            Derivatives with respect to the values of the free parameters.
+        """
+        parameters = self.parameters.free_parameters
+        method = operator.methodcaller("_stat_sum_gradient", parameters)
+        n_threads = self._n_threads
+
+        if n_threads > 1:
+            pool = parallel.get_thread_pool(processes=n_threads)
+            gradients = pool.map(method, self._datasets)
+        else:
+            gradients = [method(dataset) for dataset in self]
+
+        return np.sum(gradients, axis=0)
+
+    @property
+    def _n_threads(self):
+        """Number of threads used to evaluate the statistic of the datasets."""
+        backend = parallel.ParallelBackendEnum.from_str(self.parallel_backend)
+
+        if backend != parallel.ParallelBackendEnum.threads or len(self) < 2:
+            return 1
+
+        if parallel.is_worker_thread():
+            # avoid starting nested thread pools from worker threads
+            return 1
+
+        return self.n_jobs
+
+    def _stat_sum_datasets(self, method):
+        """Sum statistic over datasets.
+
+        With the "threads" parallel backend and ``n_jobs > 1``, the statistic of
+        each dataset is evaluated in a thread pool. Otherwise the datasets relying
+        on the default `Dataset` statistic computation are grouped by fit statistic
+        and evaluated together with
+        `~gammapy.stats.fit_statistics.FitStatistic.stat_sum_datasets`, and the
+        other datasets are evaluated one by one.
+
+        Parameters
+        ----------
+        method : {"stat_sum", "_stat_sum_likelihood"}
+            Dataset method used for datasets evaluated one by one.
+
+        Returns
+        -------
+        stat_sum : float
+            Summed statistic.
+        """
+        n_threads = self._n_threads
+
+        if n_threads > 1:
+            pool = parallel.get_thread_pool(processes=n_threads)
+            return np.sum(pool.map(operator.methodcaller(method), self._datasets))
+
+        stat_sum = 0.0
+        groups = {}
+
         for dataset in self:
-            stat_sum += dataset._stat_sum_likelihood()
+            if getattr(type(dataset), method, None) is getattr(Dataset, method):
+                groups.setdefault(dataset._fit_statistic, []).append(dataset)
+            else:
+                stat_sum += getattr(dataset, method)()
+
+        for fit_statistic, datasets in groups.items():
+            if len(datasets) == 1:
+                stat_sum += getattr(datasets[0], method)()
+            else:
+                stat_sum += fit_statistic.stat_sum_datasets(datasets)
+
         return stat_sum
 
+    def _init_copy(self, datasets):
+        """Create new datasets with the same parallel options."""
+        return self.__class__(
+            datasets, n_jobs=self._n_jobs, parallel_backend=self._parallel_backend
+        )
+
     def select_time(self, time_min, time_max, atol="1e-6 s"):
         """Select datasets in a given time interval.
 
@@ -287,7 +412,7 @@ class Datasets(collections.abc.MutableSequence):
             if t_start >= (time_min - atol) and t_stop <= (time_max + atol):
                 datasets.append(dataset)
 
-        return self.__class__(datasets)
+        return self._init_copy(datasets)
 
     def slice_by_energy(self, energy_min, energy_max):
         """Select and slice datasets in energy range.
@@ -323,7 +448,7 @@ class Datasets(collections.abc.MutableSequence):
 
             datasets.append(dataset_sliced)
 
-        return self.__class__(datasets=datasets)
+        return self._init_copy(datasets)
 
     def to_spectrum_datasets(self, region):
         """Extract spectrum datasets for the given region.
@@ -341,7 +466,7 @@ class Datasets(collections.abc.MutableSequence):
         datasets : `Datasets`
             List of `~gammapy.datasets.SpectrumDataset`.
         """
-        datasets = Datasets()
+        datasets = []
 
         for dataset in self:
             spectrum_dataset = dataset.to_spectrum_dataset(
@@ -349,11 +474,17 @@ class Datasets(collections.abc.MutableSequence):
             )
             datasets.append(spectrum_dataset)
 
-        return datasets
+        return Datasets(
+            datasets, n_jobs=self._n_jobs, parallel_backend=self._parallel_backend
+        )
 
     def _to_asimov_datasets(self):
         """Create Asimov datasets from the current models."""
-        return Datasets([d._to_asimov_dataset() for d in self])
+        return Datasets(
+            [d._to_asimov_dataset() for d in self],
+            n_jobs=self._n_jobs,
+            parallel_backend=self._parallel_backend,
+        )
 
     @property
     # TODO: make this a method to support different methods?
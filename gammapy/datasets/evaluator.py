@@ -1,5 +1,6 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import html
+import itertools
 import logging
 import numpy as np
 import astropy.units as u
@@ -10,11 +11,30 @@ import matplotlib.pyplot as plt
 from gammapy.irf import EDispKernel, PSFKernel
 from gammapy.maps import HpxNDMap, Map, RegionNDMap, WcsNDMap
 from gammapy.modeling.models import PointSpatialModel, TemplateNPredModel
+from gammapy.utils.cache import LRUCache
 from .utils import apply_edisp
 
 PSF_MAX_RADIUS = None
 PSF_CONTAINMENT = 0.999
 CUTOUT_MARGIN = 0.1 * u.deg
+CACHE_MAX_BYTES = 32 * 1024**2
+RESPONSE_MAX_BYTES = 16 * 1024**2
+RESPONSE_MIN_EVALUATIONS = 3
+
+EVALUATOR_CACHE = LRUCache(max_bytes=CACHE_MAX_BYTES)
+"""Process-wide cache of the predicted counts, spatial fluxes and responses of
+`MapEvaluator`.
+
+The entries of all evaluators share a single memory budget, so that the memory
+used does not grow with the number of models. The default budget is small, as the
+cache exists in every process, including the multiprocessing workers. It can be
+increased for fits of many large models by setting ``max_bytes``. The hit and miss
+statistics are given by ``EVALUATOR_CACHE.info``, the cache is disabled by setting
+``max_bytes`` to 0.
+"""
+
+# identifies the entries of an evaluator in `EVALUATOR_CACHE`
+_EVALUATOR_CACHE_IDS = itertools.count()
 
 log = logging.getLogger(__name__)
 
@@ -47,7 +67,8 @@ class MapEvaluator:
         The "global" evaluation mode evaluates the model components on the full map.
         This mode is recommended for global optimization algorithms.
     use_cache : bool
-        Use npred caching.
+        Use npred caching. The predicted counts and spatial flux are kept in
+        ``EVALUATOR_CACHE``, keyed on the values of the model parameters.
     """
 
     def __init__(
@@ -88,10 +109,22 @@ class MapEvaluator:
 
         # define cached computations
         self._cached_parameter_values = None
+        self._cached_parameter_versions = None
         self._cached_parameter_values_previous = None
         self._cached_parameter_values_spatial = None
+        self._cached_parameter_versions_spatial = None
         self._cached_position = (0, 0)
         self._computation_cache = None
+        self._cache_id = next(_EVALUATOR_CACHE_IDS)
+        self._response_key = None
+        self._response_evaluations = 0
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        # parameter versions are only unique within a process
+        self._cached_parameter_versions = None
+        self._cached_parameter_versions_spatial = None
+        self._cache_id = next(_EVALUATOR_CACHE_IDS)
 
     def _repr_html_(self):
         try:
@@ -105,6 +138,15 @@ class MapEvaluator:
         del self._compute_flux_spatial
         self._computation_cache = None
         self._cached_parameter_previous = None
+        # the previous entries are not reachable anymore and are discarded
+        # from the cache once they are the least recently used ones
+        self._cache_id = next(_EVALUATOR_CACHE_IDS)
+        self._response_key = None
+        self._response_evaluations = 0
+
+    def _cache_key(self, name, parameters):
+        """Cache key from the parameter values."""
+        return (self._cache_id, name, *(par.value for par in parameters))
 
     @property
     def geom(self):
@@ -267,13 +309,22 @@ class MapEvaluator:
     def compute_flux_psf_convolved(self, *arg):
         """Compute PSF convolved and temporal model corrected flux."""
         value = self.compute_flux_spectral()
+        return self._apply_flux_spatial_temporal(value)
 
+    def _apply_flux_spatial(self, value):
+        """Apply PSF convolved spatial flux to a spectral flux."""
         if self.model.spatial_model:
             if self.psf_containment is not None:
                 value = value * self.psf_containment
             else:
                 value = value * self.compute_flux_spatial()
 
+        return value
+
+    def _apply_flux_spatial_temporal(self, value):
+        """Apply PSF convolved spatial flux and temporal norm to a spectral flux."""
+        value = self._apply_flux_spatial(value)
+
         if self.model.temporal_model:
             value *= self.compute_temporal_norm()
 
@@ -294,6 +345,20 @@ class MapEvaluator:
         value : `~astropy.units.Quantity`
             PSF-corrected, integrated flux over a given region.
         """
+        if self.use_cache:
+            key = self._cache_key("flux_spatial", self.model.spatial_model.parameters)
+            value = EVALUATOR_CACHE.get(key)
+
+            if value is None:
+                value = self._evaluate_flux_spatial()
+                EVALUATOR_CACHE.put(key, value)
+
+            return value
+
+        return self._evaluate_flux_spatial()
+
+    def _evaluate_flux_spatial(self):
+        """Compute spatial flux without caching."""
         if self.geom.is_region:
             # We don't estimate spatial contributions if no psf are defined
             if self.geom.region is None or self.psf is None:
@@ -331,6 +396,9 @@ class MapEvaluator:
             energy[:-1],
             energy[1:],
         )
+        return self._reshape_flux_spectral(value)
+
+    def _reshape_flux_spectral(self, value):
         if self.geom.is_hpx:
             return value.reshape((-1, 1))
         else:
@@ -379,23 +447,194 @@ class MapEvaluator:
     @lazyproperty
     def _compute_npred(self):
         """Compute npred."""
+        if self.use_cache:
+            key = self._cache_key("npred", self.model.parameters)
+            npred = EVALUATOR_CACHE.get(key)
+
+            if npred is None:
+                npred = self._evaluate_npred()
+                EVALUATOR_CACHE.put(key, npred)
+
+            return npred
+
+        return self._evaluate_npred()
+
+    def _evaluate_npred(self):
+        """Compute npred, rescaling the last computation if only norms changed."""
+        norm = self._norm_value
+
+        if norm == 0 and not isinstance(self.model, TemplateNPredModel):
+            # keep the last computation, it can be rescaled once the norm is non zero
+            return Map.from_geom(self._geom_reco, data=0)
+
+        if self.use_cache and norm != 0 and self.parameter_norm_only_changed:
+            return self._computation_cache * self.renorm()
+
+        response = self._get_response() if self.use_response else None
+
         if isinstance(self.model, TemplateNPredModel):
             npred = self.model.evaluate()
+        elif response is not None:
+            npred = self._npred_from_response(*response)
         else:
-            if (
-                self._norm_idx is not None
-                and self.model.parameters.value[self._norm_idx] == 0
-            ):
-                npred = Map.from_geom(self._geom_reco, data=0)
-            elif not self.parameter_norm_only_changed or not self.use_cache:
-                for method in self.methods_sequence:
-                    values = method(self._computation_cache)
-                    self._computation_cache = values
-                npred = self._computation_cache
-            else:
-                npred = self._computation_cache * self.renorm()
+            npred = None
+            for method in self.methods_sequence:
+                npred = method(npred)
+
+        if norm != 0:
+            self._computation_cache = npred
+            self._cached_parameter_values_previous = self.model.parameters.value
+
         return npred
 
+    @property
+    def use_response(self):
+        """Whether npred is computed from the precomputed spectrum independent response.
+
+        This is the case for models without free spatial parameters, if the
+        size of the response is below ``RESPONSE_MAX_BYTES`` and fits in
+        ``EVALUATOR_CACHE``. The response is only computed once npred was
+        evaluated ``RESPONSE_MIN_EVALUATIONS`` times, e.g. during a fit.
+        """
+        model = self.model
+
+        if isinstance(model, TemplateNPredModel) or not model.apply_irf["exposure"]:
+            return False
+
+        if model.spatial_model and model.spatial_model.parameters.free_parameters:
+            return False
+
+        size = np.prod(self.geom.data_shape)
+
+        if self.apply_psf_after_edisp:
+            if model.temporal_model:
+                return False
+            size *= self._geom_reco.axes["energy"].nbin
+
+        max_bytes = min(RESPONSE_MAX_BYTES, EVALUATOR_CACHE.max_bytes)
+        return size * np.dtype(float).itemsize <= max_bytes
+
+    def _get_response(self, min_evaluations=RESPONSE_MIN_EVALUATIONS):
+        """Get the response from the cache, or compute it.
+
+        The response is only computed once it was requested ``min_evaluations``
+        times for the same spatial parameter values, so that single evaluations
+        do not pay for it.
+
+        Parameters
+        ----------
+        min_evaluations : int, optional
+            Number of requests before the response is computed.
+            Default is ``RESPONSE_MIN_EVALUATIONS``.
+
+        Returns
+        -------
+        response : tuple or None
+            Response and geometry, see `_compute_response`. None if the
+            response is not computed yet.
+        """
+        if self.model.spatial_model:
+            key = self._cache_key("response", self.model.spatial_model.parameters)
+        else:
+            key = (self._cache_id, "response")
+
+        response = EVALUATOR_CACHE.get(key)
+
+        if response is not None:
+            return response
+
+        if self._response_key != key:
+            self._response_key = key
+            self._response_evaluations = 0
+
+        self._response_evaluations += 1
+
+        if self._response_evaluations < min_evaluations:
+            return None
+
+        response = self._compute_response()
+        EVALUATOR_CACHE.put(key, response)
+        return response
+
+    def _compute_response(self):
+        """Compute the response of the model to a unit spectral flux.
+
+        Returns
+        -------
+        response : `~astropy.units.Quantity`
+            Response, with the true energy as first axis. If the PSF is applied
+            after the energy dispersion, the second axis is the reconstructed
+            energy and the response includes the energy dispersion and PSF.
+        geom : `~gammapy.maps.Geom`
+            Geometry of the predicted counts.
+        """
+        if not self.apply_psf_after_edisp:
+            response = self._apply_flux_spatial(self.exposure.quantity)
+            response = response * np.ones(self.geom.data_shape)
+            edisp = self._edisp_response
+            energy_axis = edisp.axes["energy"].copy(name="energy")
+            geom = self.geom.to_image().to_cube(axes=[energy_axis])
+            return response, geom
+
+        response = self.exposure.quantity
+
+        if self.model.spatial_model:
+            spatial = self.model.spatial_model.integrate_geom(self.geom)
+            response = response * spatial.quantity
+
+        values = []
+
+        for idx in range(self.geom.axes["energy_true"].nbin):
+            data = np.zeros(self.geom.data_shape)
+            data[idx] = response.value[idx]
+            npred = Map.from_geom(self.geom, data=data)
+
+            for method in self.methods_sequence[2:]:
+                npred = method(npred)
+
+            values.append(npred.data)
+
+        return u.Quantity(values, response.unit), npred.geom
+
+    @property
+    def _edisp_response(self):
+        """Energy dispersion kernel applied by `apply_edisp`."""
+        if self.model.apply_irf["edisp"] and self.edisp:
+            return self.edisp
+        else:
+            return self._edisp_diagonal
+
+    def compute_npred_response(self):
+        """Compute npred by contracting the spectral flux with the precomputed response.
+
+        The response is kept in ``EVALUATOR_CACHE``. It is recomputed when the
+        IRFs are updated or the spatial parameter values change.
+
+        Returns
+        -------
+        npred : `~gammapy.maps.Map`
+            Predicted counts on the map (in reconstructed energy bins).
+        """
+        return self._npred_from_response(*self._get_response(min_evaluations=0))
+
+    def _npred_from_response(self, response, geom):
+        """Compute npred from the response, see `compute_npred_response`."""
+        energy = self.geom.axes["energy_true"].edges
+        flux = self.model.spectral_model.integral(energy[:-1], energy[1:])
+
+        if self.model.temporal_model:
+            flux = flux * self.compute_temporal_norm()
+
+        flux = (flux * response.unit).to_value("")
+
+        if self.apply_psf_after_edisp:
+            data = np.tensordot(flux, response.value, axes=(0, 0))
+        else:
+            matrix = flux[:, np.newaxis] * self._edisp_response.pdf_matrix
+            data = np.tensordot(matrix, response.value, axes=(0, 0))
+
+        return Map.from_geom(geom, data=data, unit="")
+
     @property
     def apply_psf_after_edisp(self):
         return (
@@ -415,12 +654,77 @@ class MapEvaluator:
 
         return self._compute_npred
 
+    @property
+    def has_npred_gradient(self):
+        """Whether the derivatives of npred can be computed analytically.
+
+        This is the case when all free parameters of the model belong to a
+        spectral model defining ``evaluate_gradient`` and the PSF is applied
+        before the energy dispersion.
+        """
+        if isinstance(self.model, TemplateNPredModel) or self.apply_psf_after_edisp:
+            return False
+
+        spectral_model = self.model.spectral_model
+
+        if not hasattr(spectral_model, "evaluate_gradient"):
+            return False
+
+        for par in self.model.parameters.free_parameters:
+            if par not in spectral_model.parameters:
+                return False
+
+        return True
+
+    def compute_npred_gradient(self):
+        """Evaluate the derivatives of the model predicted counts.
+
+        The derivatives of the spectral model integral are propagated through
+        the same IRF chain as the flux, which is linear in the spectral flux.
+        Only valid if `has_npred_gradient` is True.
+
+        Returns
+        -------
+        gradient : list of `~gammapy.maps.Map` or None
+            Derivatives of the predicted counts with respect to the values of
+            the spectral model parameters, in the order of the spectral model
+            parameters. None for frozen parameters.
+        """
+        spectral_model = self.model.spectral_model
+        energy = self.geom.axes["energy_true"].edges
+        values = spectral_model.integral_gradient(energy[:-1], energy[1:])
+
+        gradient = []
+
+        for par, value in zip(spectral_model.parameters, values):
+            if par.frozen:
+                gradient.append(None)
+                continue
+
+            value = self._reshape_flux_spectral(value * par.unit)
+            npred = self._apply_flux_spatial_temporal(value)
+
+            for method in self.methods_sequence[1:]:
+                npred = method(npred)
+
+            gradient.append(npred)
+
+        return gradient
+
     @property
     def parameters_changed(self):
         """Parameters changed."""
-        values = self.model.parameters.value
+        parameters = self.model.parameters
+        versions = parameters.versions
+
+        if versions == self._cached_parameter_versions:
+            return False
+
+        values = parameters.value
         changed = ~np.all(self._cached_parameter_values == values)
 
+        self._cached_parameter_versions = versions
+
         if changed:
             self._cached_parameter_values = values
 
@@ -428,17 +732,13 @@ class MapEvaluator:
 
     @property
     def parameter_norm_only_changed(self):
-        """Only norm parameter changed."""
-        norm_only_changed = False
-        idx = self._norm_idx
-        values = self.model.parameters.value
-        if idx is not None and self._computation_cache is not None:
-            changed = self._cached_parameter_values_previous != values
-            norm_only_changed = np.count_nonzero(changed) == 1 and changed[idx]
-
-        if not norm_only_changed:
-            self._cached_parameter_values_previous = values
-        return norm_only_changed
+        """Only parameters entering npred linearly changed since last computation."""
+        if self._computation_cache is None:
+            return False
+
+        changed = self._cached_parameter_values_previous != self.model.parameters.value
+        changed[self._norm_idx] = False
+        return not np.any(changed)
 
     def parameters_spatial_changed(self, reset=True):
         """Parameters changed.
@@ -453,9 +753,18 @@ class MapEvaluator:
         changed : bool
             Whether spatial parameters changed.
         """
-        values = self.model.spatial_model.parameters.value
+        parameters = self.model.spatial_model.parameters
+        versions = parameters.versions
+
+        if versions == self._cached_parameter_versions_spatial:
+            return False
+
+        values = parameters.value
         changed = ~np.all(self._cached_parameter_values_spatial == values)
 
+        if not changed or reset:
+            self._cached_parameter_versions_spatial = versions
+
         if changed and reset:
             self._cached_parameter_values_spatial = values
 
@@ -481,18 +790,23 @@ class MapEvaluator:
 
     @lazyproperty
     def _norm_idx(self):
-        """Norm index."""
-        names = self.model.parameters.names
-        ind = [idx for idx, name in enumerate(names) if name in ["norm", "amplitude"]]
-        if len(ind) == 1:
-            return ind[0]
-        else:
-            return None
+        """Indices of the parameters entering npred linearly."""
+        if not hasattr(self.model, "norm_parameters"):
+            return []
+
+        norm_parameters = self.model.norm_parameters
+        parameters = self.model.parameters
+        return [idx for idx, par in enumerate(parameters) if par in norm_parameters]
+
+    @property
+    def _norm_value(self):
+        """Product of the parameters entering npred linearly."""
+        return np.prod(self.model.parameters.value[self._norm_idx])
 
     def renorm(self):
-        value = self.model.parameters.value[self._norm_idx]
-        value_cached = self._cached_parameter_values_previous[self._norm_idx]
-        return value / value_cached
+        """Ratio of the current and cached product of the norm parameters."""
+        value_cached = np.prod(self._cached_parameter_values_previous[self._norm_idx])
+        return self._norm_value / value_cached
 
     @lazyproperty
     def methods_sequence(self):
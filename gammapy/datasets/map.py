@@ -534,6 +534,7 @@ class MapDataset(Dataset):
         self.background = background
         self._background_cached = None
         self._background_parameters_cached = None
+        self._background_parameters_versions = None
 
         self.mask_fit = mask_fit
 
@@ -558,6 +559,11 @@ class MapDataset(Dataset):
 
         self.stat_type = stat_type
 
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        # parameter versions are only unique within a process
+        self._background_parameters_versions = None
+
     @property
     def _psf_kernel(self):
         """Precompute PSFkernel if there is only one spatial bin in the PSFmap."""
@@ -816,9 +822,17 @@ class MapDataset(Dataset):
 
     @property
     def _background_parameters_changed(self):
-        values = self.background_model.parameters.value
+        parameters = self.background_model.parameters
+        versions = parameters.versions
+
+        if versions == self._background_parameters_versions:
+            return False
+
+        values = parameters.value
         changed = ~np.all(self._background_parameters_cached == values)
 
+        self._background_parameters_versions = versions
+
         if changed:
             self._background_parameters_cached = values
         return changed
@@ -881,6 +895,108 @@ class MapDataset(Dataset):
 
         return npred_total
 
+    def _has_stat_sum_gradient(self, parameters):
+        """Whether the statistic derivatives can be computed analytically.
+
+        Parameters
+        ----------
+        parameters : `~gammapy.modeling.Parameters`
+            Parameters with respect to which the derivatives are computed.
+        """
+        if not self._fit_statistic.has_gradient:
+            return False
+
+        if self.models is None:
+            return True
+
+        # make sure the evaluators are up to date
+        self.npred_signal()
+
+        for evaluator in self.evaluators.values():
+            free_parameters = evaluator.model.parameters.free_parameters
+            if free_parameters and not evaluator.has_npred_gradient:
+                return False
+
+        background_model = self.background_model
+
+        if background_model and background_model.parameters.free_parameters:
+            spectral_model = background_model.spectral_model
+            if background_model.spatial_model is not None:
+                return False
+            if not hasattr(spectral_model, "evaluate_gradient"):
+                return False
+
+        return True
+
+    def _npred_gradient(self, parameters):
+        """Derivatives of the total predicted counts wrt the parameter values.
+
+        Parameters
+        ----------
+        parameters : `~gammapy.modeling.Parameters`
+            Parameters with respect to which the derivatives are computed.
+
+        Returns
+        -------
+        gradient : list of `~gammapy.maps.Map` or None
+            Derivatives of the predicted counts, one per parameter. None if the
+            predicted counts do not depend on the parameter.
+        """
+        gradient = [None] * len(parameters)
+
+        for evaluator in self.evaluators.values():
+            spectral_parameters = evaluator.model.spectral_model.parameters
+
+            # skip models with no free parameters among the requested ones
+            if not any(par in parameters for par in spectral_parameters):
+                continue
+
+            if evaluator.needs_update:
+                evaluator.update(
+                    self.exposure,
+                    self.psf,
+                    self.edisp,
+                    self._geom,
+                    self.mask_image,
+                )
+
+            if not evaluator.contributes:
+                continue
+
+            values = evaluator.compute_npred_gradient()
+
+            for par, npred in zip(spectral_parameters, values):
+                if npred is None or par not in parameters:
+                    continue
+
+                idx = parameters.index(par)
+                if gradient[idx] is None:
+                    gradient[idx] = Map.from_geom(self._geom, dtype=float)
+                gradient[idx].stack(npred)
+
+        background_model = self.background_model
+
+        if background_model and self.background:
+            spectral_model = background_model.spectral_model
+            energy = self.background.geom.get_coord(sparse=True)["energy"]
+
+            for par, value in zip(
+                spectral_model.parameters, spectral_model.gradient(energy)
+            ):
+                if par.frozen or par not in parameters:
+                    continue
+
+                data = self.background.data * (value * par.unit).to_value("")
+                npred = Map.from_geom(self._geom, data=data)
+
+                idx = parameters.index(par)
+                if gradient[idx] is None:
+                    gradient[idx] = npred
+                else:
+                    gradient[idx].stack(npred)
+
+        return gradient
+
     @classmethod
     def from_geoms(
         cls,
@@ -3,13 +3,21 @@ import os
 import pytest
 import numpy as np
 from numpy.testing import assert_allclose, assert_equal
+import astropy.units as u
 from astropy.coordinates import SkyCoord
-from gammapy.datasets import Datasets, SpectrumDatasetOnOff
+from gammapy.datasets import Datasets, SpectrumDataset, SpectrumDatasetOnOff
 from gammapy.datasets.tests.test_map import get_map_dataset
-from gammapy.maps import MapAxis, WcsGeom
+from gammapy.maps import MapAxis, RegionGeom, WcsGeom
 from gammapy.modeling import Fit
-from gammapy.modeling.models import FoVBackgroundModel, Models, SkyModel
+from gammapy.modeling.models import (
+    FoVBackgroundModel,
+    GaussianPrior,
+    Models,
+    PowerLawSpectralModel,
+    SkyModel,
+)
 from gammapy.modeling.tests.test_fit import MyDataset
+from gammapy.stats.fit_statistics import PACKED_DATASETS_CACHE
 from gammapy.utils.testing import requires_data
 
 
@@ -35,6 +43,181 @@ def test_datasets_likelihood(datasets):
     assert_allclose(likelihood, 14472200.0002)
 
 
+def get_spectrum_datasets(n_datasets=3, on_off=False):
+    energy_axis = MapAxis.from_energy_bounds("0.1 TeV", "10 TeV", nbin=10)
+    geom = RegionGeom.create("icrs;circle(0, 0, 0.1)", axes=[energy_axis])
+    model = SkyModel(spectral_model=PowerLawSpectralModel(), name="source")
+
+    datasets = Datasets()
+
+    for idx in range(n_datasets):
+        dataset = SpectrumDataset.create(geom=geom, name=f"dataset-{idx}")
+        dataset.exposure.data += 1e10
+        dataset.background.data += 2
+        dataset.mask_safe.data[...] = True
+        dataset.mask_safe.data[idx] = False
+        dataset.models = model
+        dataset.fake(random_state=idx)
+
+        if on_off:
+            dataset = SpectrumDatasetOnOff.from_spectrum_dataset(
+                dataset=dataset, acceptance=1, acceptance_off=5
+            )
+            dataset.fake(npred_background=dataset.npred_background(), random_state=idx)
+            dataset.models = model
+
+        datasets.append(dataset)
+
+    return datasets
+
+
+@pytest.mark.parametrize("on_off", [False, True])
+def test_datasets_stat_sum_batched(on_off):
+    datasets = get_spectrum_datasets(on_off=on_off)
+
+    expected = np.sum([dataset.stat_sum() for dataset in datasets])
+    assert_allclose(datasets.stat_sum(), expected, rtol=1e-12)
+    assert_allclose(datasets._stat_sum_likelihood(), expected, rtol=1e-12)
+
+
+@pytest.mark.parametrize("on_off", [False, True])
+def test_datasets_stat_sum_batched_cache(on_off):
+    datasets = get_spectrum_datasets(on_off=on_off)
+    PACKED_DATASETS_CACHE.clear()
+
+    datasets.stat_sum()
+    packed = PACKED_DATASETS_CACHE._data.copy()
+    assert len(packed) == 1
+
+    # the counts and masks are packed once, the model is evaluated again
+    datasets.models.parameters["index"].value = 2.5
+    expected = np.sum([dataset.stat_sum() for dataset in datasets])
+    assert_allclose(datasets.stat_sum(), expected, rtol=1e-12)
+    assert PACKED_DATASETS_CACHE._data.keys() == packed.keys()
+    assert list(PACKED_DATASETS_CACHE._data.values()) == list(packed.values())
+
+    # replacing the counts or the masks invalidates the packed data
+    datasets[0].counts = datasets[0].counts * 2
+    datasets[1].mask_fit = ~datasets[1].mask_safe
+    expected = np.sum([dataset.stat_sum() for dataset in datasets])
+    assert_allclose(datasets.stat_sum(), expected, rtol=1e-12)
+
+
+def test_datasets_stat_sum_batched_weighted():
+    datasets = get_spectrum_datasets()
+
+    for dataset in datasets:
+        dataset.stat_type = "cash_weighted"
+
+    datasets[0].mask_safe = datasets[0].mask_safe * 0.5
+
+    expected = np.sum([dataset.stat_sum() for dataset in datasets])
+    assert_allclose(datasets.stat_sum(), expected, rtol=1e-12)
+
+
+@pytest.mark.parametrize("on_off", [False, True])
+def test_datasets_stat_sum_threads(on_off):
+    datasets = get_spectrum_datasets(n_datasets=4, on_off=on_off)
+    expected = datasets.stat_sum()
+
+    datasets.n_jobs = 2
+    datasets.parallel_backend = "threads"
+    assert datasets._n_threads == 2
+    assert_allclose(datasets.stat_sum(), expected, rtol=1e-12)
+
+    datasets_threads = Datasets(list(datasets), n_jobs=2, parallel_backend="threads")
+    result = Fit().run(datasets_threads)
+    assert result.success
+
+    sliced = datasets.slice_by_energy(1 * u.TeV, 10 * u.TeV)
+    assert sliced.n_jobs == 2
+    assert sliced.parallel_backend == "threads"
+    assert_allclose(sliced.stat_sum(), Datasets(list(sliced)).stat_sum(), rtol=1e-12)
+
+    datasets.parallel_backend = "multiprocessing"
+    assert datasets._n_threads == 1
+
+
+def test_datasets_stat_sum_gradient():
+    datasets = get_spectrum_datasets()
+
+    for dataset in datasets:
+        bkg_model = FoVBackgroundModel(dataset_name=dataset.name)
+        dataset.models = list(dataset.models) + [bkg_model]
+
+    datasets.models["source"].spectral_model.index.value = 2.5
+    datasets.models["source"].spectral_model.amplitude.value = 2e-12
+
+    assert datasets.has_stat_sum_gradient
+
+    parameters = datasets.parameters.free_parameters
+    gradient = datasets.stat_sum_gradient()
+    assert gradient.shape == (len(parameters),)
+
+    expected = []
+    for par in parameters:
+        value = par.value
+        step = 1e-6 * value
+
+        par.value = value + step
+        stat_up = datasets.stat_sum()
+        par.value = value - step
+        stat_down = datasets.stat_sum()
+        par.value = value
+
+        expected.append((stat_up - stat_down) / (2 * step))
+
+    assert_allclose(gradient, expected, rtol=1e-4)
+
+    with datasets.parameters.restore_status():
+        result = Fit().optimize(datasets)
+
+    fit = Fit(optimize_opts={"backend": "minuit", "use_gradient": True})
+    result_gradient = fit.optimize(datasets)
+    assert result_gradient.success
+    assert_allclose(result_gradient.total_stat, result.total_stat, rtol=1e-6)
+
+
+def test_datasets_stat_sum_gradient_frozen_model(monkeypatch):
+    from gammapy.datasets.evaluator import MapEvaluator
+
+    datasets = get_spectrum_datasets()
+
+    for dataset in datasets:
+        bkg_model = FoVBackgroundModel(dataset_name=dataset.name)
+        dataset.models = list(dataset.models) + [bkg_model]
+
+    datasets.models["source"].spectral_model.freeze()
+
+    calls = []
+    compute_npred_gradient = MapEvaluator.compute_npred_gradient
+
+    def compute_npred_gradient_counted(self):
+        calls.append(self.model.name)
+        return compute_npred_gradient(self)
+
+    monkeypatch.setattr(
+        MapEvaluator, "compute_npred_gradient", compute_npred_gradient_counted
+    )
+
+    parameters = datasets.parameters.free_parameters
+    gradient = datasets.stat_sum_gradient()
+
+    # the frozen source does not contribute to the gradient
+    assert calls == []
+    assert gradient.shape == (len(parameters),)
+    assert np.all(np.isfinite(gradient))
+
+
+def test_datasets_stat_sum_gradient_not_supported():
+    datasets = get_spectrum_datasets(on_off=True)
+    assert not datasets.has_stat_sum_gradient
+
+    datasets = get_spectrum_datasets()
+    datasets.models["source"].spectral_model.index.prior = GaussianPrior(mu=2, sigma=1)
+    assert not datasets.has_stat_sum_gradient
+
+
 def test_datasets_str(datasets):
     assert "Datasets" in str(datasets)
 
@@ -6,7 +6,7 @@ from numpy.testing import assert_allclose
 import astropy.units as u
 from astropy.coordinates import SkyCoord
 from regions import CircleSkyRegion
-from gammapy.datasets.evaluator import MapEvaluator
+from gammapy.datasets.evaluator import EVALUATOR_CACHE, MapEvaluator
 from gammapy.irf import PSFKernel, RecoPSFMap
 from gammapy.maps import Map, MapAxis, RegionGeom, RegionNDMap, WcsGeom
 from gammapy.modeling.models import (
@@ -14,6 +14,7 @@ from gammapy.modeling.models import (
     GaussianSpatialModel,
     Models,
     PointSpatialModel,
+    PowerLawNormSpectralModel,
     PowerLawSpectralModel,
     SkyModel,
 )
@@ -277,3 +278,203 @@ def test_norm_only_changed():
     spectral_model.amplitude.value *= 2
     spectral_model.index.value *= 2
     assert not evaluator.parameter_norm_only_changed
+
+
+def test_norm_only_changed_compound():
+    center = SkyCoord("0 deg", "0 deg", frame="galactic")
+    energy_axis_true = MapAxis.from_energy_bounds(
+        ".1 TeV", "10 TeV", nbin=2, name="energy_true"
+    )
+    geom = WcsGeom.create(
+        skydir=center,
+        width=1 * u.deg,
+        axes=[energy_axis_true],
+        frame="galactic",
+        binsz=0.2 * u.deg,
+    )
+
+    pwl = PowerLawSpectralModel(index=2, amplitude="1e-11 TeV-1 s-1 m-2")
+    pwl_norm = PowerLawNormSpectralModel(tilt=0.1)
+    spectral_model = pwl * pwl_norm
+
+    assert spectral_model.norm_parameters.names == ["amplitude", "norm"]
+    assert (pwl + pwl_norm).norm_parameters.names == []
+
+    spatial_model = PointSpatialModel(
+        lon_0=0 * u.deg, lat_0=0 * u.deg, frame="galactic"
+    )
+    model = SkyModel(spectral_model=spectral_model, spatial_model=spatial_model)
+
+    exposure = Map.from_geom(geom, unit="m2 s")
+    exposure.data += 1.0
+
+    evaluator = MapEvaluator(model=model, exposure=exposure)
+    npred = evaluator.compute_npred()
+
+    pwl.amplitude.value *= 2
+    pwl_norm.norm.value = 3
+    assert evaluator.parameter_norm_only_changed
+    assert_allclose(evaluator.renorm(), 6)
+    assert_allclose(evaluator.compute_npred().data, 6 * npred.data)
+
+    pwl_norm.norm.value = 0
+    assert_allclose(evaluator.compute_npred().data, 0)
+
+    pwl_norm.norm.value = 1
+    assert evaluator.parameter_norm_only_changed
+    assert_allclose(evaluator.compute_npred().data, 2 * npred.data)
+
+    pwl_norm.tilt.value = 0.2
+    assert not evaluator.parameter_norm_only_changed
+
+
+def test_evaluator_cache():
+    center = SkyCoord("0 deg", "0 deg", frame="galactic")
+    energy_axis_true = MapAxis.from_energy_bounds(
+        ".1 TeV", "10 TeV", nbin=2, name="energy_true"
+    )
+    geom = WcsGeom.create(
+        skydir=center,
+        width=1 * u.deg,
+        axes=[energy_axis_true],
+        frame="galactic",
+        binsz=0.2 * u.deg,
+    )
+
+    spectral_model = PowerLawSpectralModel(index=2, amplitude="1e-11 TeV-1 s-1 m-2")
+    spatial_model = GaussianSpatialModel(
+        lon_0=0 * u.deg, lat_0=0 * u.deg, sigma=0.1 * u.deg, frame="galactic"
+    )
+    model = SkyModel(spectral_model=spectral_model, spatial_model=spatial_model)
+
+    exposure = Map.from_geom(geom, unit="m2 s")
+    exposure.data += 1.0
+
+    psf = PSFKernel.from_gauss(geom, sigma="0.1 deg")
+
+    evaluator = MapEvaluator(model=model, exposure=exposure, psf=psf)
+
+    EVALUATOR_CACHE.clear()
+    info = EVALUATOR_CACHE.info
+
+    npred = evaluator.compute_npred()
+    assert EVALUATOR_CACHE.misses == info["misses"] + 2
+    assert EVALUATOR_CACHE.hits == info["hits"]
+
+    spectral_model.index.value = 2.5
+    npred_index = evaluator.compute_npred()
+
+    spectral_model.index.value = 2
+    npred_cached = evaluator.compute_npred()
+
+    assert npred_cached is npred
+    assert EVALUATOR_CACHE.hits == info["hits"] + 1
+
+    spatial_model.sigma.value = 0.2
+    evaluator.compute_npred()
+    spatial_model.sigma.value = 0.1
+    spectral_model.index.value = 2.5
+    assert evaluator.compute_npred() is npred_index
+    assert len(EVALUATOR_CACHE) == 5
+
+    # entries of another evaluator of the same model are not shared
+    other = MapEvaluator(model=model, exposure=exposure, psf=psf)
+    assert other.compute_npred() is not npred_index
+    assert len(EVALUATOR_CACHE) == 7
+
+    # after a reset, the previous entries are not used anymore
+    evaluator.reset_cache_properties()
+    assert evaluator.compute_npred() is not npred_index
+
+    misses = EVALUATOR_CACHE.misses
+    evaluator = MapEvaluator(model=model, exposure=exposure, psf=psf, use_cache=False)
+    evaluator.compute_npred()
+    assert EVALUATOR_CACHE.misses == misses
+
+
+@pytest.mark.parametrize("psf_reco", [False, True])
+def test_compute_npred_response(psf_reco):
+    center = SkyCoord("0 deg", "0 deg", frame="galactic")
+    energy_axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=3, name="energy")
+    geom = WcsGeom.create(
+        skydir=center,
+        width=1 * u.deg,
+        axes=[energy_axis],
+        frame="galactic",
+        binsz=0.2 * u.deg,
+    )
+
+    spectral_model = PowerLawSpectralModel(index=2, amplitude="1e-11 TeV-1 s-1 m-2")
+    spatial_model = GaussianSpatialModel(
+        lon_0=0 * u.deg, lat_0=0 * u.deg, sigma=0.1 * u.deg, frame="galactic"
+    )
+    model = SkyModel(spectral_model=spectral_model, spatial_model=spatial_model)
+
+    exposure = Map.from_geom(geom.as_energy_true, unit="m2 s")
+    exposure.data += 1.0
+
+    psf_geom = geom if psf_reco else geom.as_energy_true
+    psf = PSFKernel.from_gauss(psf_geom, sigma=0.1 * u.deg)
+
+    evaluator = MapEvaluator(model=model, exposure=exposure, psf=psf)
+    assert evaluator.apply_psf_after_edisp == psf_reco
+    assert not evaluator.use_response
+
+    npred = evaluator.compute_npred()
+
+    spatial_model.parameters.freeze_all()
+    assert evaluator.use_response
+
+    npred_response = evaluator.compute_npred_response()
+    assert npred_response.geom == npred.geom
+    assert_allclose(npred_response.data, npred.data, rtol=1e-10)
+
+    spectral_model.index.value = 2.5
+    npred_response = evaluator.compute_npred()
+    spatial_model.parameters.unfreeze_all()
+    expected = MapEvaluator(model=model, exposure=exposure, psf=psf).compute_npred()
+    assert_allclose(npred_response.data, expected.data, rtol=1e-10)
+
+
+def test_compute_npred_response_lazy():
+    center = SkyCoord("0 deg", "0 deg", frame="galactic")
+    energy_axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=3, name="energy")
+    geom = WcsGeom.create(
+        skydir=center,
+        width=1 * u.deg,
+        axes=[energy_axis],
+        frame="galactic",
+        binsz=0.2 * u.deg,
+    )
+
+    spectral_model = PowerLawSpectralModel(index=2, amplitude="1e-11 TeV-1 s-1 m-2")
+    spatial_model = GaussianSpatialModel(
+        lon_0=0 * u.deg, lat_0=0 * u.deg, sigma=0.1 * u.deg, frame="galactic"
+    )
+    spatial_model.parameters.freeze_all()
+    model = SkyModel(spectral_model=spectral_model, spatial_model=spatial_model)
+
+    exposure = Map.from_geom(geom.as_energy_true, unit="m2 s")
+    exposure.data += 1.0
+
+    evaluator = MapEvaluator(model=model, exposure=exposure)
+    assert evaluator.use_response
+
+    EVALUATOR_CACHE.clear()
+    key = evaluator._cache_key("response", spatial_model.parameters)
+
+    for index in [2, 2.2]:
+        spectral_model.index.value = index
+        evaluator.compute_npred()
+        assert key not in EVALUATOR_CACHE
+
+    spectral_model.index.value = 2.4
+    npred = evaluator.compute_npred()
+    assert key in EVALUATOR_CACHE
+
+    expected = MapEvaluator(model=model, exposure=exposure).compute_npred()
+    assert_allclose(npred.data, expected.data, rtol=1e-10)
+
+    # the response is not copied with the evaluator
+    evaluator_copy = deepcopy(evaluator)
+    assert evaluator_copy._get_response() is None
@@ -578,6 +578,54 @@ def test_compute_ts_map_with_mask_fit(fake_dataset):
     assert_allclose(maps["ts"].data[:, 25, 25], 975.11571, atol=1e-12)
 
 
+@pytest.mark.parametrize("threshold", [None, 1])
+def test_compute_ts_map_vectorized(fake_dataset, threshold):
+    spatial_model = GaussianSpatialModel(sigma="0.05 deg")
+    spectral_model = PowerLawSpectralModel(index=2)
+    model = SkyModel(spatial_model=spatial_model, spectral_model=spectral_model)
+
+    kwargs = dict(
+        model=model,
+        kernel_width="0.3 deg",
+        threshold=threshold,
+        rtol=1e-6,
+        selection_optional=["ul", "errn-errp"],
+    )
+    maps_ref = TSMapEstimator(**kwargs).run(fake_dataset)
+
+    estimator = TSMapEstimator(solver="vectorized", **kwargs)
+    maps = estimator.run(fake_dataset)
+
+    for name in ["ts", "norm", "norm_err", "norm_ul", "norm_errn", "norm_errp"]:
+        assert_allclose(maps[name].data, maps_ref[name].data, rtol=1e-4)
+
+    assert_allclose(maps["npred_excess"].data, maps_ref["npred_excess"].data, rtol=1e-4)
+    assert np.all(maps["success"].data == maps_ref["success"].data)
+
+    with pytest.raises(ValueError, match="Vectorized solver does not support"):
+        TSMapEstimator(solver="vectorized", selection_optional=["stat_scan"])
+
+    with pytest.raises(ValueError, match="Invalid solver"):
+        TSMapEstimator(solver="newton")
+
+
+@pytest.mark.parametrize("solver", ["brentq", "vectorized"])
+def test_compute_ts_map_tiles(fake_dataset, solver):
+    spatial_model = GaussianSpatialModel(sigma="0.05 deg")
+    spectral_model = PowerLawSpectralModel(index=2)
+    model = SkyModel(spatial_model=spatial_model, spectral_model=spectral_model)
+
+    kwargs = dict(model=model, kernel_width="0.3 deg", solver=solver)
+    maps_ref = TSMapEstimator(**kwargs).run(fake_dataset)
+
+    estimator = TSMapEstimator(tile_size=7, **kwargs)
+    assert estimator.tile_size == 7
+    maps = estimator.run(fake_dataset)
+
+    for name in ["ts", "norm", "norm_err", "npred", "niter"]:
+        assert_allclose(maps[name].data, maps_ref[name].data)
+
+
 @requires_data()
 def test_compute_ts_map_with_hole(fake_dataset):
     """Test of compute_ts_image with a null exposure at the center of the map"""
@@ -3,7 +3,6 @@
 
 import warnings
 import astropy.units as u
-from itertools import repeat
 import numpy as np
 import scipy.optimize
 from scipy.interpolate import InterpolatedUnivariateSpline
@@ -33,6 +32,8 @@ from .core import FluxMaps
 
 __all__ = ["TSMapEstimator"]
 
+BATCH_MAX_BYTES = 16 * 1024**2
+
 
 def _extract_array(array, shape, position):
     """Helper function to extract parts of a larger array.
@@ -59,6 +60,72 @@ def _extract_array(array, shape, position):
     return array[:, y_lo:y_hi, x_lo:x_hi]
 
 
+def _split_tiles(positions, shape, tile_size, halo):
+    """Group pixel positions by square spatial tiles.
+
+    Parameters
+    ----------
+    positions : `~numpy.ndarray`
+        Pixel positions, array of shape (n_positions, 2).
+    shape : tuple of int
+        Spatial shape of the map.
+    tile_size : int
+        Size of the tiles in pixels.
+    halo : `~numpy.ndarray`
+        Margin added around the positions of each tile, in pixels along each
+        axis.
+
+    Returns
+    -------
+    tiles : list of tuple
+        Positions in each tile and slices of the maps covering them,
+        including the halo.
+    """
+    n_tiles_x = int(np.ceil(shape[1] / tile_size))
+    tile_idx = (positions[:, 0] // tile_size) * n_tiles_x
+    tile_idx += positions[:, 1] // tile_size
+
+    order = np.argsort(tile_idx, kind="stable")
+    _, idx_start = np.unique(tile_idx[order], return_index=True)
+
+    tiles = []
+    for positions_tile in np.split(positions[order], idx_start[1:]):
+        lo = np.maximum(positions_tile.min(axis=0) - halo, 0)
+        hi = np.minimum(positions_tile.max(axis=0) + halo + 1, shape)
+        slices = (Ellipsis, slice(lo[0], hi[0]), slice(lo[1], hi[1]))
+        tiles.append((positions_tile, slices))
+
+    return tiles
+
+
+def _extract_arrays(array, shape, positions):
+    """Extract parts of a larger array for many positions at once.
+
+    Vectorized version of `_extract_array`.
+
+    Parameters
+    ----------
+    array : `~numpy.ndarray`
+        The array from which to extract.
+    shape : tuple
+        The shape of the extracted arrays.
+    positions : `~numpy.ndarray`
+        Array of shape (n_positions, 2) with the positions of the small arrays'
+        centers with respect to the large array.
+
+    Returns
+    -------
+    cutouts : `~numpy.ndarray`
+        Array of shape (n_positions, array.shape[0], shape[-2], shape[-1]).
+    """
+    y_width, x_width = shape[-2] // 2, shape[-1] // 2
+    dy = np.arange(-y_width, y_width + 1)
+    dx = np.arange(-x_width, x_width + 1)
+    rows = positions[:, 0, np.newaxis, np.newaxis] + dy[np.newaxis, :, np.newaxis]
+    cols = positions[:, 1, np.newaxis, np.newaxis] + dx[np.newaxis, np.newaxis, :]
+    return np.moveaxis(array[:, rows, cols], 1, 0)
+
+
 class TSMapEstimator(Estimator, parallel.ParallelMixin):
     r"""Compute test statistic map from a MapDataset using different optimization methods.
 
@@ -124,7 +191,7 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
         Number of processes used in parallel for the computation. Default is one,
         unless `~gammapy.utils.parallel.N_JOBS_DEFAULT` was modified. The number
         of jobs limited to the number of physical CPUs.
-    parallel_backend : {"multiprocessing", "ray"}, optional
+    parallel_backend : {"multiprocessing", "ray", "threads"}, optional
         Which backend to use for multiprocessing. Defaults to `~gammapy.utils.parallel.BACKEND_DEFAULT`.
     norm : `~gammapy.modeling.Parameter` or dict, optional
         Norm parameter used for the likelihood profile computation on a fixed norm range.
@@ -137,6 +204,17 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
     max_niter : int, optional
         Maximal number of iterations used by the root finding algorithm.
         Default is 100.
+    solver : {"brentq", "vectorized"}, optional
+        Root finding engine. "brentq" fits each pixel separately using
+        `scipy.optimize.brentq`, "vectorized" fits blocks of pixels at once using
+        a bracketed Newton method. The "vectorized" solver does not support
+        "stat_scan" and "sensitivity" in ``selection_optional``.
+        Default is "brentq".
+    tile_size : int, optional
+        Size in pixels of the square spatial tiles the computation is split
+        into. Each tile is sent once to a worker, together with a margin of half
+        the kernel size, and returns the results of all its pixels.
+        Default is 64.
 
     Notes
     -----
@@ -203,6 +281,8 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
         parallel_backend=None,
         norm=None,
         max_niter=100,
+        solver="brentq",
+        tile_size=64,
     ):
         if kernel_width is not None:
             kernel_width = Angle(kernel_width)
@@ -232,7 +312,22 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
 
         self.selection_optional = selection_optional
         self.energy_edges = energy_edges
-        self._flux_estimator = BrentqFluxEstimator(
+
+        if solver == "brentq":
+            flux_estimator_cls = BrentqFluxEstimator
+        elif solver == "vectorized":
+            flux_estimator_cls = VectorizedFluxEstimator
+            unsupported = {"stat_scan", "sensitivity"} & set(self.selection_optional)
+            if unsupported:
+                raise ValueError(
+                    f"Vectorized solver does not support {sorted(unsupported)}"
+                )
+        else:
+            raise ValueError(f"Invalid solver: {solver!r}")
+
+        self.solver = solver
+        self.tile_size = tile_size
+        self._flux_estimator = flux_estimator_cls(
             rtol=self.rtol,
             n_sigma=self.n_sigma,
             n_sigma_ul=self.n_sigma_ul,
@@ -499,31 +594,56 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
             """
             )
 
-        x, y = np.where(np.squeeze(mask_2d))
-        positions = list(zip(x, y))
-
-        inputs = zip(
-            positions,
-            repeat([_["counts"].data.astype(float) for _ in maps]),
-            repeat([_["exposure"].data.astype(float) for _ in maps]),
-            repeat([_["background"].data.astype(float) for _ in maps]),
-            repeat([_["kernel"].data for _ in maps]),
-            repeat([_["norm"].data for _ in maps]),
-            repeat([_["weights"] for _ in maps]),
-            repeat(self._flux_estimator),
+        mask_2d = np.squeeze(mask_2d)
+        j, i = np.where(mask_2d)
+
+        counts = [_["counts"].data.astype(float) for _ in maps]
+        exposure = [_["exposure"].data.astype(float) for _ in maps]
+        background = [_["background"].data.astype(float) for _ in maps]
+        kernel = [_["kernel"].data for _ in maps]
+        norm = [_["norm"].data for _ in maps]
+        weights = [_["weights"] for _ in maps]
+        weights = [_ if _ is None else _.data for _ in weights]
+
+        halo = np.max([_.shape[-2:] for _ in kernel], axis=0) // 2
+        tiles = _split_tiles(
+            positions=np.stack([j, i], axis=1),
+            shape=mask_2d.shape,
+            tile_size=self.tile_size,
+            halo=halo,
         )
 
+        inputs, positions = [], []
+        for positions_tile, slices in tiles:
+            positions.append(positions_tile)
+            offset = [slices[-2].start, slices[-1].start]
+            inputs.append(
+                (
+                    positions_tile - offset,
+                    [_[slices] for _ in counts],
+                    [_[slices] for _ in exposure],
+                    [_[slices] for _ in background],
+                    kernel,
+                    [_[slices] for _ in norm],
+                    [_ if _ is None else _[slices] for _ in weights],
+                    self._flux_estimator,
+                )
+            )
+
         results = parallel.run_multiprocessing(
-            _ts_value,
+            _ts_tile,
             inputs,
             backend=self.parallel_backend,
             pool_kwargs=dict(processes=self.n_jobs),
             task_name="TS map",
         )
 
-        result = {}
+        results = {
+            name: np.concatenate([_[name] for _ in results]) for name in results[0]
+        }
+        j, i = np.concatenate(positions).T
 
-        j, i = zip(*positions)
+        result = {}
 
         geom = maps[0]["counts"].geom.squash(axis_name="energy")
         energy_axis = geom.axes["energy"]
@@ -532,7 +652,7 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
         for name in self.selection_all:
             if name in ["dnde_scan_values", "stat_scan"]:
                 norm_bin_axis = MapAxis(
-                    range(len(results[0]["dnde_scan_values"])),
+                    range(results["dnde_scan_values"].shape[1]),
                     interp="lin",
                     node_type="center",
                     name="dnde_bin",
@@ -549,11 +669,11 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
                     factor = 1
 
                 m = Map.from_geom(geom_scan, data=np.nan, unit=unit)
-                m.data[:, 0, j, i] = np.array([_[name] for _ in results]).T * factor
+                m.data[:, 0, j, i] = results[name].T * factor
 
             else:
                 m = Map.from_geom(geom=geom, data=np.nan, unit="")
-                m.data[0, j, i] = [_[name] for _ in results]
+                m.data[0, j, i] = results[name]
             result[name] = m
 
         return result
@@ -727,9 +847,9 @@ class SimpleMapDataset:
     @classmethod
     def from_arrays(cls, counts, background, exposure, norm, position, kernel, weights):
         """"""
-        if weights:
+        if weights is not None:
             # compute mask weighted kernel for the sum_over_axes case
-            weights = _extract_array(weights.data, kernel.shape, position)
+            weights = _extract_array(weights, kernel.shape, position)
             kernel = (kernel * weights).sum(axis=0, keepdims=True)
             with np.errstate(invalid="ignore", divide="ignore"):
                 kernel /= weights.sum(axis=0, keepdims=True)
@@ -1111,3 +1231,468 @@ def _ts_value(
         norm_guess=norm_guess,
     )
     return flux_estimator.run(dataset)
+
+
+class VectorizedMapDataset:
+    """Simple map datasets for a block of pixels.
+
+    Each row holds the flattened arrays of one `SimpleMapDataset`. Rows are
+    padded to the same length, the padding being excluded by ``mask``.
+
+    Parameters
+    ----------
+    model : `~numpy.ndarray`
+        Kernel array of shape (n_pixels, n_values).
+    counts : `~numpy.ndarray`
+        Counts array of shape (n_pixels, n_values).
+    background : `~numpy.ndarray`
+        Background array of shape (n_pixels, n_values).
+    norm_guess : `~numpy.ndarray`
+        Norm guess of shape (n_pixels,).
+    mask : `~numpy.ndarray`
+        Mask of valid values of shape (n_pixels, n_values).
+    """
+
+    def __init__(self, model, counts, background, norm_guess, mask):
+        self.model = model
+        self.counts = counts
+        self.background = background
+        self.norm_guess = norm_guess
+        self.mask = mask
+
+    def __len__(self):
+        return len(self.norm_guess)
+
+    def select(self, idx):
+        """Select a subset of pixels."""
+        return self.__class__(
+            model=self.model[idx],
+            counts=self.counts[idx],
+            background=self.background[idx],
+            norm_guess=self.norm_guess[idx],
+            mask=self.mask[idx],
+        )
+
+    @lazyproperty
+    def norm_bounds(self):
+        """Bounds for x, vectorized version of ``norm_bounds_compiled``."""
+        counts, background, model = self.counts, self.background, self.model
+        has_model = model > 0
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            sn = np.where(has_model, background / model, 1e14)
+
+        sn_counts = np.where(counts > 0, sn, 1e14)
+        idx_min = np.argmin(sn_counts, axis=1)
+        rows = np.arange(len(self))
+        sn_min = sn_counts[rows, idx_min]
+        c_min = np.where(sn_min < 1e14, counts[rows, idx_min], 1.0)
+        sn_min = np.minimum(sn_min, 1e14)
+
+        s_counts = np.where(counts > 0, counts, 0).sum(axis=1)
+        s_model = np.where(has_model, model, 0).sum(axis=1)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            norm_min = np.where(s_model == 0, np.nan, c_min / s_model - sn_min)
+            norm_max = np.where(s_model == 0, np.nan, s_counts / s_model - sn_min)
+
+        return norm_min, norm_max, -np.minimum(np.min(sn, axis=1), 1e14)
+
+    def npred(self, norm, idx=slice(None)):
+        """Predicted number of counts."""
+        norm = np.atleast_1d(norm)[:, np.newaxis]
+        return self.background[idx] + norm * self.model[idx]
+
+    def stat_sum(self, norm, idx=slice(None)):
+        """Statistics sum."""
+        stat = cash(self.counts[idx], self.npred(norm, idx))
+        return np.where(self.mask[idx], stat, 0).sum(axis=1)
+
+    def stat_derivative(self, norm, idx=slice(None)):
+        """Statistics derivative."""
+        counts, model = self.counts[idx], self.model[idx]
+        denom = self.npred(norm, idx)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            value = model * (1 - counts / denom)
+
+        value = np.where(counts > 0, np.where(denom != 0, value, 0), model)
+        return 2 * np.where(model > 0, value, 0).sum(axis=1)
+
+    def stat_2nd_derivative(self, norm, idx=slice(None)):
+        """Statistics 2nd derivative."""
+        model = self.model[idx]
+        denom = self.npred(norm, idx)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            value = model**2 * self.counts[idx] / denom**2
+
+        return np.where(denom != 0, value, 0).sum(axis=1)
+
+    @classmethod
+    def from_arrays(
+        cls, counts, background, exposure, norm, positions, kernel, weights
+    ):
+        """Create from the arrays of several datasets.
+
+        Same as `SimpleMapDataset.from_arrays` followed by the concatenation
+        done in `_ts_value`, for a block of positions.
+        """
+        n_pixels = len(positions)
+        counts_cutouts, background_cutouts, model_cutouts, norm_guess = (
+            [],
+            [],
+            [],
+            [],
+        )
+
+        for idx in range(len(counts)):
+            kernel_idx = kernel[idx]
+            shape = kernel_idx.shape
+
+            if weights[idx] is not None:
+                # compute mask weighted kernel for the sum_over_axes case
+                weights_idx = _extract_arrays(weights[idx], shape, positions)
+                kernel_idx = (kernel_idx * weights_idx).sum(axis=1, keepdims=True)
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    kernel_idx /= weights_idx.sum(axis=1, keepdims=True)
+                    kernel_idx[~np.isfinite(kernel_idx)] = 0
+
+            exposure_cutout = _extract_arrays(exposure[idx], shape, positions)
+            model = kernel_idx * exposure_cutout
+            model_cutouts.append(model.reshape(n_pixels, -1))
+
+            for array, cutouts in zip(
+                [counts[idx], background[idx]], [counts_cutouts, background_cutouts]
+            ):
+                cutout = _extract_arrays(array, shape, positions)
+                cutouts.append(cutout.reshape(n_pixels, -1))
+
+            norm_guess.append(norm[idx][0, positions[:, 0], positions[:, 1]])
+
+        counts = np.concatenate(counts_cutouts, axis=1)
+        background = np.concatenate(background_cutouts, axis=1)
+        model = np.concatenate(model_cutouts, axis=1)
+
+        norm_guess = np.array(norm_guess)
+        mask_valid = np.isfinite(norm_guess)
+        n_valid = mask_valid.sum(axis=0)
+        norm_guess = np.where(mask_valid, norm_guess, 0).sum(axis=0)
+        norm_guess = np.where(n_valid > 0, norm_guess / np.maximum(n_valid, 1), 1.0)
+
+        mask_invalid = (counts == 0) & (background == 0) & (model == 0)
+        return cls(
+            counts=counts,
+            background=background,
+            model=model,
+            norm_guess=norm_guess,
+            mask=~mask_invalid,
+        )
+
+
+def _find_roots_newton(f, fprime, lower, upper, x0=None, rtol=0.01, max_niter=100):
+    """Find the roots of many bracketed scalar functions at once.
+
+    Uses Newton steps, falling back to bisection whenever a step leaves the
+    current bracket.
+
+    Parameters
+    ----------
+    f : callable
+        Function called as ``f(x, idx)``, where ``idx`` are the indices of the
+        functions evaluated at ``x``.
+    fprime : callable
+        Derivative of ``f``, called with the same arguments.
+    lower, upper : `~numpy.ndarray`
+        Lower and upper bounds of the brackets.
+    x0 : `~numpy.ndarray`, optional
+        Starting values, the bracket centers are used where undefined.
+        Default is None.
+    rtol : float, optional
+        Relative tolerance on the roots. Default is 0.01.
+    max_niter : int, optional
+        Maximal number of iterations. Default is 100.
+
+    Returns
+    -------
+    roots, niter, success : `~numpy.ndarray`
+        Roots, NaN where no root is bracketed or the search did not converge,
+        number of iterations and convergence flag.
+    """
+    lower = np.array(lower, dtype=float)
+    upper = np.array(upper, dtype=float)
+    xtol = 2e-12
+
+    idx = np.arange(len(lower))
+    roots = np.full(len(lower), np.nan)
+    niter = np.zeros(len(lower), dtype=int)
+    success = np.zeros(len(lower), dtype=bool)
+
+    with np.errstate(invalid="ignore"):
+        f_lower, f_upper = f(lower, idx), f(upper, idx)
+        valid = np.isfinite(f_lower) & np.isfinite(f_upper)
+        valid &= np.sign(f_lower) * np.sign(f_upper) <= 0
+
+    for bound, f_bound in zip([upper, lower], [f_upper, f_lower]):
+        is_root = valid & (f_bound == 0)
+        roots[is_root], success[is_root] = bound[is_root], True
+
+    sign_lower = np.sign(f_lower)
+    x = 0.5 * (lower + upper)
+
+    if x0 is not None:
+        in_bracket = (x0 > lower) & (x0 < upper)
+        x = np.where(in_bracket, x0, x)
+
+    idx = np.flatnonzero(valid & ~success)
+
+    for _ in range(max_niter):
+        if not idx.size:
+            break
+
+        niter[idx] += 1
+        x_idx = x[idx]
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            f_idx = f(x_idx, idx)
+            x_new = x_idx - f_idx / fprime(x_idx, idx)
+
+        is_lower = np.sign(f_idx) == sign_lower[idx]
+        lower[idx] = np.where(is_lower, x_idx, lower[idx])
+        upper[idx] = np.where(is_lower, upper[idx], x_idx)
+
+        lo, hi = lower[idx], upper[idx]
+        is_bisection = ~((x_new > lo) & (x_new < hi))
+        x_new = np.where(is_bisection, 0.5 * (lo + hi), x_new)
+
+        finite = np.isfinite(f_idx)
+        tol = xtol + rtol * np.abs(x_new)
+        converged = np.abs(x_new - x_idx) <= tol
+        converged |= hi - lo <= tol
+        converged |= f_idx == 0
+        converged &= finite
+        x_new = np.where(f_idx == 0, x_idx, x_new)
+
+        roots[idx[converged]] = x_new[converged]
+        success[idx[converged]] = True
+        x[idx] = x_new
+        idx = idx[~converged & finite]
+
+    return roots, niter, success
+
+
+class VectorizedFluxEstimator(BrentqFluxEstimator):
+    """Single parameter flux estimator for a block of pixels.
+
+    Same as `BrentqFluxEstimator`, but all quantities are computed at once for
+    all pixels of a `VectorizedMapDataset`, using `_find_roots_newton` instead
+    of `~scipy.optimize.brentq`.
+    """
+
+    _available_selection_optional = ["errn-errp", "ul"]
+    tag = "VectorizedFluxEstimator"
+
+    def _fit_result(self, dataset, norm, niter, success):
+        with np.errstate(invalid="ignore", divide="ignore"):
+            norm_err = np.sqrt(1 / dataset.stat_2nd_derivative(norm)) * self.n_sigma
+
+        stat = dataset.stat_sum(norm=norm)
+        stat_null = dataset.stat_sum(norm=np.zeros(len(dataset)))
+
+        return {
+            "norm": norm,
+            "norm_err": norm_err,
+            "niter": niter,
+            "ts": stat_null - stat,
+            "stat": stat,
+            "stat_null": stat_null,
+            "success": success,
+        }
+
+    def estimate_best_fit(self, dataset):
+        """Estimate best fit norm parameter.
+
+        Parameters
+        ----------
+        dataset : `VectorizedMapDataset`
+            Vectorized map dataset.
+
+        Returns
+        -------
+        result : dict
+            Result dictionary including 'norm' and 'norm_err'.
+        """
+        norm_min, norm_max, norm_min_total = dataset.norm_bounds
+
+        def fprime(x, idx):
+            return 2 * dataset.stat_2nd_derivative(x, idx)
+
+        norm, niter, success = _find_roots_newton(
+            f=dataset.stat_derivative,
+            fprime=fprime,
+            lower=norm_min,
+            upper=norm_max,
+            x0=dataset.norm_guess,
+            rtol=self.rtol,
+            max_niter=self.max_niter,
+        )
+
+        no_counts = ~(dataset.counts.sum(axis=1) > 0)
+        failed = ~success & ~no_counts
+        norm = np.where(no_counts | failed, norm_min_total, norm)
+        norm = np.maximum(norm, norm_min_total)
+        niter = np.where(no_counts, 0, np.where(failed, self.max_niter, niter))
+        return self._fit_result(dataset, norm, niter, success | no_counts)
+
+    def _confidence(self, dataset, n_sigma, result, positive):
+        stat_best = result["stat"]
+        norm = result["norm"]
+        norm_err = result["norm_err"]
+
+        def ts_diff(x, idx):
+            return (stat_best[idx] + n_sigma**2) - dataset.stat_sum(x, idx)
+
+        def ts_diff_derivative(x, idx):
+            return -dataset.stat_derivative(x, idx)
+
+        if positive:
+            min_norm = norm
+            max_norm = norm + 1e2 * norm_err
+            factor = 1
+        else:
+            min_norm = norm - 1e2 * norm_err
+            max_norm = norm
+            factor = -1
+
+        roots, _, _ = _find_roots_newton(
+            f=ts_diff,
+            fprime=ts_diff_derivative,
+            lower=min_norm,
+            upper=max_norm,
+            rtol=self.rtol,
+            max_niter=self.max_niter,
+        )
+        # Where the root finding fails NaN is set as norm
+        return (roots - norm) * factor
+
+    def estimate_default(self, dataset):
+        """Estimate default norm.
+
+        Parameters
+        ----------
+        dataset : `VectorizedMapDataset`
+            Vectorized map dataset.
+
+        Returns
+        -------
+        result : dict
+            Result dictionary including 'norm', 'norm_err' and "niter".
+        """
+        return self._fit_result(
+            dataset,
+            norm=dataset.norm_guess.copy(),
+            niter=np.zeros(len(dataset), dtype=int),
+            success=np.ones(len(dataset), dtype=bool),
+        )
+
+    def run(self, dataset):
+        """Run flux estimator.
+
+        Parameters
+        ----------
+        dataset : `VectorizedMapDataset`
+            Vectorized map dataset.
+
+        Returns
+        -------
+        result : dict
+            Result dictionary of arrays with one entry per pixel.
+        """
+        if self.ts_threshold is not None:
+            result = self.estimate_default(dataset)
+            idx = np.flatnonzero(result["ts"] > self.ts_threshold)
+            if idx.size:
+                result_fit = self.estimate_best_fit(dataset.select(idx))
+                for name, value in result_fit.items():
+                    result[name][idx] = value
+        else:
+            result = self.estimate_best_fit(dataset)
+
+        if "ul" in self.selection_optional:
+            result.update(self.estimate_ul(dataset, result))
+
+        if "errn-errp" in self.selection_optional:
+            result.update(self.estimate_errn_errp(dataset, result))
+
+        norm = result["norm"]
+        result["npred"] = dataset.npred(norm=norm).sum(axis=1)
+        result["npred_excess"] = result["npred"] - dataset.background.sum(axis=1)
+        result["stat"] = dataset.stat_sum(norm=norm)
+        return result
+
+
+def _ts_values(
+    positions, counts, exposure, background, kernel, norm, weights, flux_estimator
+):
+    """Compute test statistic values for a block of pixel positions.
+
+    Vectorized version of `_ts_value`.
+
+    Parameters
+    ----------
+    positions : `~numpy.ndarray`
+        Pixel positions, array of shape (n_positions, 2).
+    counts, exposure, background, kernel, norm, weights : list
+        Arrays of each dataset, see `_ts_value`.
+    flux_estimator : `VectorizedFluxEstimator`
+        Flux estimator.
+
+    Returns
+    -------
+    result : dict
+        Result dictionary of arrays with one entry per position.
+    """
+    dataset = VectorizedMapDataset.from_arrays(
+        counts=counts,
+        background=background,
+        exposure=exposure,
+        norm=norm,
+        positions=positions,
+        kernel=kernel,
+        weights=weights,
+    )
+    return flux_estimator.run(dataset)
+
+
+def _ts_tile(
+    positions, counts, exposure, background, kernel, norm, weights, flux_estimator
+):
+    """Compute test statistic values for the pixel positions of a tile.
+
+    Parameters
+    ----------
+    positions : `~numpy.ndarray`
+        Pixel positions in the tile, array of shape (n_positions, 2).
+    counts, exposure, background, kernel, norm, weights : list
+        Arrays of each dataset cut out to the tile, see `_ts_value`.
+    flux_estimator : `BrentqFluxEstimator` or `VectorizedFluxEstimator`
+        Flux estimator.
+
+    Returns
+    -------
+    result : dict
+        Result dictionary of arrays with one entry per position.
+    """
+    args = (counts, exposure, background, kernel, norm, weights, flux_estimator)
+
+    if isinstance(flux_estimator, VectorizedFluxEstimator):
+        n_values = sum(_.size for _ in kernel)
+        batch_size = max(BATCH_MAX_BYTES // (8 * n_values), 1)
+        n_batches = int(np.ceil(len(positions) / batch_size))
+        results = [_ts_values(_, *args) for _ in np.array_split(positions, n_batches)]
+        return {
+            name: np.concatenate([_[name] for _ in results]) for name in results[0]
+        }
+
+    results = [_ts_value(_, *args) for _ in positions]
+    return {name: np.array([_[name] for _ in results]) for name in results[0]}
@@ -83,7 +83,7 @@ class LightCurveEstimator(FluxPointsEstimator):
         Number of processes used in parallel for the computation. Default is one,
         unless `~gammapy.utils.parallel.N_JOBS_DEFAULT` was modified. The number
         of jobs is limited to the number of physical CPUs.
-    parallel_backend : {"multiprocessing", "ray"}, optional
+    parallel_backend : {"multiprocessing", "ray", "threads"}, optional
         Which backend to use for multiprocessing. Defaults to `~gammapy.utils.parallel.BACKEND_DEFAULT`.
     norm : ~gammapy.modeling.Parameter` or dict, optional
         Norm parameter used for the fit.
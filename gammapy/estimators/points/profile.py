@@ -35,7 +35,7 @@ class FluxProfileEstimator(FluxPointsEstimator):
         Number of processes used in parallel for the computation. Default is one,
         unless `~gammapy.utils.parallel.N_JOBS_DEFAULT` was modified. The number
         of jobs is limited to the number of physical CPUs.
-    parallel_backend : {"multiprocessing", "ray"}, optional
+    parallel_backend : {"multiprocessing", "ray", "threads"}, optional
         Which backend to use for multiprocessing.
         Defaults to `~gammapy.utils.parallel.BACKEND_DEFAULT`.
     **kwargs : dict, optional
@@ -76,7 +76,7 @@ class FluxPointsEstimator(FluxEstimator, parallel.ParallelMixin):
         Number of processes used in parallel for the computation. The number of jobs is limited to the number of
         physical CPUs. If None, defaults to `~gammapy.utils.parallel.N_JOBS_DEFAULT`.
         Default is None.
-    parallel_backend : {"multiprocessing", "ray"}, optional
+    parallel_backend : {"multiprocessing", "ray", "threads"}, optional
         Which backend to use for multiprocessing. If None, defaults to `~gammapy.utils.parallel.BACKEND_DEFAULT`.
     norm : `~gammapy.modeling.Parameter` or dict, optional
         Norm parameter used for the fit.
@@ -684,6 +684,16 @@ class IRFMap:
     def has_single_spatial_bin(self):
         return self._irf_map.geom.to_image().data_shape == (1, 1)
 
+    @property
+    def nbytes(self):
+        """Memory size of the IRF and exposure map data in bytes."""
+        nbytes = self._irf_map.data.nbytes
+
+        if self.exposure_map is not None:
+            nbytes += self.exposure_map.data.nbytes
+
+        return nbytes
+
     # TODO: add mask safe to IRFMap as a regular attribute and don't derive it from the data
     @property
     def mask_safe_image(self):
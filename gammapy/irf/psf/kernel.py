@@ -1,6 +1,7 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import html
 import numpy as np
+import scipy.fft
 import astropy.units as u
 import matplotlib.pyplot as plt
 from gammapy.maps import Map
@@ -57,10 +58,17 @@ class PSFKernel:
 
     def __init__(self, psf_kernel_map, normalize=True):
         self._psf_kernel_map = psf_kernel_map
+        self._rfft_cache = {}
 
         if normalize:
             self.normalize()
 
+    def __getstate__(self):
+        # the cached transforms are not pickled, copied or deep copied
+        state = self.__dict__.copy()
+        state["_rfft_cache"] = {}
+        return state
+
     def _repr_html_(self):
         try:
             return self.to_html()
@@ -79,6 +87,34 @@ class PSFKernel:
             data = np.nan_to_num(data / data.sum(axis=axis, keepdims=True))
             self.psf_kernel_map.data = data
 
+        self._rfft_cache = {}
+
+    def _rfft(self, shape):
+        """Real Fourier transform of the kernel planes zero padded to a given shape.
+
+        The result is cached for each shape, together with a copy of the kernel
+        data. It is computed again if the kernel data was modified.
+
+        Parameters
+        ----------
+        shape : tuple of int
+            Spatial shape of the transform.
+
+        Returns
+        -------
+        data : `~numpy.ndarray`
+            Fourier transform of the kernel planes.
+        """
+        shape = tuple(shape)
+        data = self.psf_kernel_map.data
+        cached = self._rfft_cache.get(shape)
+
+        if cached is None or not np.array_equal(cached[0], data):
+            data_fft = scipy.fft.rfftn(data.astype(np.float32), s=shape, axes=(-2, -1))
+            cached = self._rfft_cache[shape] = (data.copy(), data_fft)
+
+        return cached[1]
+
     @property
     def data(self):
         """Access the PSFKernel numpy array."""
@@ -101,6 +101,15 @@ def make_test_psfmap(size, shape="gauss"):
     return make_psf_map(psf, pointing, geom, exposure_map)
 
 
+def test_psf_map_nbytes():
+    psfmap = make_test_psfmap(0.15 * u.deg)
+    expected = psfmap.psf_map.data.nbytes + psfmap.exposure_map.data.nbytes
+    assert psfmap.nbytes == expected
+
+    psfmap.exposure_map = None
+    assert psfmap.nbytes == psfmap.psf_map.data.nbytes
+
+
 def test_psf_map_containment_radius():
     psf_map = make_test_psfmap(0.15 * u.deg)
     psf = fake_psf3d(0.15 * u.deg)
@@ -1,5 +1,8 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import logging
+import queue
+import threading
+import time
 from astropy.coordinates import Angle
 import gammapy.utils.parallel as parallel
 from gammapy.datasets import Datasets, MapDataset, MapDatasetOnOff, SpectrumDataset
@@ -13,6 +16,95 @@ __all__ = [
     "DatasetsMaker",
 ]
 
+_PREFETCH_DONE = object()
+
+
+class _ObservationsPrefetcher:
+    """Load observations in memory in a background thread.
+
+    The observations of the (dataset, observation) input pairs are loaded with
+    ``Observation.copy(in_memory=True)`` and queued, at most ``depth`` in advance
+    of the pair being processed. The time spent waiting for the loading and the
+    time spent by the caller between two pairs are recorded.
+
+    Parameters
+    ----------
+    inputs : list of tuple
+        Dataset and observation pairs.
+    depth : int
+        Maximum number of observations loaded in advance.
+    """
+
+    def __init__(self, inputs, depth):
+        self.inputs = inputs
+        self.depth = depth
+        self.n_observations = 0
+        self.io_wait_time = 0.0
+        self.compute_time = 0.0
+        self._queue = queue.Queue(maxsize=depth)
+        self._stop = threading.Event()
+
+    def __len__(self):
+        return len(self.inputs)
+
+    @property
+    def info(self):
+        """Prefetch statistics (dict)."""
+        return {
+            "n_observations": self.n_observations,
+            "io_wait_time": self.io_wait_time,
+            "compute_time": self.compute_time,
+        }
+
+    def _put(self, item):
+        """Put an item in the queue, unless iterating was stopped."""
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _load(self):
+        try:
+            for dataset, observation in self.inputs:
+                if not self._put((dataset, observation.copy(in_memory=True))):
+                    return
+        except Exception as error:
+            self._put(error)
+        else:
+            self._put(_PREFETCH_DONE)
+
+    def __iter__(self):
+        thread = threading.Thread(target=self._load, daemon=True)
+        thread.start()
+
+        try:
+            while True:
+                start = time.perf_counter()
+                item = self._queue.get()
+                self.io_wait_time += time.perf_counter() - start
+
+                if item is _PREFETCH_DONE:
+                    break
+
+                if isinstance(item, Exception):
+                    raise item
+
+                start = time.perf_counter()
+                yield item
+                self.compute_time += time.perf_counter() - start
+                self.n_observations += 1
+        finally:
+            self._stop.set()
+            thread.join()
+            log.info(
+                f"Prefetched {self.n_observations} observations, waited "
+                f"{self.io_wait_time:.2f} s for I/O and computed "
+                f"{self.compute_time:.2f} s"
+            )
+
 
 class DatasetsMaker(Maker, parallel.ParallelMixin):
     """Run makers in a chain.
@@ -37,9 +129,15 @@ class DatasetsMaker(Maker, parallel.ParallelMixin):
         If None it returns an error, except if the list of makers includes a `SafeMaskMaker`
         with the offset-max method defined. In that case it is set to two times `offset_max`.
         Default is None.
-    parallel_backend : {'multiprocessing', 'ray'}, optional
+    parallel_backend : {'multiprocessing', 'ray', 'threads'}, optional
         Which backend to use for multiprocessing.
         Default is None.
+    prefetch : int, optional
+        Number of observations loaded in memory in advance by a background thread,
+        while the current one is reduced. Only used when the observations are
+        processed one after another, i.e. ``n_jobs=1``. The time spent waiting
+        for the data versus reducing it is given by `prefetch_info`.
+        Default is 0, which disables prefetching.
     """
 
     tag = "DatasetsMaker"
@@ -52,6 +150,7 @@ class DatasetsMaker(Maker, parallel.ParallelMixin):
         cutout_mode="trim",
         cutout_width=None,
         parallel_backend=None,
+        prefetch=0,
     ):
         self.log = logging.getLogger(__name__)
         self.makers = makers
@@ -72,9 +171,31 @@ class DatasetsMaker(Maker, parallel.ParallelMixin):
         self.n_jobs = n_jobs
         self.parallel_backend = parallel_backend
         self.stack_datasets = stack_datasets
+        self.prefetch = prefetch
 
         self._datasets = []
         self._error = False
+        self._prefetcher = None
+
+    @property
+    def prefetch_info(self):
+        """Statistics of the last prefetching run (dict), None if not used.
+
+        Contains the number of observations, the time spent waiting for the
+        observations to be loaded and the time spent reducing them, in seconds.
+        """
+        if self._prefetcher is not None:
+            return self._prefetcher.info
+
+    def _iter_inputs(self, datasets, observations, n_jobs):
+        """Dataset and observation pairs, prefetched if enabled and run sequentially."""
+        inputs = zip(datasets, observations)
+
+        if self.prefetch > 0 and n_jobs == 1:
+            self._prefetcher = _ObservationsPrefetcher(list(inputs), self.prefetch)
+            return self._prefetcher
+
+        return inputs
 
     @property
     def offset_max(self):
@@ -135,6 +256,66 @@ class DatasetsMaker(Maker, parallel.ParallelMixin):
         # parallel run could cause a memory error with non-explicit message.
         self._error = True
 
+    def _check_reference_dataset(self, dataset, datasets=None):
+        """Check the reference dataset and whether cutouts can be applied."""
+        if isinstance(dataset, MapDataset):
+            # also valid for Spectrum as it inherits from MapDataset
+            self._dataset = dataset
+        else:
+            raise TypeError("Invalid reference dataset.")
+
+        if isinstance(dataset, SpectrumDataset):
+            self._apply_cutout = False
+
+        if datasets is not None:
+            self._apply_cutout = False
+
+    def run_iter(self, dataset, observations, datasets=None):
+        """Run data reduction and yield the datasets one by one.
+
+        Contrary to `run`, the datasets are neither stacked nor kept in memory.
+        Each dataset is yielded, in the order of the observations, as soon as it
+        is reduced, so that it can be stacked or written to disk right away.
+
+        Parameters
+        ----------
+        dataset : `~gammapy.datasets.MapDataset`
+            Reference dataset.
+        observations : `Observations`
+            Observations.
+        datasets : `~gammapy.datasets.Datasets`
+            Base datasets, if provided its length must be the same as the observations.
+
+        Yields
+        ------
+        dataset : `~gammapy.datasets.MapDataset`
+            Dataset for each observation.
+
+        Examples
+        --------
+        ::
+
+            maker = DatasetsMaker(makers, n_jobs=4)
+
+            for dataset in maker.run_iter(dataset_empty, observations):
+                dataset.write(f"dataset_{dataset.name}.fits.gz")
+        """
+        self._check_reference_dataset(dataset, datasets)
+
+        if datasets is None:
+            datasets = len(observations) * [dataset]
+
+        n_jobs = min(self.n_jobs, len(observations))
+
+        yield from parallel.run_multiprocessing(
+            self.make_dataset,
+            self._iter_inputs(datasets, observations, n_jobs),
+            backend=self.parallel_backend,
+            pool_kwargs=dict(processes=n_jobs),
+            method="imap",
+            task_name="Data reduction",
+        )
+
     def run(self, dataset, observations, datasets=None):
         """Run data reduction.
 
@@ -153,25 +334,20 @@ class DatasetsMaker(Maker, parallel.ParallelMixin):
             Datasets.
 
         """
-        if isinstance(dataset, MapDataset):
-            # also valid for Spectrum as it inherits from MapDataset
-            self._dataset = dataset
-        else:
-            raise TypeError("Invalid reference dataset.")
+        self._check_reference_dataset(dataset, datasets)
 
-        if isinstance(dataset, SpectrumDataset):
-            self._apply_cutout = False
-
-        if datasets is not None:
-            self._apply_cutout = False
-        else:
+        if datasets is None:
+            backend = parallel.ParallelBackendEnum.from_str(self.parallel_backend)
+            if backend == parallel.ParallelBackendEnum.threads and self.stack_datasets:
+                # the reference dataset is stacked in place while threads read it
+                dataset = dataset.copy(name=dataset.name)
             datasets = len(observations) * [dataset]
 
         n_jobs = min(self.n_jobs, len(observations))
 
         parallel.run_multiprocessing(
             self.make_dataset,
-            zip(datasets, observations),
+            self._iter_inputs(datasets, observations, n_jobs),
             backend=self.parallel_backend,
             pool_kwargs=dict(processes=n_jobs),
             method="apply_async",
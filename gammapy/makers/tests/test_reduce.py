@@ -5,6 +5,7 @@ from numpy.testing import assert_allclose
 import astropy.units as u
 from astropy.coordinates import Angle, SkyCoord
 from regions import CircleSkyRegion, PointSkyRegion
+import gammapy.utils.parallel as parallel
 from gammapy.data import DataStore, Observation
 from gammapy.datasets import MapDataset, SpectrumDataset
 from gammapy.makers import (
@@ -222,6 +223,90 @@ def test_datasets_maker_map(pars, observations_cta, makers_map, map_dataset):
         assert_allclose(exposure.data.mean(), 2.436063e09, rtol=3e-3)
 
 
+@requires_data()
+def test_datasets_maker_map_run_iter(observations_cta, makers_map, map_dataset):
+    makers = DatasetsMaker(
+        makers_map,
+        stack_datasets=False,
+        cutout_mode="partial",
+        n_jobs=2,
+    )
+
+    datasets = list(makers.run_iter(map_dataset, observations_cta))
+    assert len(datasets) == 3
+
+    obs_ids = [d.meta_table["OBS_ID"][0] for d in datasets]
+    assert obs_ids == [obs.obs_id for obs in observations_cta]
+
+    counts = datasets[0].counts
+    assert_allclose(counts.data.sum(), 26318, rtol=1e-5)
+
+
+@requires_data()
+def test_datasets_maker_map_shared_memory(
+    monkeypatch, observations_cta, makers_map, map_dataset
+):
+    import multiprocessing
+
+    # make sure the pool is used even on single core machines
+    monkeypatch.setattr(multiprocessing, "cpu_count", lambda: 2)
+    # share all arrays, including the small ones of the reference dataset
+    monkeypatch.setattr(parallel, "SHARED_MEMORY_MIN_BYTES", 0)
+
+    shared = []
+    share = parallel.SharedMemoryRegistry.share
+
+    def share_spy(registry, array):
+        shared.append(array.nbytes)
+        return share(registry, array)
+
+    monkeypatch.setattr(parallel.SharedMemoryRegistry, "share", share_spy)
+
+    makers = DatasetsMaker(
+        makers_map,
+        stack_datasets=True,
+        cutout_mode="partial",
+        cutout_width=None,
+        n_jobs=2,
+        parallel_backend="multiprocessing",
+    )
+
+    with parallel.multiprocessing_manager(shared_memory=True):
+        datasets = makers.run(map_dataset, observations_cta)
+
+    assert len(shared) > 0
+
+    counts = datasets[0].counts
+    assert_allclose(counts.data.sum(), 46716, rtol=1e-5)
+
+    exposure = datasets[0].exposure
+    assert_allclose(exposure.data.mean(), 1.350841e09, rtol=3e-3)
+
+
+@requires_data()
+def test_datasets_maker_map_prefetch(observations_cta, makers_map, map_dataset):
+    makers = DatasetsMaker(
+        makers_map,
+        stack_datasets=False,
+        cutout_mode="partial",
+        n_jobs=1,
+        prefetch=2,
+    )
+    assert makers.prefetch_info is None
+
+    datasets = makers.run(map_dataset, observations_cta)
+    assert len(datasets) == 3
+
+    obs_ids = [d.meta_table["OBS_ID"][0] for d in datasets]
+    assert obs_ids == [obs.obs_id for obs in observations_cta]
+    assert_allclose(datasets[0].counts.data.sum(), 26318, rtol=1e-5)
+
+    info = makers.prefetch_info
+    assert info["n_observations"] == 3
+    assert info["io_wait_time"] >= 0
+    assert info["compute_time"] > 0
+
+
 @requires_data()
 def test_failure_datasets_maker_map(
     observations_cta_with_issue, makers_map, map_dataset
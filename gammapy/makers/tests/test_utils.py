@@ -1,7 +1,7 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import pytest
 import numpy as np
-from numpy.testing import assert_allclose
+from numpy.testing import assert_allclose, assert_equal
 from astropy import units as u
 from astropy.coordinates import SkyCoord
 from astropy.table import Table
@@ -21,12 +21,13 @@ from gammapy.irf import (
     EffectiveAreaTable2D,
     EnergyDispersion2D,
 )
-from gammapy.makers import WobbleRegionsFinder
+from gammapy.makers import MapDatasetMaker, WobbleRegionsFinder
 from gammapy.makers.utils import (
     _map_spectrum_weight,
     guess_instrument_fov,
     make_counts_off_rad_max,
     make_counts_rad_max,
+    make_counts_stream,
     make_edisp_kernel_map,
     make_effective_livetime_map,
     make_map_background_irf,
@@ -34,7 +35,7 @@ from gammapy.makers.utils import (
     make_observation_time_map,
     make_theta_squared_table,
 )
-from gammapy.maps import HpxGeom, MapAxis, RegionGeom, WcsGeom, WcsNDMap
+from gammapy.maps import HpxGeom, Map, MapAxis, RegionGeom, WcsGeom, WcsNDMap
 from gammapy.modeling.models import ConstantSpectralModel
 from gammapy.utils.testing import requires_data
 from gammapy.utils.time import time_ref_to_dict
@@ -455,6 +456,38 @@ def test_make_counts_rad_max(observations):
     assert_allclose(np.squeeze(counts.data), np.array([547, 188, 52, 8, 0, 0]))
 
 
+@requires_data()
+@pytest.mark.parametrize("geom_type", ["wcs", "hpx"])
+def test_make_counts_stream(geom_type):
+    datastore = DataStore.from_dir("$GAMMAPY_DATA/hess-dl3-dr1/")
+    observations = datastore.get_observations([23523, 23526])
+
+    energy_axis = MapAxis.from_energy_bounds(1, 10, nbin=3, unit="TeV")
+    skydir = SkyCoord(83.63, 22.01, unit="deg")
+
+    if geom_type == "wcs":
+        geom = WcsGeom.create(
+            skydir=skydir, width=4, binsz=0.05, frame="galactic", axes=[energy_axis]
+        )
+    else:
+        geom = HpxGeom.create(
+            skydir=skydir, width=4, nside=256, frame="icrs", axes=[energy_axis]
+        )
+
+    with pytest.warns(UserWarning, match="compressed"):
+        counts = make_counts_stream(observations, geom, chunk_size=1000)
+
+    expected = Map.from_geom(geom)
+    for obs in observations:
+        expected.data += MapDatasetMaker.make_counts(geom, obs).data
+
+    assert counts.data.sum() > 0
+    assert_equal(counts.data, expected.data)
+
+    with pytest.raises(TypeError):
+        make_counts_stream(observations, RegionGeom.create("icrs;circle(0, 0, 1)"))
+
+
 @requires_data()
 def test_make_counts_off_rad_max(observations):
     pos = SkyCoord(83.6331, +22.0145, unit="deg", frame="icrs")
@@ -1,5 +1,6 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import logging
+from itertools import repeat
 import numpy as np
 import astropy.units as u
 from astropy.coordinates import Angle
@@ -7,17 +8,20 @@ from astropy.coordinates.erfa_astrom import erfa_astrom, ErfaAstromInterpolator
 from astropy.table import Table
 from astropy.time import Time
 from gammapy.data import FixedPointingInfo, PointingMode
+from gammapy.data.io import EventListReader
 from gammapy.irf import EDispMap, FoVAlignment, PSFMap
 from gammapy.maps import Map, RegionNDMap, MapAxis
 from gammapy.maps.utils import broadcast_axis_values_to_geom
 from gammapy.modeling.models import PowerLawSpectralModel
 from gammapy.stats import WStatCountsStatistic
+import gammapy.utils.parallel as parallel
 from gammapy.utils.coordinates import FoVICRSFrame, FoVAltAzFrame
 from gammapy.utils.regions import compound_region_to_regions
 
 __all__ = [
     "make_counts_off_rad_max",
     "make_counts_rad_max",
+    "make_counts_stream",
     "make_edisp_kernel_map",
     "make_edisp_map",
     "make_map_background_irf",
@@ -32,6 +36,7 @@ log = logging.getLogger(__name__)
 
 MINIMUM_TIME_STEP = 1 * u.s  # Minimum time step used to handle FoV rotations
 EARTH_ANGULAR_VELOCITY = 360 * u.deg / u.day
+EVENTS_CHUNK_SIZE = 1_000_000  # Number of events read at once by `make_counts_stream`
 
 
 def _compute_rotation_time_steps(
@@ -514,6 +519,90 @@ def make_counts_rad_max(geom, rad_max, events):
     return counts
 
 
+def _make_counts_stream_observation(observation, geom, chunk_size):
+    """Fill the counts of one observation, reading its events in chunks."""
+    counts = Map.from_geom(geom)
+    hdu_location = observation.events_hdu_location
+
+    if hdu_location is None:
+        counts.fill_events(observation.events)
+        return counts
+
+    reader = EventListReader(hdu=hdu_location.hdu_name)
+
+    for events in reader.iter_chunks(hdu_location.path(), chunk_size=chunk_size):
+        counts.fill_events(observation.obs_filter.filter_events(events))
+
+    return counts
+
+
+def make_counts_stream(
+    observations,
+    geom,
+    chunk_size=EVENTS_CHUNK_SIZE,
+    n_jobs=None,
+    parallel_backend=None,
+):
+    """Make the counts cube of many observations, streaming their events.
+
+    Contrary to `~gammapy.makers.MapDatasetMaker.make_counts`, the event lists
+    are not loaded at once: the events HDU of each observation is read from
+    the file in chunks of ``chunk_size`` rows, which are binned directly into
+    the counts cube. The observation filters are applied to each chunk.
+    Observations whose events are not read from a file are filled from
+    `~gammapy.data.Observation.events`. Compressed files cannot be read in
+    chunks: their events HDU is decompressed in memory at once, with a warning,
+    and only the binning is done in chunks. The counts of each observation are
+    added to the total as soon as they are available, instead of keeping one
+    map per observation in memory.
+
+    The counts of each observation are identical to the ones given by
+    `~gammapy.makers.MapDatasetMaker.make_counts`.
+
+    Parameters
+    ----------
+    observations : `~gammapy.data.Observations`
+        Observations to fill the counts from.
+    geom : `~gammapy.maps.WcsGeom` or `~gammapy.maps.HpxGeom`
+        Reference geometry.
+    chunk_size : int, optional
+        Maximum number of events read at once. Default is `EVENTS_CHUNK_SIZE`.
+    n_jobs : int, optional
+        Number of processes used to run over the observations in parallel.
+        Default is one, unless `~gammapy.utils.parallel.N_JOBS_DEFAULT` was modified.
+    parallel_backend : {'multiprocessing', 'ray', 'threads'}, optional
+        Which backend to use for multiprocessing. Default is None.
+
+    Returns
+    -------
+    counts : `~gammapy.maps.Map`
+        Counts summed over all observations.
+    """
+    if geom.is_region:
+        raise TypeError("Streaming counts only supports WcsGeom and HpxGeom")
+
+    if n_jobs is None:
+        n_jobs = parallel.N_JOBS_DEFAULT
+
+    n_jobs = max(min(n_jobs, len(observations)), 1)
+
+    counts_obs = parallel.run_multiprocessing(
+        _make_counts_stream_observation,
+        zip(observations, repeat(geom), repeat(chunk_size)),
+        backend=parallel_backend,
+        pool_kwargs=dict(processes=n_jobs),
+        method="imap",
+        task_name="Streaming counts",
+    )
+
+    counts = Map.from_geom(geom)
+
+    for counts_ob in counts_obs:
+        counts.data += counts_ob.data
+
+    return counts
+
+
 def make_counts_off_rad_max(geom_off, rad_max, events):
     """Extract the OFF counts from a list of point regions and given rad max.
 
@@ -40,6 +40,33 @@ def test_map_fill_events_wcs(events):
     assert_allclose(m.data.sum(), 0.5)
 
 
+@pytest.mark.parametrize("frame", ["icrs", "galactic"])
+def test_map_fill_events_wcs_chunks(monkeypatch, frame):
+    import gammapy.maps.wcs.ndmap as ndmap
+
+    rng = np.random.default_rng(0)
+    n_events = 1000
+
+    t = Table()
+    t["RA"] = rng.uniform(264, 268, n_events) * u.deg
+    t["DEC"] = rng.uniform(-31, -27, n_events) * u.deg
+    t["ENERGY"] = rng.uniform(0.5, 20, n_events) * u.TeV
+    events = EventList(t)
+    weights = rng.uniform(0, 1, n_events)
+
+    axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=3)
+    skydir = {"icrs": (266.4, -29), "galactic": (0, 0)}[frame]
+    m_ref = Map.create(skydir=skydir, binsz=0.1, width=3, frame=frame, axes=[axis])
+    m_ref.fill_by_coord(events.map_coord(m_ref.geom), weights=weights)
+
+    monkeypatch.setattr(ndmap, "FILL_EVENTS_CHUNK_SIZE", 300)
+    m = Map.from_geom(m_ref.geom)
+    m.fill_events(events, weights=weights)
+
+    assert m.data.sum() > 0
+    assert_allclose(m.data, m_ref.data)
+
+
 @requires_dependency("healpy")
 def test_map_fill_events_hpx(events):
     # 2D map
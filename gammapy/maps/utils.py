@@ -1,7 +1,8 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+import functools
 import numpy as np
 from astropy import units as u
-from astropy.coordinates import Angle
+from astropy.coordinates import Angle, SkyCoord
 from astropy.time import Time
 
 
@@ -131,3 +132,23 @@ def broadcast_axis_values_to_geom(geom, axis_name, use_center=True):
         return geom.axes[axis_name].center.reshape(broadcast_shape)
     else:
         return geom.axes[axis_name].edges.reshape(broadcast_shape)
+
+
+@functools.lru_cache(maxsize=None)
+def _icrs_rotation_matrix(frame):
+    """Rotation matrix from ICRS to a given sky frame, computed with astropy."""
+    basis = SkyCoord([0, 90, 0], [0, 0, 90], unit="deg", frame="icrs")
+    return basis.transform_to(frame).cartesian.xyz.value
+
+
+def _icrs_to_frame(ra, dec, frame):
+    """Transform ICRS coordinates in deg to a given sky frame without `SkyCoord`."""
+    if frame == "icrs":
+        return ra, dec
+
+    ra, dec = np.deg2rad(ra), np.deg2rad(dec)
+    xyz = np.stack([np.cos(dec) * np.cos(ra), np.cos(dec) * np.sin(ra), np.sin(dec)])
+    x, y, z = _icrs_rotation_matrix(frame) @ xyz
+    lon = np.mod(np.rad2deg(np.arctan2(y, x)), 360)
+    lat = np.rad2deg(np.arcsin(np.clip(z, -1, 1)))
+    return lon, lat
@@ -2,6 +2,7 @@
 import logging
 from itertools import repeat
 import numpy as np
+import scipy.fft
 import scipy.interpolate
 import scipy.ndimage as ndi
 import scipy.signal
@@ -18,7 +19,7 @@ from gammapy.utils.interpolation import ScaledRegularGridInterpolator
 from gammapy.utils.units import unit_from_fits_image_hdu
 from gammapy.visualization.utils import add_colorbar
 from ..geom import pix_tuple_to_idx
-from ..utils import INVALID_INDEX
+from ..utils import INVALID_INDEX, _icrs_to_frame
 from .core import WcsMap
 from .geom import WcsGeom
 
@@ -29,6 +30,11 @@ log = logging.getLogger(__name__)
 
 C_MAP_MASK = mpcolors.ListedColormap(["black", "white"], name="mask")
 
+FILL_EVENTS_CHUNK_SIZE = 1_000_000
+
+# maximum memory of the Fourier transforms of the planes convolved at once
+CONVOLVE_FFT_BLOCK_MAX_BYTES = 64 * 1024**2
+
 
 class WcsNDMap(WcsMap):
     """WCS map with any number of non-spatial dimensions.
@@ -245,6 +251,61 @@ class WcsNDMap(WcsMap):
     def fill_by_idx(self, idx, weights=None):
         return self._resample_by_idx(idx, weights=weights, preserve_counts=True)
 
+    def fill_events(self, events, weights=None):
+        """Fill the map from an `~gammapy.data.EventList` object.
+
+        For maps with a regular geometry, the event coordinates are converted
+        to pixel indices directly from the table columns, bypassing
+        `~astropy.coordinates.SkyCoord`, and the events are processed in chunks
+        of ``FILL_EVENTS_CHUNK_SIZE`` rows. Only the bins occupied by a chunk
+        are accumulated into the map data.
+
+        Parameters
+        ----------
+        events : `~gammapy.data.EventList`
+            Events to fill in the map with.
+        weights : `~numpy.ndarray`, optional
+            Weights vector. The weights vector must be of the same length
+            as the events column length. If None, weights are set to 1.
+            Default is None.
+        """
+        if not self.geom.is_regular:
+            return super().fill_events(events, weights=weights)
+
+        columns = {name.upper(): col for name, col in events.table.columns.items()}
+
+        for axis in self.geom.axes:
+            if axis.name.upper() not in columns:
+                raise KeyError(f"Column not found in event list: {axis.name!r}")
+
+        if isinstance(weights, u.Quantity):
+            weights = weights.to_value(self.unit)
+        elif weights is not None:
+            weights = np.asarray(weights)
+
+        for start in range(0, len(events.table), FILL_EVENTS_CHUNK_SIZE):
+            chunk = slice(start, start + FILL_EVENTS_CHUNK_SIZE)
+            lon, lat = _icrs_to_frame(
+                ra=u.Quantity(columns["RA"][chunk], "deg").value,
+                dec=u.Quantity(columns["DEC"][chunk], "deg").value,
+                frame=self.geom.frame,
+            )
+            pix = list(self.geom.wcs.wcs_world2pix(lon, lat, 0))
+
+            for axis in self.geom.axes:
+                coord = u.Quantity(columns[axis.name.upper()][chunk]).to(axis.unit)
+                pix.append(axis.coord_to_pix(coord))
+
+            idx = self.geom.pix_to_idx(pix)
+            valid = np.all(np.stack([t != INVALID_INDEX.int for t in idx]), axis=0)
+            idx = np.ravel_multi_index([t[valid] for t in idx[::-1]], self.data.shape)
+
+            idx, idx_inv = np.unique(idx, return_inverse=True)
+
+            weights_chunk = None if weights is None else weights[chunk][valid]
+            values = np.bincount(idx_inv, weights=weights_chunk)
+            self.data.flat[idx] += values.astype(self.data.dtype)
+
     def set_by_idx(self, idx, vals):
         idx = pix_tuple_to_idx(idx)
         self.data.T[idx] = vals
@@ -873,7 +934,9 @@ class WcsNDMap(WcsMap):
         kernel : `~gammapy.irf.PSFKernel` or `numpy.ndarray`
             Convolution kernel.
         method : str, optional
-            The method used by `~scipy.signal.convolve`.
+            The method used by `~scipy.signal.convolve`. For 'fft', the image
+            planes are convolved in blocks and the Fourier transform of a
+            `~gammapy.irf.PSFKernel` is cached on the kernel for each map shape.
             Default is 'fft'.
         mode : str, optional
             The convolution mode used by `~scipy.signal.convolve`.
@@ -893,8 +956,10 @@ class WcsNDMap(WcsMap):
                 )
 
         geom = self.geom.copy()
+        psf_kernel = None
 
         if isinstance(kernel, PSFKernel):
+            psf_kernel = kernel
             kmap = kernel.psf_kernel_map
             if not np.allclose(
                 self.geom.pixel_scales.deg, kmap.geom.pixel_scales.deg, rtol=1e-5
@@ -921,6 +986,13 @@ class WcsNDMap(WcsMap):
                     " and kernel {shape_axes_kernel}"
                 )
 
+        if method == "fft" and mode in ["same", "full"]:
+            image = self.data
+            if self.geom.is_image and kernel.ndim == 3:
+                image = image.astype(np.float32)
+            data = self._convolve_fft(image, kernel, mode, psf_kernel=psf_kernel)
+            return self._init_copy(data=data.astype(np.float32), geom=geom)
+
         if self.geom.is_image and kernel.ndim == 3:
             indexes = range(kernel.shape[0])
             images = repeat(self.data.astype(np.float32))
@@ -951,6 +1023,90 @@ class WcsNDMap(WcsMap):
         """Convolve using `~scipy.signal.convolve` without kwargs for parallel evaluation."""
         return scipy.signal.convolve(image, kernel, method=method, mode=mode)
 
+    @staticmethod
+    def _convolve_fft(image, kernel, mode, psf_kernel=None):
+        """Convolve image planes in the Fourier domain.
+
+        Same as `~scipy.signal.fftconvolve` on the last two axes, the image and
+        kernel planes being broadcast against each other. The planes are
+        convolved in blocks, so that the Fourier transforms of a block use at
+        most ``CONVOLVE_FFT_BLOCK_MAX_BYTES``.
+
+        Parameters
+        ----------
+        image : `~numpy.ndarray`
+            Image planes.
+        kernel : `~numpy.ndarray`
+            Kernel planes.
+        mode : {"same", "full"}
+            Convolution mode.
+        psf_kernel : `~gammapy.irf.PSFKernel`, optional
+            Kernel object, used to cache the Fourier transform of the kernel.
+            Default is None.
+
+        Returns
+        -------
+        data : `~numpy.ndarray`
+            Convolved image planes.
+        """
+        shape_image = np.array(image.shape[-2:])
+        shape_full = shape_image + np.array(kernel.shape[-2:]) - 1
+        shape_fft = tuple(
+            scipy.fft.next_fast_len(int(n), real=True) for n in shape_full
+        )
+
+        if mode == "same":
+            start = (shape_full - shape_image) // 2
+            stop = start + shape_image
+        else:
+            start, stop = np.array([0, 0]), shape_full
+
+        def rfftn(data):
+            return scipy.fft.rfftn(data, s=shape_fft, axes=(-2, -1))
+
+        shape_axes = np.broadcast_shapes(image.shape[:-2], kernel.shape[:-2])
+        image = image.reshape((-1,) + image.shape[-2:])
+        kernel = kernel.reshape((-1,) + kernel.shape[-2:])
+
+        if psf_kernel is not None:
+            kernel_fft = psf_kernel._rfft(shape_fft)
+            kernel_fft = kernel_fft.reshape((-1,) + kernel_fft.shape[-2:])
+        elif len(kernel) == 1:
+            kernel_fft = rfftn(kernel)
+        else:
+            kernel_fft = None
+
+        image_fft = rfftn(image) if len(image) == 1 else None
+
+        n_planes = max(len(image), len(kernel))
+        nbytes_plane = 16 * shape_fft[0] * (shape_fft[1] // 2 + 1)
+        block_size = max(CONVOLVE_FFT_BLOCK_MAX_BYTES // nbytes_plane, 1)
+
+        dtype = np.result_type(image.dtype, kernel.dtype, np.float32)
+        data = np.empty((n_planes,) + tuple(stop - start), dtype=dtype)
+
+        for idx in range(0, n_planes, block_size):
+            block = slice(idx, idx + block_size)
+
+            if image_fft is None:
+                image_fft_block = rfftn(image[block])
+            else:
+                image_fft_block = image_fft
+
+            if kernel_fft is None:
+                kernel_fft_block = rfftn(kernel[block])
+            elif len(kernel_fft) == 1:
+                kernel_fft_block = kernel_fft
+            else:
+                kernel_fft_block = kernel_fft[block]
+
+            convolved = scipy.fft.irfftn(
+                image_fft_block * kernel_fft_block, s=shape_fft, axes=(-2, -1)
+            )
+            data[block] = convolved[..., start[0] : stop[0], start[1] : stop[1]]
+
+        return data.reshape(shape_axes + data.shape[-2:])
+
     def smooth(self, width, kernel="gauss", **kwargs):
         """Smooth the map.
 
@@ -1,4 +1,6 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+import copy
+import pickle
 import pytest
 import numpy as np
 from numpy.testing import assert_allclose, assert_equal
@@ -675,6 +677,54 @@ def test_convolve_nd():
     assert_allclose(values_full, values_same, rtol=1e-5)
 
 
+@pytest.mark.parametrize("mode", ["same", "full"])
+@pytest.mark.parametrize("block_max_bytes", [1, 64 * 1024**2])
+def test_convolve_fft_cache(monkeypatch, mode, block_max_bytes):
+    monkeypatch.setattr(
+        "gammapy.maps.wcs.ndmap.CONVOLVE_FFT_BLOCK_MAX_BYTES", block_max_bytes
+    )
+    energy_axis = MapAxis.from_energy_bounds(
+        "1 TeV", "10 TeV", nbin=2, name="energy_true"
+    )
+    geom = WcsGeom.create(binsz=0.05 * u.deg, width=(2, 1.5), axes=[energy_axis])
+    m = Map.from_geom(geom)
+    m.data[:, 10, 12] = 1.0
+    m.data[:, 20, 4] = 2.0
+
+    kernel = PSFKernel.from_gauss(geom, sigma=0.1 * u.deg, max_radius=0.4 * u.deg)
+
+    actual = m.convolve(kernel, mode=mode)
+    desired = m.convolve(kernel, method="direct", mode=mode)
+    assert actual.data.shape == desired.data.shape
+    assert_allclose(actual.data, desired.data, atol=1e-6)
+    assert len(kernel._rfft_cache) == 1
+
+    actual = m.convolve(kernel, mode=mode)
+    assert_allclose(actual.data, desired.data, atol=1e-6)
+    assert len(kernel._rfft_cache) == 1
+
+    image = m.sum_over_axes(keepdims=False)
+    actual = image.convolve(kernel, mode=mode)
+    desired = image.convolve(kernel, method="direct", mode=mode)
+    assert_allclose(actual.data, desired.data, atol=1e-6)
+
+    # the cached transform follows in place modifications of the kernel
+    kernel.psf_kernel_map.data[0] *= 2
+    actual = m.convolve(kernel, mode=mode)
+    desired = m.convolve(kernel, method="direct", mode=mode)
+    assert_allclose(actual.data, desired.data, atol=1e-6)
+    assert len(kernel._rfft_cache) == 1
+
+    # the cached transforms are not pickled or copied
+    assert pickle.loads(pickle.dumps(kernel))._rfft_cache == {}
+    assert copy.deepcopy(kernel)._rfft_cache == {}
+    assert copy.copy(kernel)._rfft_cache == {}
+    assert len(kernel._rfft_cache) == 1
+
+    kernel.normalize()
+    assert len(kernel._rfft_cache) == 0
+
+
 def test_convolve_pixel_scale_error():
     m = WcsNDMap.create(binsz=0.05 * u.deg, width=5 * u.deg)
     kgeom = WcsGeom.create(binsz=0.04 * u.deg, width=0.5 * u.deg)
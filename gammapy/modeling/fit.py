@@ -1,9 +1,11 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+import copy
 import html
 import itertools
 import logging
 import numpy as np
 from astropy.table import Table
+import gammapy.utils.parallel as parallel
 from gammapy.utils.pbar import progress_bar
 from gammapy.modeling.utils import _parse_datasets
 from .covariance import Covariance
@@ -66,7 +68,95 @@ class Registry:
 registry = Registry()
 
 
-class Fit:
+def _neighbour_values(solved, idx):
+    """Parameter values of an already solved neighbour of a grid point, if any."""
+    for axis in reversed(range(len(idx))):
+        neighbour = idx[:axis] + (idx[axis] - 1,) + idx[axis + 1 :]
+        if neighbour in solved:
+            return solved[neighbour]
+
+
+def _stat_scan(
+    fit,
+    datasets,
+    scan_idx,
+    values,
+    grid_idx,
+    reoptimize,
+    warm_start,
+    sequential=True,
+    desc=None,
+):
+    """Compute the fit statistic at a list of points of a parameter grid.
+
+    Parameters
+    ----------
+    fit : `Fit`
+        Fit used to re-optimize the other parameters.
+    datasets : `Datasets`
+        Datasets.
+    scan_idx : list of int
+        Indices of the scanned parameters in ``datasets.parameters``.
+    values : `~numpy.ndarray`
+        Values of the scanned parameters, with shape (n_points, n_scanned).
+    grid_idx : list of tuple
+        Grid indices of the points.
+    reoptimize : bool
+        Re-optimize the other parameters at each point.
+    warm_start : bool
+        Start the optimization from the solution of an already solved neighbour.
+    sequential : bool, optional
+        Whether the scan is run in the main process. If False, no progress bar
+        is displayed and the Minuit objects are not kept. Default is True.
+    desc : str, optional
+        Progress bar description. Default is None.
+
+    Returns
+    -------
+    stats, fit_results : list
+        Fit statistic values and optimization results.
+    """
+    parameters = datasets.parameters
+    scan_parameters = [parameters[idx] for idx in scan_idx]
+    initial = [par.value for par in parameters]
+
+    if sequential:
+        values = progress_bar(values, desc=desc)
+
+    stats, fit_results, solved = [], [], {}
+
+    with parameters.restore_status():
+        for point, idx in zip(values, grid_idx):
+            if reoptimize:
+                start = _neighbour_values(solved, idx) if warm_start else None
+
+                for par, value in zip(parameters, start or initial):
+                    par.value = value
+
+            for par, value in zip(scan_parameters, point):
+                par.value = value
+
+            if reoptimize:
+                for par in scan_parameters:
+                    par.frozen = True
+
+                result = fit.optimize(datasets=datasets)
+                stat = result.total_stat
+                solved[idx] = [par.value for par in parameters]
+
+                if not sequential:
+                    result._minuit = None
+
+                fit_results.append(result)
+            else:
+                stat = datasets.stat_sum()
+
+            stats.append(stat)
+
+    return stats, fit_results
+
+
+class Fit(parallel.ParallelMixin):
     """Fit class.
 
     The fit class provides a uniform interface to multiple fitting backends.
@@ -81,6 +171,9 @@ class Fit:
         see https://iminuit.readthedocs.io/en/stable/reference.html#iminuit.Minuit
         for a detailed description of the available options. If there is an entry
         'migrad_opts', those options will be passed to `iminuit.Minuit.migrad()`.
+        If the entry 'use_gradient' is True, the analytical derivatives of the
+        statistic are passed to Minuit when the datasets and models support it,
+        see `~gammapy.datasets.Datasets.has_stat_sum_gradient`.
 
         For the `"sherpa"` backend you can from the options:
 
@@ -111,6 +204,12 @@ class Fit:
         interval can be adapted by modifying the upper bound of the interval (``b``) value.
     store_trace : bool
         Whether to store the trace of the fit.
+    n_jobs : int, optional
+        Number of processes used to compute the points of `stat_profile` and
+        `stat_surface` in parallel. Default is one, unless
+        `~gammapy.utils.parallel.N_JOBS_DEFAULT` was modified.
+    parallel_backend : {'multiprocessing', 'ray', 'threads'}, optional
+        Which backend to use for multiprocessing. Default is None.
     """
 
     def __init__(
@@ -120,6 +219,8 @@ class Fit:
         covariance_opts=None,
         confidence_opts=None,
         store_trace=False,
+        n_jobs=None,
+        parallel_backend=None,
     ):
         self.store_trace = store_trace
         self.backend = backend
@@ -136,8 +237,16 @@ class Fit:
         self.optimize_opts = optimize_opts
         self.covariance_opts = covariance_opts
         self.confidence_opts = confidence_opts
+        self.n_jobs = n_jobs
+        self.parallel_backend = parallel_backend
         self._minuit = None
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # the Minuit object of the last optimization is not sent to other processes
+        state["_minuit"] = None
+        return state
+
     def _repr_html_(self):
         try:
             return self.to_html()
@@ -206,6 +315,20 @@ class Fit:
         backend = kwargs.pop("backend", self.backend)
 
         compute = registry.get("optimize", backend)
+
+        if kwargs.pop("use_gradient", False):
+            if backend != "minuit":
+                log.warning(
+                    f"Analytical gradient not supported by the {backend!r} backend."
+                )
+            elif datasets.has_stat_sum_gradient:
+                kwargs["gradient"] = datasets.stat_sum_gradient
+            else:
+                log.warning(
+                    "Analytical gradient not supported by the datasets or models,"
+                    " using the numerical gradient."
+                )
+
         # TODO: change this calling interface!
         # probably should pass a fit statistic, which has a model, which has parameters
         # and return something simpler, not a tuple of three things
@@ -349,7 +472,63 @@ class Fit:
         result["errn"] *= parameter.scale
         return result
 
-    def stat_profile(self, datasets, parameter, reoptimize=False):
+    def _stat_scan(
+        self, datasets, scan_parameters, values, grid_idx, reoptimize, warm_start, desc
+    ):
+        """Compute the fit statistic on a grid, splitting the points over workers."""
+        parameters = datasets.parameters
+        scan_idx = [parameters.index(par) for par in scan_parameters]
+
+        n_jobs = min(self.n_jobs, len(values))
+
+        if n_jobs <= 1:
+            return _stat_scan(
+                self,
+                datasets,
+                scan_idx,
+                values,
+                grid_idx,
+                reoptimize,
+                warm_start,
+                desc=desc,
+            )
+
+        backend = parallel.ParallelBackendEnum.from_str(self.parallel_backend)
+
+        inputs = []
+        for chunk in np.array_split(np.arange(len(values)), n_jobs):
+            if backend == parallel.ParallelBackendEnum.threads:
+                # threads share memory, each of them needs its own datasets
+                datasets_chunk = datasets.copy()
+            else:
+                datasets_chunk = datasets
+
+            inputs.append(
+                (
+                    copy.copy(self),
+                    datasets_chunk,
+                    scan_idx,
+                    values[chunk],
+                    [grid_idx[idx] for idx in chunk],
+                    reoptimize,
+                    warm_start,
+                    False,
+                )
+            )
+
+        results = parallel.run_multiprocessing(
+            _stat_scan,
+            inputs,
+            backend=self.parallel_backend,
+            pool_kwargs=dict(processes=n_jobs),
+            task_name=desc,
+        )
+
+        stats = list(itertools.chain(*[result[0] for result in results]))
+        fit_results = list(itertools.chain(*[result[1] for result in results]))
+        return stats, fit_results
+
+    def stat_profile(self, datasets, parameter, reoptimize=False, warm_start=True):
         """Compute fit statistic profile.
 
         The method used is to vary one parameter, keeping all others fixed.
@@ -368,6 +547,10 @@ class Fit:
             and number of values is taken from the parameter object.
         reoptimize : bool, optional
             Re-optimize other parameters, when computing the confidence region. Default is False.
+        warm_start : bool, optional
+            When re-optimizing, start the fit of each scan value from the solution
+            of the previous one. Otherwise start from the current parameter values.
+            Default is True.
 
         Returns
         -------
@@ -399,19 +582,15 @@ class Fit:
         parameter = parameters[parameter]
         values = parameter.scan_values
 
-        stats = []
-        fit_results = []
-        with parameters.restore_status():
-            for value in progress_bar(values, desc="Scan values"):
-                parameter.value = value
-                if reoptimize:
-                    parameter.frozen = True
-                    result = self.optimize(datasets=datasets)
-                    stat = result.total_stat
-                    fit_results.append(result)
-                else:
-                    stat = datasets.stat_sum()
-                stats.append(stat)
+        stats, fit_results = self._stat_scan(
+            datasets=datasets,
+            scan_parameters=[parameter],
+            values=np.reshape(values, (-1, 1)),
+            grid_idx=[(idx,) for idx in range(len(values))],
+            reoptimize=reoptimize,
+            warm_start=warm_start,
+            desc="Scan values",
+        )
 
         idx = datasets.parameters.index(parameter)
         name = datasets.models.parameters_unique_names[idx]
@@ -422,7 +601,7 @@ class Fit:
             "fit_results": fit_results,
         }
 
-    def stat_surface(self, datasets, x, y, reoptimize=False):
+    def stat_surface(self, datasets, x, y, reoptimize=False, warm_start=True):
         """Compute fit statistic surface.
 
         The method used is to vary two parameters, keeping all others fixed.
@@ -444,6 +623,10 @@ class Fit:
             Parameters of interest.
         reoptimize : bool, optional
             Re-optimize other parameters, when computing the confidence region. Default is False.
+        warm_start : bool, optional
+            When re-optimizing, start the fit of each grid point from the solution
+            of an already solved neighbouring point. Otherwise start from the
+            current parameter values. Default is True.
 
         Returns
         -------
@@ -483,26 +666,17 @@ class Fit:
         x = parameters[x]
         y = parameters[y]
 
-        stats = []
-        fit_results = []
-
-        with parameters.restore_status():
-            for x_value, y_value in progress_bar(
-                itertools.product(x.scan_values, y.scan_values), desc="Trial values"
-            ):
-                x.value, y.value = x_value, y_value
-
-                if reoptimize:
-                    x.frozen, y.frozen = True, True
-                    result = self.optimize(datasets=datasets)
-                    stat = result.total_stat
-                    fit_results.append(result)
-                else:
-                    stat = datasets.stat_sum()
-
-                stats.append(stat)
-
         shape = (len(x.scan_values), len(y.scan_values))
+
+        stats, fit_results = self._stat_scan(
+            datasets=datasets,
+            scan_parameters=[x, y],
+            values=np.array(list(itertools.product(x.scan_values, y.scan_values))),
+            grid_idx=list(np.ndindex(shape)),
+            reoptimize=reoptimize,
+            warm_start=warm_start,
+            desc="Trial values",
+        )
         stats = np.array(stats).reshape(shape)
 
         if reoptimize:
@@ -29,13 +29,26 @@ class MinuitLikelihood(Likelihood):
 
         return total_stat
 
+    def grad(self, *factors):
+        self.parameters.set_parameter_factors(factors)
+
+        gradient = self.gradient()
+        derivatives = [
+            par._inverse_transform_derivative(par.factor)
+            for par in self.parameters.free_parameters
+        ]
+        return gradient * np.array(derivatives)
 
-def setup_iminuit(parameters, function, store_trace=False, **kwargs):
-    minuit_func = MinuitLikelihood(function, parameters, store_trace=store_trace)
+
+def setup_iminuit(parameters, function, store_trace=False, gradient=None, **kwargs):
+    minuit_func = MinuitLikelihood(
+        function, parameters, store_trace=store_trace, gradient=gradient
+    )
 
     pars, errors, limits = make_minuit_par_kwargs(parameters)
 
-    minuit = Minuit(minuit_func.fcn, name=list(pars.keys()), **pars)
+    grad = minuit_func.grad if gradient is not None else None
+    minuit = Minuit(minuit_func.fcn, name=list(pars.keys()), grad=grad, **pars)
     minuit.tol = kwargs.pop("tol", 0.1)
     minuit.errordef = kwargs.pop("errordef", 1)
     minuit.print_level = kwargs.pop("print_level", 0)
@@ -50,7 +63,7 @@ def setup_iminuit(parameters, function, store_trace=False, **kwargs):
     return minuit, minuit_func
 
 
-def optimize_iminuit(parameters, function, store_trace=False, **kwargs):
+def optimize_iminuit(parameters, function, store_trace=False, gradient=None, **kwargs):
     """iminuit optimization.
 
     Parameters
@@ -61,6 +74,10 @@ def optimize_iminuit(parameters, function, store_trace=False, **kwargs):
         Likelihood function.
     store_trace : bool, optional
         Store trace of the fit. Default is False.
+    gradient : callable, optional
+        Derivatives of the likelihood function with respect to the free parameter
+        values, passed to `iminuit.Minuit` as ``grad``. Default is None, which uses
+        the numerical gradient of Minuit.
     **kwargs : dict
         Options passed to `iminuit.Minuit` constructor. If there is an entry
         'migrad_opts', those options will be passed to `iminuit.Minuit.migrad()`.
@@ -73,7 +90,11 @@ def optimize_iminuit(parameters, function, store_trace=False, **kwargs):
     migrad_opts = kwargs.pop("migrad_opts", {})
 
     minuit, minuit_func = setup_iminuit(
-        parameters=parameters, function=function, store_trace=store_trace, **kwargs
+        parameters=parameters,
+        function=function,
+        store_trace=store_trace,
+        gradient=gradient,
+        **kwargs,
     )
 
     minuit.migrad(**migrad_opts)
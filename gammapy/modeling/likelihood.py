@@ -22,10 +22,16 @@ class Likelihood:
         Parameters with starting values.
     function : callable
         Likelihood function.
+    store_trace : bool
+        Store trace of the fit.
+    gradient : callable, optional
+        Derivatives of the likelihood function with respect to the free
+        parameter values. Default is None.
     """
 
-    def __init__(self, function, parameters, store_trace):
+    def __init__(self, function, parameters, store_trace, gradient=None):
         self.function = function
+        self.gradient = gradient
         self.parameters = parameters
         self.trace = []
         self.store_trace = store_trace
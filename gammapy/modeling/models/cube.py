@@ -174,6 +174,11 @@ class SkyModel(CovarianceMixin, ModelBase):
             raise TypeError(f"Invalid type: {model!r}")
         self._spectral_model = model
 
+    @property
+    def norm_parameters(self):
+        """Parameters the model is proportional to (`~gammapy.modeling.Parameters`)."""
+        return self.spectral_model.norm_parameters
+
     @property
     def temporal_model(self):
         """Temporal model as a `~gammapy.modeling.models.TemporalModel` object."""
@@ -964,6 +969,11 @@ class TemplateNPredModel(ModelBase):
             raise TypeError(f"Invalid type: {model!r}")
         self._spectral_model = model
 
+    @property
+    def norm_parameters(self):
+        """Parameters the model is proportional to (`~gammapy.modeling.Parameters`)."""
+        return self.spectral_model.norm_parameters
+
     @property
     def _models(self):
         models = self.spectral_model, self.spatial_model
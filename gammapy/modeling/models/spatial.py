@@ -22,6 +22,7 @@ from regions import (
 import matplotlib.pyplot as plt
 from gammapy.maps import HpxNDMap, Map, MapCoord, WcsGeom, WcsNDMap
 from gammapy.modeling import Parameter, Parameters
+from gammapy.utils.cache import LRUCache
 from gammapy.utils.compat import COPY_IF_NEEDED
 from gammapy.utils.gauss import Gauss2DPDF
 from gammapy.utils.interpolation import interpolation_scale
@@ -51,6 +52,68 @@ log = logging.getLogger(__name__)
 
 MAX_OVERSAMPLING = 200
 
+UPSAMPLED_GEOM_CACHE_MAX_BYTES = 256 * 1024**2
+
+UPSAMPLED_GEOM_CACHE = LRUCache(max_bytes=UPSAMPLED_GEOM_CACHE_MAX_BYTES)
+"""Process-wide cache of the upsampled geometries used by `SpatialModel.integrate_geom`.
+
+The upsampled image geometries, and their pixel coordinates, are shared by all spatial
+models integrated on the same cutout with the same oversampling factor and frame. The
+hit and miss statistics and the memory used by the coordinates are given by
+``UPSAMPLED_GEOM_CACHE.info``, the cache is disabled by setting ``max_bytes`` to 0.
+The cache is safe to use from several threads.
+"""
+
+
+class _UpsampledGeom:
+    """Upsampled geometry with its sparse pixel coordinates in a given frame.
+
+    The stored geometry is only used as a template, `get_geom` returns a fresh copy.
+    The results cached later by the methods of the copies, e.g. dense coordinates or
+    solid angles, are therefore not kept alive by `UPSAMPLED_GEOM_CACHE` and only the
+    sparse coordinates are counted against its size.
+    """
+
+    def __init__(self, geom, frame):
+        self._geom = geom
+        self.coords = geom.get_coord(frame=frame, sparse=True)
+
+    @property
+    def nbytes(self):
+        """Memory size of the sparse coordinates in bytes."""
+        return sum(coord.nbytes for coord in self.coords)
+
+    def get_geom(self):
+        """Copy of the upsampled geometry, without cached method results."""
+        return self._geom.copy()
+
+
+def _upsample_geom(geom, factor, frame):
+    """Upsample the spatial axes of a geometry, cached for image geometries."""
+    if not geom.is_image:
+        return _UpsampledGeom(geom.upsample(factor, axis_name=None), frame)
+
+    wcs = geom.wcs.wcs
+    key = (
+        tuple(wcs.ctype),
+        wcs.radesys,
+        tuple(wcs.crval),
+        tuple(wcs.crpix),
+        tuple(wcs.cdelt),
+        tuple(wcs.get_pc().flat),
+        tuple(np.ravel(geom.npix)),
+        factor,
+        str(frame),
+    )
+
+    upsampled = UPSAMPLED_GEOM_CACHE.get(key)
+
+    if upsampled is None:
+        upsampled = _UpsampledGeom(geom.upsample(factor, axis_name=None), frame)
+        UPSAMPLED_GEOM_CACHE.put(key, upsampled)
+
+    return upsampled
+
 
 def compute_sigma_eff(lon_0, lat_0, lon, lat, phi, major_axis, e):
     """Effective radius, used for the evaluation of elongated models."""
@@ -175,12 +238,22 @@ class SpatialModel(ModelBase):
             Map containing the value in each spatial bin.
         """
         coords = geom.get_coord(frame=self.frame, sparse=True)
+        return self._evaluate_coords(coords)
 
+    def _evaluate_coords(self, coords):
+        """Evaluate model on sparse map coordinates."""
         if self.is_energy_dependent:
             return self(coords.lon, coords.lat, energy=coords["energy_true"])
         else:
             return self(coords.lon, coords.lat)
 
+    def _evaluate_upsampled(self, geom, coords):
+        """Evaluate model on an upsampled geometry, reusing its cached coordinates."""
+        if type(self).evaluate_geom is SpatialModel.evaluate_geom:
+            return self._evaluate_coords(coords)
+
+        return self.evaluate_geom(geom)
+
     def integrate_geom(self, geom, oversampling_factor=None):
         """Integrate model on `~gammapy.maps.Geom` or `~gammapy.maps.RegionGeom`.
 
@@ -238,11 +311,13 @@ class SpatialModel(ModelBase):
                 oversampling_factor = 1
 
         if oversampling_factor > 1:
-            upsampled_geom = integrated.geom.upsample(
-                oversampling_factor, axis_name=None
+            cached = _upsample_geom(
+                integrated.geom, oversampling_factor, frame=self.frame
             )
+            upsampled_geom = cached.get_geom()
+            values = self._evaluate_upsampled(upsampled_geom, cached.coords)
             # assume the upsampled solid angles are approximately factor**2 smaller
-            values = self.evaluate_geom(upsampled_geom) / oversampling_factor**2
+            values /= oversampling_factor**2
             upsampled = Map.from_geom(upsampled_geom, unit=values.unit)
             upsampled += values
 
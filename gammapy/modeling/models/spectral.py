@@ -169,6 +169,7 @@ class SpectralModel(ModelBase):
     """Spectral model base class."""
 
     _type = "spectral"
+    _norm_parameter_names = ["norm", "amplitude"]
 
     def __call__(self, energy):
         kwargs = {par.name: par.quantity for par in self.parameters}
@@ -180,6 +181,17 @@ class SpectralModel(ModelBase):
         """Whether model is a norm spectral model."""
         return "Norm" in cls.__name__
 
+    @property
+    def norm_parameters(self):
+        """Parameters the model is proportional to (`~gammapy.modeling.Parameters`).
+
+        Subclasses declare them with the ``_norm_parameter_names`` class attribute.
+        They are used by `~gammapy.datasets.evaluator.MapEvaluator` to rescale
+        the cached predicted counts instead of recomputing them.
+        """
+        names = self._norm_parameter_names
+        return Parameters([par for par in self.parameters if par.name in names])
+
     @staticmethod
     def _convert_evaluate_unit(kwargs_ref, energy):
         kwargs = {}
@@ -387,6 +399,65 @@ class SpectralModel(ModelBase):
         else:
             return integrate_spectrum(self, energy_min, energy_max, **kwargs)
 
+    def gradient(self, energy):
+        """Evaluate the derivatives of the model with respect to its parameters.
+
+        Only available for models defining an ``evaluate_gradient`` method.
+
+        Parameters
+        ----------
+        energy : `~astropy.units.Quantity`
+            Energy at which to evaluate the derivatives.
+
+        Returns
+        -------
+        gradient : list of `~astropy.units.Quantity`
+            Derivatives with respect to the parameter values, in the order of
+            ``self.parameters``.
+        """
+        kwargs = {par.name: par.quantity for par in self.parameters}
+        kwargs = self._convert_evaluate_unit(kwargs, energy)
+        return self.evaluate_gradient(energy, **kwargs)
+
+    def integral_gradient(self, energy_min, energy_max, ndecade=100):
+        """Derivatives of the model integral with respect to its parameters.
+
+        Use the analytical solution if an ``evaluate_integral_gradient`` method is
+        defined, otherwise the derivatives given by ``evaluate_gradient`` are
+        integrated with the trapezoidal rule on a logarithmic energy grid.
+
+        Parameters
+        ----------
+        energy_min, energy_max : `~astropy.units.Quantity`
+            Lower and upper bound of integration range.
+        ndecade : int, optional
+            Number of grid points per decade used for the integration.
+            Default is 100.
+
+        Returns
+        -------
+        gradient : list of `~astropy.units.Quantity`
+            Derivatives with respect to the parameter values, in the order of
+            ``self.parameters``.
+        """
+        kwargs = {par.name: par.quantity for par in self.parameters}
+        kwargs = self._convert_evaluate_unit(kwargs, energy_min)
+
+        if hasattr(self, "evaluate_integral_gradient"):
+            return self.evaluate_integral_gradient(energy_min, energy_max, **kwargs)
+
+        num = np.maximum(np.max(ndecade * np.log10(energy_max / energy_min)), 2)
+        energy = np.geomspace(energy_min, energy_max, num=int(num), axis=-1)
+        width = np.diff(energy, axis=-1)
+
+        gradient = []
+        for values in self.evaluate_gradient(energy, **kwargs):
+            values = values * np.ones(energy.shape)
+            integral = 0.5 * (values[..., 1:] + values[..., :-1]) * width
+            gradient.append(integral.sum(axis=-1))
+
+        return gradient
+
     def integral_error(
         self,
         energy_min,
@@ -961,6 +1032,7 @@ class ConstantSpectralModel(SpectralModel):
     """
 
     tag = ["ConstantSpectralModel", "const"]
+    _norm_parameter_names = ["const"]
     const = Parameter("const", "1e-12 cm-2 s-1 TeV-1")
 
     @staticmethod
@@ -991,6 +1063,16 @@ class CompoundSpectralModel(CovarianceMixin, SpectralModel):
     def parameters(self):
         return self.model1.parameters + self.model2.parameters
 
+    @property
+    def norm_parameters(self):
+        """Parameters the model is proportional to (`~gammapy.modeling.Parameters`).
+
+        Only defined for the product of two models.
+        """
+        if self.operator is operator.mul:
+            return self.model1.norm_parameters + self.model2.norm_parameters
+        return Parameters()
+
     @property
     def parameters_unique_names(self):
         names = []
@@ -1113,6 +1195,50 @@ class PowerLawSpectralModel(SpectralModel):
 
         return integral
 
+    @staticmethod
+    def evaluate_gradient(energy, index, amplitude, reference):
+        """Evaluate the model parameter derivatives (static function)."""
+        xx = energy / reference
+        d_amplitude = np.power(xx, -index)
+        dnde = amplitude * d_amplitude
+        return [-np.log(xx) * dnde, d_amplitude, index * dnde / reference]
+
+    @staticmethod
+    def evaluate_integral_gradient(energy_min, energy_max, index, amplitude, reference):
+        r"""Parameter derivatives of the power law integral (static function).
+
+        .. math::
+            \frac{\partial F}{\partial \phi_0} = \frac{F}{\phi_0}, \quad
+            \frac{\partial F}{\partial E_0} = \frac{\Gamma F}{E_0}
+
+        Parameters
+        ----------
+        energy_min, energy_max : `~astropy.units.Quantity`
+            Lower and upper bound of integration range.
+        """
+        val = -1 * index + 1
+
+        log_min = np.log(energy_min / reference)
+        log_max = np.log(energy_max / reference)
+        upper = np.power((energy_max / reference), val)
+        lower = np.power((energy_min / reference), val)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            d_val = (upper * log_max - lower * log_min) / val
+            d_val -= (upper - lower) / val**2
+        d_val = amplitude * reference * d_val
+
+        mask = np.isclose(val, 0)
+
+        if mask.any():
+            d_val[mask] = (amplitude * reference * (log_max**2 - log_min**2) / 2)[mask]
+
+        d_amplitude = PowerLawSpectralModel.evaluate_integral(
+            energy_min, energy_max, index, 1, reference
+        )
+        integral = amplitude * d_amplitude
+        return [-d_val, d_amplitude, index * integral / reference]
+
     @staticmethod
     def evaluate_energy_flux(energy_min, energy_max, index, amplitude, reference):
         r"""Compute energy flux in given energy range analytically (static function).
@@ -1225,6 +1351,18 @@ class PowerLawNormSpectralModel(SpectralModel):
 
         return integral
 
+    @staticmethod
+    def evaluate_gradient(energy, tilt, norm, reference):
+        """Evaluate the model parameter derivatives (static function)."""
+        return PowerLawSpectralModel.evaluate_gradient(energy, tilt, norm, reference)
+
+    @staticmethod
+    def evaluate_integral_gradient(energy_min, energy_max, tilt, norm, reference):
+        """Parameter derivatives of the powerlaw integral (static function)."""
+        return PowerLawSpectralModel.evaluate_integral_gradient(
+            energy_min, energy_max, tilt, norm, reference
+        )
+
     @staticmethod
     def evaluate_energy_flux(energy_min, energy_max, tilt, norm, reference):
         """Evaluate the energy flux (static function)."""
@@ -1599,6 +1737,29 @@ class ExpCutoffPowerLawSpectralModel(SpectralModel):
 
         return pwl * cutoff
 
+    @staticmethod
+    def evaluate_gradient(energy, index, amplitude, reference, lambda_, alpha):
+        """Evaluate the model parameter derivatives (static function)."""
+        xx = energy / reference
+        cutoff_arg = u.Quantity(energy * lambda_, "").value
+        alpha = u.Quantity(alpha, "").value
+        cutoff_pow = np.power(cutoff_arg, alpha)
+
+        d_amplitude = np.power(xx, -index) * np.exp(-cutoff_pow)
+        dnde = amplitude * d_amplitude
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            d_lambda = -alpha * energy * np.power(cutoff_arg, alpha - 1) * dnde
+            d_alpha = -np.where(cutoff_pow > 0, cutoff_pow * np.log(cutoff_arg), 0)
+
+        return [
+            -np.log(xx) * dnde,
+            d_amplitude,
+            index * dnde / reference,
+            d_lambda,
+            d_alpha * dnde,
+        ]
+
     @property
     def e_peak(self):
         r"""Spectral energy distribution peak energy (`~astropy.units.Quantity`).
@@ -1677,6 +1838,13 @@ class ExpCutoffPowerLawNormSpectralModel(SpectralModel):
 
         return pwl * cutoff
 
+    @staticmethod
+    def evaluate_gradient(energy, index, norm, reference, lambda_, alpha):
+        """Evaluate the model parameter derivatives (static function)."""
+        return ExpCutoffPowerLawSpectralModel.evaluate_gradient(
+            energy, index, norm, reference, lambda_, alpha
+        )
+
 
 class ExpCutoffPowerLaw3FGLSpectralModel(SpectralModel):
     r"""Spectral exponential cutoff power-law model used for 3FGL.
@@ -1934,6 +2102,20 @@ class LogParabolaSpectralModel(SpectralModel):
         exponent = -alpha - beta * np.log(xx)
         return amplitude * np.power(xx, exponent)
 
+    @staticmethod
+    def evaluate_gradient(energy, amplitude, reference, alpha, beta):
+        """Evaluate the model parameter derivatives (static function)."""
+        xx = energy / reference
+        log_xx = np.log(xx)
+        d_amplitude = np.power(xx, -alpha - beta * log_xx)
+        dnde = amplitude * d_amplitude
+        return [
+            d_amplitude,
+            (alpha + 2 * beta * log_xx) * dnde / reference,
+            -log_xx * dnde,
+            -(log_xx**2) * dnde,
+        ]
+
     @property
     def e_peak(self):
         r"""Spectral energy distribution peak energy (`~astropy.units.Quantity`).
@@ -1988,6 +2170,13 @@ class LogParabolaNormSpectralModel(SpectralModel):
         exponent = -alpha - beta * np.log(xx)
         return norm * np.power(xx, exponent)
 
+    @staticmethod
+    def evaluate_gradient(energy, norm, reference, alpha, beta):
+        """Evaluate the model parameter derivatives (static function)."""
+        return LogParabolaSpectralModel.evaluate_gradient(
+            energy, norm, reference, alpha, beta
+        )
+
 
 class TemplateSpectralModel(SpectralModel):
     """A model generated from a table of energy and value arrays.
@@ -2133,6 +2322,7 @@ class TemplateNDSpectralModel(SpectralModel):
     """
 
     tag = ["TemplateNDSpectralModel", "templateND"]
+    _norm_parameter_names = []
 
     def __init__(self, map, interp_kwargs=None, meta=None, filename=None):
         self._map = map.copy()
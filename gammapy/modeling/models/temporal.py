@@ -4,6 +4,7 @@
 import logging
 import numpy as np
 import scipy.interpolate
+import scipy.special
 from astropy import units as u
 from astropy.io import fits
 from astropy.table import Table
@@ -119,6 +120,33 @@ class TemporalModel(ModelBase):
             kwargs["scale"] = temporal_data["scale"]
         return super().from_dict(data, **kwargs)
 
+    def _to_mjd(self, time):
+        """Convert times to MJD values in the time scale of the model."""
+        return Time(time, scale=self.scale).mjd
+
+    def _time_offsets(self, t_min, t_max):
+        """Offsets of the interval start times to the reference time and durations.
+
+        Parameters
+        ----------
+        t_min, t_max : `~astropy.time.Time`
+            Lower and upper bound of integration range.
+
+        Returns
+        -------
+        offset, duration : `~numpy.ndarray`
+            Offsets of ``t_min`` to the reference time and interval durations,
+            in days.
+        """
+        mjd_min = self._to_mjd(t_min)
+        offset = mjd_min - self.t_ref.quantity.to_value("d")
+        return offset, self._to_mjd(t_max) - mjd_min
+
+    @staticmethod
+    def _integral_norm(integral, duration):
+        """Divide the integrals in days by the total duration of the intervals."""
+        return u.Quantity(integral / np.sum(duration), "", copy=COPY_IF_NEEDED)
+
     @staticmethod
     def time_sum(t_min, t_max):
         """Total time between t_min and t_max.
@@ -223,6 +251,10 @@ class TemporalModel(ModelBase):
     def integral(self, t_min, t_max, oversampling_factor=100, **kwargs):
         """Evaluate the integrated flux within the given time intervals.
 
+        The model is evaluated on a grid of MJD values in each interval, without
+        creating `~astropy.time.Time` objects. Models with an analytical integral
+        override this method.
+
         Parameters
         ----------
         t_min: `~astropy.time.Time`
@@ -238,13 +270,14 @@ class TemporalModel(ModelBase):
         norm : float
             Integrated flux norm on the given time intervals.
         """
+        mjd_min, mjd_max = self._to_mjd(t_min), self._to_mjd(t_max)
         t_values, steps = np.linspace(
-            t_min.mjd, t_max.mjd, oversampling_factor, retstep=True, axis=-1
+            mjd_min, mjd_max, oversampling_factor, retstep=True, axis=-1
         )
-        times = Time(t_values, format="mjd", scale=self.scale)
-        values = self(times)
+        kwargs = {par.name: par.quantity for par in self.parameters}
+        values = self.evaluate(t_values * u.d, **kwargs)
         integral = np.sum(values, axis=-1) * steps
-        return integral / self.time_sum(t_min, t_max).to_value("d")
+        return integral / np.sum(mjd_max - mjd_min)
 
 
 class ConstantTemporalModel(TemporalModel):
@@ -275,7 +308,8 @@ class ConstantTemporalModel(TemporalModel):
         norm : `~astropy.units.Quantity`
             Integrated flux norm on the given time intervals.
         """
-        return (t_max - t_min) / self.time_sum(t_min, t_max)
+        duration = self._to_mjd(t_max) - self._to_mjd(t_min)
+        return self._integral_norm(duration, duration)
 
 
 class LinearTemporalModel(TemporalModel):
@@ -323,14 +357,11 @@ class LinearTemporalModel(TemporalModel):
         norm : float
             Integrated flux norm on the given time intervals.
         """
-        pars = self.parameters
-        alpha = pars["alpha"]
-        beta = pars["beta"].quantity
-        t_ref = self.reference_time
-        value = alpha * (t_max - t_min) + beta / 2.0 * (
-            (t_max - t_ref) * (t_max - t_ref) - (t_min - t_ref) * (t_min - t_ref)
-        )
-        return value / self.time_sum(t_min, t_max)
+        alpha = self.alpha.value
+        beta = self.beta.quantity.to_value("d-1")
+        offset, duration = self._time_offsets(t_min, t_max)
+        value = duration * (alpha + beta * (offset + duration / 2.0))
+        return self._integral_norm(value, duration)
 
 
 class ExpDecayTemporalModel(TemporalModel):
@@ -372,11 +403,10 @@ class ExpDecayTemporalModel(TemporalModel):
         norm : float
             Integrated flux norm on the given time intervals.
         """
-        pars = self.parameters
-        t0 = pars["t0"].quantity
-        t_ref = self.reference_time
-        value = self.evaluate(t_max, t0, t_ref) - self.evaluate(t_min, t0, t_ref)
-        return -t0 * value / self.time_sum(t_min, t_max)
+        t0 = self.t0.quantity.to_value("d")
+        offset, duration = self._time_offsets(t_min, t_max)
+        value = -t0 * np.exp(-offset / t0) * np.expm1(-duration / t0)
+        return self._integral_norm(value, duration)
 
 
 class GaussianTemporalModel(TemporalModel):
@@ -419,16 +449,26 @@ class GaussianTemporalModel(TemporalModel):
         norm : float
             Integrated flux norm on the given time intervals.
         """
-        pars = self.parameters
-        sigma = pars["sigma"].quantity
-        t_ref = self.reference_time
+        sigma = self.sigma.quantity.to_value("d")
+        offset, duration = self._time_offsets(t_min, t_max)
         norm = np.sqrt(np.pi / 2) * sigma
 
-        u_min = (t_min - t_ref) / (np.sqrt(2) * sigma)
-        u_max = (t_max - t_ref) / (np.sqrt(2) * sigma)
+        u_min = offset / (np.sqrt(2) * sigma)
+        u_max = (offset + duration) / (np.sqrt(2) * sigma)
 
-        integral = norm * (scipy.special.erf(u_max) - scipy.special.erf(u_min))
-        return integral / self.time_sum(t_min, t_max)
+        # use the complementary error function in the tails to avoid cancellation
+        value = scipy.special.erf(u_max) - scipy.special.erf(u_min)
+        value = np.where(
+            u_min > 0,
+            scipy.special.erfc(u_min) - scipy.special.erfc(u_max),
+            value,
+        )
+        value = np.where(
+            u_max < 0,
+            scipy.special.erfc(-u_max) - scipy.special.erfc(-u_min),
+            value,
+        )
+        return self._integral_norm(norm * value, duration)
 
 
 class GeneralizedGaussianTemporalModel(TemporalModel):
@@ -870,18 +910,17 @@ class PowerLawTemporalModel(TemporalModel):
         norm : float
             Integrated flux norm on the given time intervals.
         """
-        pars = self.parameters
-        alpha = pars["alpha"].quantity
-        t0 = pars["t0"].quantity
-        t_ref = self.reference_time
+        alpha = self.alpha.value
+        t0 = self.t0.quantity.to_value("d")
+        offset, duration = self._time_offsets(t_min, t_max)
         if alpha != -1:
-            value = self.evaluate(t_max, alpha + 1.0, t_ref, t0) - self.evaluate(
-                t_min, alpha + 1.0, t_ref, t0
+            value = np.power((offset + duration) / t0, alpha + 1.0) - np.power(
+                offset / t0, alpha + 1.0
             )
-            return t0 / (alpha + 1.0) * value / self.time_sum(t_min, t_max)
+            value *= t0 / (alpha + 1.0)
         else:
-            value = np.log((t_max - t_ref) / (t_min - t_ref))
-            return t0 * value / self.time_sum(t_min, t_max)
+            value = t0 * np.log1p(duration / offset)
+        return self._integral_norm(value, duration)
 
 
 class SineTemporalModel(TemporalModel):
@@ -929,16 +968,15 @@ class SineTemporalModel(TemporalModel):
         norm : float
             Integrated flux norm on the given time intervals.
         """
-        pars = self.parameters
-        omega = pars["omega"].quantity.to_value("rad/day")
-        amp = pars["amp"].value
-        t_ref = self.reference_time
-
-        value = (t_max - t_min).to_value(u.day) - amp / omega * (
-            np.sin(omega * (t_max - t_ref).to_value(u.day))
-            - np.sin(omega * (t_min - t_ref).to_value(u.day))
+        omega = self.omega.quantity.to_value("rad/day")
+        amp = self.amp.value
+        offset, duration = self._time_offsets(t_min, t_max)
+
+        # integral of the sine, written as a product to avoid cancellation
+        value = duration + 2 * amp / omega * (
+            np.sin(omega * (offset + duration / 2.0)) * np.sin(omega * duration / 2.0)
         )
-        return value / self.time_sum(t_min, t_max).to_value(u.day)
+        return self._integral_norm(value, duration)
 
 
 class TemplatePhaseCurveTemporalModel(TemporalModel):
@@ -673,6 +673,53 @@ def test_integrate_geom_parameter_issue():
     assert_allclose(integrated.data, np.nan)
 
 
+def test_integrate_geom_upsampled_cache():
+    from gammapy.modeling.models.spatial import (
+        UPSAMPLED_GEOM_CACHE,
+        UPSAMPLED_GEOM_CACHE_MAX_BYTES,
+    )
+
+    geom = WcsGeom.create(skydir=(0, 0), npix=100, binsz=0.02)
+    gauss = GaussianSpatialModel(
+        lon_0="0.234 deg", lat_0="-0.172 deg", sigma=0.003 * u.deg, frame="icrs"
+    )
+    disk = DiskSpatialModel(
+        lon_0="0.234 deg", lat_0="-0.172 deg", r_0=0.01 * u.deg, frame="icrs"
+    )
+
+    # the models are smaller than a pixel, so they share the same cutout
+    UPSAMPLED_GEOM_CACHE.clear()
+    hits = UPSAMPLED_GEOM_CACHE.hits
+
+    expected = gauss.integrate_geom(geom, oversampling_factor=8)
+    assert len(UPSAMPLED_GEOM_CACHE) == 1
+
+    # only the sparse coordinates are stored, the geometry is copied on each use
+    ((cached, _),) = UPSAMPLED_GEOM_CACHE._data.values()
+    assert UPSAMPLED_GEOM_CACHE.nbytes == sum(c.nbytes for c in cached.coords)
+    assert cached.get_geom() is not cached.get_geom()
+
+    gauss.sigma.value = 0.0035
+    disk.integrate_geom(geom, oversampling_factor=8)
+    gauss.integrate_geom(geom, oversampling_factor=8)
+    assert UPSAMPLED_GEOM_CACHE.hits == hits + 2
+    assert len(UPSAMPLED_GEOM_CACHE) == 1
+
+    gauss.sigma.value = 0.003
+    actual = gauss.integrate_geom(geom, oversampling_factor=8)
+    assert_allclose(actual.data, expected.data)
+
+    UPSAMPLED_GEOM_CACHE.max_bytes = 0
+    UPSAMPLED_GEOM_CACHE.clear()
+    try:
+        uncached = gauss.integrate_geom(geom, oversampling_factor=8)
+    finally:
+        UPSAMPLED_GEOM_CACHE.max_bytes = UPSAMPLED_GEOM_CACHE_MAX_BYTES
+
+    assert len(UPSAMPLED_GEOM_CACHE) == 0
+    assert_allclose(uncached.data, expected.data)
+
+
 def test_integrate_geom_energy_axis():
     center = SkyCoord("0d", "0d", frame="icrs")
     model = GaussianSpatialModel(
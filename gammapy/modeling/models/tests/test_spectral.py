@@ -1408,3 +1408,46 @@ def test_vectorized_integrate_spectrum():
             ndecade=20,
             parameter_samples=parameter_samples,
         )
+
+
+@pytest.mark.parametrize(
+    "model",
+    [
+        PowerLawSpectralModel(index=2.3),
+        PowerLawSpectralModel(index=1),
+        PowerLawNormSpectralModel(tilt=0.2, norm=1.5),
+        LogParabolaSpectralModel(alpha=2.1, beta=0.3),
+        LogParabolaNormSpectralModel(norm=1.5, alpha=0.2, beta=0.1),
+        ExpCutoffPowerLawSpectralModel(alpha=1.2),
+        ExpCutoffPowerLawNormSpectralModel(index=0.5, alpha=0.8),
+    ],
+    ids=lambda _: _.__class__.__name__,
+)
+def test_spectral_model_gradient(model):
+    energy = [0.3, 1, 3, 10] * u.TeV
+    energy_min, energy_max = energy[:-1], energy[1:]
+
+    gradient = model.gradient(energy)
+    integral_gradient = model.integral_gradient(energy_min, energy_max)
+
+    assert len(gradient) == len(model.parameters)
+    assert len(integral_gradient) == len(model.parameters)
+
+    for par, value, integral in zip(model.parameters, gradient, integral_gradient):
+        par_value = par.value
+        step = 1e-6 * par_value * par.unit
+
+        par.value = par_value + step.value
+        dnde_up = model(energy)
+        integral_up = model.integral(energy_min, energy_max)
+
+        par.value = par_value - step.value
+        dnde_down = model(energy)
+        integral_down = model.integral(energy_min, energy_max)
+
+        par.value = par_value
+
+        assert_quantity_allclose(value, (dnde_up - dnde_down) / (2 * step), rtol=1e-5)
+        assert_quantity_allclose(
+            integral, (integral_up - integral_down) / (2 * step), rtol=1e-3
+        )
@@ -362,7 +362,30 @@ def test_sine_temporal_model_integral():
     time_stop = t_ref + [2, 3.5, 6] * u.day
     val = temporal_model.integral(time_start, time_stop)
     assert len(val) == 3
-    assert_allclose(np.sum(val), 1.08261, rtol=1e-5)
+    assert_allclose(np.sum(val), 1.055201, rtol=1e-5)
+
+
+@pytest.mark.parametrize(
+    "temporal_model",
+    [
+        ConstantTemporalModel(),
+        LinearTemporalModel(alpha=1.0, beta=-0.1 / u.day, t_ref=55555 * u.d),
+        ExpDecayTemporalModel(t0=2 * u.d, t_ref=55555 * u.d),
+        GaussianTemporalModel(sigma=1.5 * u.d, t_ref=55557 * u.d),
+        PowerLawTemporalModel(alpha=-1.5, t_ref=55555 * u.d),
+        SineTemporalModel(amp=0.5, omega=2 * u.rad / u.d, t_ref=55555 * u.d),
+    ],
+)
+def test_temporal_model_integral_analytical(temporal_model):
+    t_ref = Time(55555, format="mjd")
+    time_start = t_ref + [0.5, 3, 5] * u.day
+    time_stop = t_ref + [2, 3.5, 9] * u.day
+
+    actual = temporal_model.integral(time_start, time_stop)
+    expected = super(type(temporal_model), temporal_model).integral(
+        time_start, time_stop, oversampling_factor=10001
+    )
+    assert_allclose(actual, expected, rtol=1e-3)
 
 
 @requires_data()
@@ -17,6 +17,9 @@ __all__ = ["Parameter", "Parameters", "PriorParameter", "PriorParameters"]
 
 log = logging.getLogger(__name__)
 
+# Shared by all parameters, so that a version is never reused within a process
+_VERSION_COUNTER = itertools.count(1)
+
 
 def _get_parameters_str(parameters):
     str_ = ""
@@ -173,6 +176,21 @@ class Parameter:
         if not self._name == name:
             raise ValueError(f"Expected parameter name '{name}', got {self._name}")
 
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        # versions are only unique within a process
+        self._version = next(_VERSION_COUNTER)
+
+    @property
+    def version(self):
+        """Modification counter of the parameter value and unit (int).
+
+        It changes each time the value or the unit is set to a different value,
+        so that changes of a set of parameters can be detected without comparing
+        the values, see `Parameters.versions`.
+        """
+        return self._version
+
     @property
     def prior(self):
         """Prior applied to the parameter  as a `~gammapy.modeling.models.Prior`."""
@@ -223,7 +241,13 @@ class Parameter:
     @factor.setter
     def factor(self, val):
         self._factor = float(val)
-        self._value = float(self.inverse_transform(self._factor))
+        self._set_value(float(self.inverse_transform(self._factor)))
+
+    def _set_value(self, value):
+        """Set the value and update the version if it changed."""
+        if value != getattr(self, "_value", None):
+            self._version = next(_VERSION_COUNTER)
+        self._value = value
 
     @property
     def scale(self):
@@ -238,6 +262,7 @@ class Parameter:
     @unit.setter
     def unit(self, val):
         self._unit = u.Unit(val)
+        self._version = next(_VERSION_COUNTER)
 
     @property
     def min(self):
@@ -350,7 +375,7 @@ class Parameter:
 
     @value.setter
     def value(self, val):
-        self._value = float(val)
+        self._set_value(float(val))
         self._factor = self.transform(val)
 
     @property
@@ -664,7 +689,11 @@ class Parameters(collections.abc.Sequence):
     @property
     def value(self):
         """Parameter values as a `numpy.ndarray`."""
-        return np.array([_.value for _ in self._parameters], dtype=np.float64)
+        return np.fromiter(
+            (_._value for _ in self._parameters),
+            dtype=np.float64,
+            count=len(self._parameters),
+        )
 
     @value.setter
     def value(self, values):
@@ -675,6 +704,15 @@ class Parameters(collections.abc.Sequence):
         for value, par in zip(values, self):
             par.value = value
 
+    @property
+    def versions(self):
+        """Modification counters of the parameters (tuple).
+
+        The versions only change if a parameter value or unit changed, which makes
+        comparing them a cheap test before comparing the values.
+        """
+        return tuple([_._version for _ in self._parameters])
+
     @classmethod
     def from_stack(cls, parameters_list):
         """Create `Parameters` by stacking a list of other `Parameters` objects.
@@ -825,7 +863,9 @@ class Parameters(collections.abc.Sequence):
         idx = 0
         for parameter in self._parameters:
             if not parameter.frozen:
-                parameter.factor = factors[idx]
+                # the optimizers usually change only a few factors at once
+                if parameter._factor != factors[idx]:
+                    parameter.factor = factors[idx]
                 idx += 1
 
     def autoscale(self):
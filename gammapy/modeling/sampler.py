@@ -1,12 +1,34 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 """Sampler parameter classes."""
 
+import copy
+import threading
+import numpy as np
+import gammapy.utils.parallel as parallel
 from .utils import _parse_datasets
 
 __all__ = ["Sampler", "SamplerLikelihood", "SamplerResult"]
 
+# likelihood copy owned by each worker of a `SamplerLikelihood` pool
+_WORKER_STATE = threading.local()
 
-class Sampler:
+
+def _likelihood_batch(like, values):
+    """Evaluate a sampler likelihood for a batch of parameter values in a loop."""
+    return np.array([like.fcn(value) for value in values])
+
+
+def _init_worker_likelihood(like, copy_likelihood):
+    """Store the likelihood used by a worker, copied if memory is shared."""
+    _WORKER_STATE.likelihood = copy.deepcopy(like) if copy_likelihood else like
+
+
+def _worker_likelihood_batch(values):
+    """Evaluate the likelihood of the current worker for a batch of values."""
+    return _likelihood_batch(_WORKER_STATE.likelihood, values)
+
+
+class Sampler(parallel.ParallelMixin):
     """Sampler class.
 
     The sampler class provides a uniform interface to multiple sampler backends. Currently available: "UltraNest".
@@ -52,6 +74,12 @@ class Sampler:
         Optional run options passed to the given backend when running the sampler.
         See the full list of run options on the
         `UltraNest documentation <https://johannesbuchner.github.io/UltraNest/ultranest.html#ultranest.integrator.ReactiveNestedSampler.run>`__.
+    n_jobs : int, optional
+        Number of processes used to evaluate the likelihood. If larger than one, the
+        sampler draws batches of points which are split over the workers, see
+        `SamplerLikelihood.fcn_batch`. Default is None.
+    parallel_backend : {"multiprocessing", "ray", "threads"}, optional
+        Which backend to use for multiprocessing. Default is None.
 
     Examples
     --------
@@ -66,8 +94,17 @@ class Sampler:
 
     # TODO: add "zeusmc", "emcee"
 
-    def __init__(self, backend="ultranest", sampler_opts=None, run_opts=None):
+    def __init__(
+        self,
+        backend="ultranest",
+        sampler_opts=None,
+        run_opts=None,
+        n_jobs=None,
+        parallel_backend=None,
+    ):
         self._sampler = None
+        self.n_jobs = n_jobs
+        self.parallel_backend = parallel_backend
         self.backend = backend
         self.sampler_opts = {} if sampler_opts is None else sampler_opts
         self.run_opts = {} if run_opts is None else run_opts
@@ -132,12 +169,20 @@ class Sampler:
                 )
             return [par.prior._inverse_cdf(val) for par, val in zip(parameters, values)]
 
+        def _prior_inverse_cdf_batch(values):
+            """Returns an array of model parameters for a batch of values."""
+            return np.stack(_prior_inverse_cdf(np.transpose(values)), axis=-1)
+
+        # with several jobs, batches of points are drawn and split over the workers
+        vectorized = like.n_jobs > 1
+
         self._sampler = ultranest.ReactiveNestedSampler(
             parameters.names,
-            like.fcn,
-            transform=_prior_inverse_cdf,
+            like.fcn_batch if vectorized else like.fcn,
+            transform=_prior_inverse_cdf_batch if vectorized else _prior_inverse_cdf,
             log_dir=self.sampler_opts["log_dir"],
             resume=self.sampler_opts["resume"],
+            vectorized=vectorized,
         )
 
         if self.sampler_opts["step_sampler"]:
@@ -178,9 +223,16 @@ class Sampler:
 
         if self.backend == "ultranest":
             like = SamplerLikelihood(
-                function=datasets._stat_sum_likelihood, parameters=parameters
+                function=datasets._stat_sum_likelihood,
+                parameters=parameters,
+                n_jobs=self.n_jobs,
+                parallel_backend=self.parallel_backend,
             )
-            result_dict = self.sampler_ultranest(parameters, like)
+            try:
+                result_dict = self.sampler_ultranest(parameters, like)
+            finally:
+                like.close()
+
             self._sampler.print_results()
 
             models_copy = datasets.models.copy()
@@ -238,7 +290,7 @@ class SamplerResult:
         return cls(**kwargs)
 
 
-class SamplerLikelihood:
+class SamplerLikelihood(parallel.ParallelMixin):
     """Wrapper of the likelihood function used by the sampler.
 
     This is needed to modify parameters and likelihood by *-0.5
@@ -249,15 +301,111 @@ class SamplerLikelihood:
         Parameters with starting values.
     function : callable
         Likelihood function.
+    n_jobs : int, optional
+        Number of processes used by `fcn_batch`. Default is None.
+    parallel_backend : {"multiprocessing", "ray", "threads"}, optional
+        Which backend to use for multiprocessing. Default is None.
     """
 
     # TODO: Will be updated with the FitStatistic class when ready.
 
-    def __init__(self, function, parameters):
+    def __init__(self, function, parameters, n_jobs=None, parallel_backend=None):
         self.function = function
         self.parameters = parameters
+        self.n_jobs = n_jobs
+        self.parallel_backend = parallel_backend
+        self._pool = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        return state
 
     def fcn(self, value):
         self.parameters.value = value
         total_stat = -0.5 * self.function()
         return total_stat
+
+    def _get_pool(self):
+        """Get the worker pool, starting it if needed.
+
+        Each worker receives its copy of the likelihood once, when the pool
+        is started, and reuses it for all the following batches. The pool is
+        restarted if ``n_jobs`` changes.
+        """
+        if self._pool is not None and self._pool[0] == self.n_jobs:
+            return self._pool[1]
+
+        self.close()
+        processes = self.n_jobs
+
+        backend = parallel.ParallelBackendEnum.from_str(self.parallel_backend)
+        multiprocessing = parallel.PARALLEL_BACKEND_MODULES[backend]()
+
+        if backend != parallel.ParallelBackendEnum.ray:
+            processes = min(processes, parallel.get_multiprocessing().cpu_count())
+
+        # threads share memory, each of them needs its own parameters
+        copy_likelihood = backend == parallel.ParallelBackendEnum.threads
+
+        pool = multiprocessing.Pool(
+            processes=processes,
+            initializer=_init_worker_likelihood,
+            initargs=(self, copy_likelihood),
+        )
+        self._pool = (self.n_jobs, pool)
+        return pool
+
+    def close(self):
+        """Shut down the worker pool used by `fcn_batch`, if it is running."""
+        if self._pool is None:
+            return
+
+        _, pool = self._pool
+        self._pool = None
+        pool.close()
+        pool.join()
+
+    def fcn_batch(self, values):
+        """Likelihood for a batch of parameter values.
+
+        The points are split in ``n_jobs`` chunks evaluated in parallel. Each worker
+        evaluates the likelihood on its own copy of the function and parameters, so
+        that the parameter values of the main process are not modified. The workers
+        and their copies are created at the first call and reused by the following
+        ones, until `close` is called. Changes of the datasets or of the parameters
+        other than the sampled values are therefore not seen by the workers.
+
+        Parameters
+        ----------
+        values : `~numpy.ndarray`
+            Parameter values, with shape (n_points, n_parameters).
+
+        Returns
+        -------
+        likelihood : `~numpy.ndarray`
+            Likelihood values, with shape (n_points,).
+        """
+        values = np.atleast_2d(values)
+        n_jobs = min(self.n_jobs, len(values))
+
+        if n_jobs <= 1 or not self._is_main_worker:
+            return _likelihood_batch(self, values)
+
+        pool = self._get_pool()
+        results = pool.map(_worker_likelihood_batch, np.array_split(values, n_jobs))
+        return np.concatenate(results)
+
+    @property
+    def _is_main_worker(self):
+        """Whether workers can be started, i.e. not nested in a pool worker."""
+        backend = parallel.ParallelBackendEnum.from_str(self.parallel_backend)
+
+        if backend == parallel.ParallelBackendEnum.threads:
+            return not parallel.is_worker_thread()
+
+        if backend == parallel.ParallelBackendEnum.multiprocessing:
+            process = parallel.get_multiprocessing().current_process()
+            return process.name == "MainProcess"
+
+        return True
@@ -389,6 +389,47 @@ def test_stat_surface_reoptimize():
     )
 
 
+@pytest.mark.parametrize("backend", ["threads", "multiprocessing"])
+def test_stat_surface_reoptimize_parallel(backend):
+    dataset = MyDataset()
+    fit = Fit(n_jobs=2, parallel_backend=backend)
+    fit.run([dataset])
+
+    x_values = [1, 2, 3]
+    y_values = [2e2, 3e2, 4e2]
+
+    dataset.models.parameters["z"].value = 0
+    dataset.models.parameters["x"].scan_values = x_values
+    dataset.models.parameters["y"].scan_values = y_values
+
+    result = fit.stat_surface(datasets=[dataset], x="x", y="y", reoptimize=True)
+
+    expected_stat = [
+        [1.0001e04, 1.0000e00, 1.0001e04],
+        [1.0000e04, 0.0000e00, 1.0000e04],
+        [1.0001e04, 1.0000e00, 1.0001e04],
+    ]
+    assert_allclose(list(result["stat_scan"]), expected_stat, atol=1e-7)
+    assert result["fit_results"].shape == (3, 3)
+    assert_allclose(
+        result["fit_results"][2][1].total_stat, result["stat_scan"][2][1], atol=1e-7
+    )
+    assert_allclose(
+        result["fit_results"][2][1].parameters["z"].value, 4e-2, rtol=1e-3
+    )
+
+    # Check that original value state wasn't changed
+    assert_allclose(dataset.models.parameters["x"].value, 2)
+    assert_allclose(dataset.models.parameters["z"].value, 0)
+
+    dataset.models.parameters["x"].scan_n_values = 3
+    result = fit.stat_profile(
+        datasets=[dataset], parameter="x", reoptimize=True, warm_start=False
+    )
+    assert_allclose(result["stat_scan"], [4, 0, 4], atol=1e-7)
+    assert len(result["fit_results"]) == 3
+
+
 def test_stat_contour():
     dataset = MyDataset()
     dataset.models.parameters["x"].frozen = True
@@ -295,6 +295,28 @@ def test_parameters_set_parameter_factors(pars):
     assert_allclose(pars["ham"].scale, 1)
 
 
+def test_parameters_versions(pars):
+    versions = pars.versions
+    assert len(versions) == 2
+
+    pars["spam"].value = 42
+    pars.set_parameter_factors([42, 99])
+    assert pars.versions == versions
+
+    pars["spam"].value = 43
+    assert pars.versions[0] != versions[0]
+    assert pars.versions[1] == versions[1]
+
+    versions = pars.versions
+    pars.set_parameter_factors([43, 100])
+    assert pars.versions[0] == versions[0]
+    assert pars.versions[1] != versions[1]
+
+    pars_copy = pars.copy()
+    assert_allclose(pars_copy.value, pars.value)
+    assert set(pars_copy.versions).isdisjoint(pars.versions)
+
+
 def test_parameters_s():
     pars = Parameters(
         [
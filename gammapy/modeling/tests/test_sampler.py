@@ -1,8 +1,10 @@
+import pytest
+import numpy as np
 from gammapy.utils.testing import requires_data, requires_dependency
 from numpy.testing import assert_allclose
 from gammapy.modeling.models import SkyModel
 from gammapy.datasets import Datasets, SpectrumDatasetOnOff
-from gammapy.modeling.sampler import Sampler
+from gammapy.modeling.sampler import Sampler, SamplerLikelihood
 from gammapy.modeling.models import (
     UniformPrior,
     LogUniformPrior,
@@ -142,3 +144,43 @@ def test_run_linked_params(backend="ultranest"):
     assert_allclose(result.models.parameters["amplitude"].error, 1.6e-12, rtol=0.2)
 
     assert result.models._covariance is None
+
+
+@requires_data()
+@pytest.mark.parametrize("parallel_backend", ["threads", "multiprocessing"])
+def test_sampler_likelihood_batch(parallel_backend):
+    dataset = SpectrumDatasetOnOff.read(
+        "$GAMMAPY_DATA/joint-crab/spectra/hess/pha_obs23523.fits"
+    )
+    datasets = Datasets([dataset])
+    datasets.models = [SkyModel(PowerLawSpectralModel(), name="source")]
+    parameters = datasets.parameters.free_unique_parameters
+
+    like = SamplerLikelihood(
+        function=datasets._stat_sum_likelihood,
+        parameters=parameters,
+        n_jobs=2,
+        parallel_backend=parallel_backend,
+    )
+
+    values = np.array([[2.0, 1e-11], [2.5, 2e-11], [3.0, 4e-11]])
+    initial = parameters.value
+
+    try:
+        actual = like.fcn_batch(values)
+        pool = like._pool[1]
+
+        assert actual.shape == (3,)
+        assert_allclose(parameters.value, initial)
+
+        # the workers and their likelihood copies are reused
+        actual_reversed = like.fcn_batch(values[::-1])
+        assert like._pool[1] is pool
+    finally:
+        like.close()
+
+    assert like._pool is None
+
+    expected = [like.fcn(value) for value in values]
+    assert_allclose(actual, expected, rtol=1e-10)
+    assert_allclose(actual_reversed, expected[::-1], rtol=1e-10)
@@ -4,10 +4,12 @@
 see :ref:`fit-statistics`
 """
 
+import weakref
 from abc import ABC
 import numpy as np
 from scipy.special import erfc
 from gammapy.maps import Map
+from gammapy.utils.cache import LRUCache
 
 from gammapy.utils.compilation import get_fit_statistics_compiled
 
@@ -254,6 +256,8 @@ def get_wstat_gof_terms(n_on, n_off):
 class FitStatistic(ABC):
     """Abstract base class for FitStatistic objects."""
 
+    has_gradient = False
+
     @classmethod
     def stat_sum_dataset(cls, dataset):
         """Calculate -2 * sum log(L)."""
@@ -273,10 +277,196 @@ class FitStatistic(ABC):
         """Calculate sum log(L)."""
         return -0.5 * cls.stat_sum_dataset(dataset)
 
+    @classmethod
+    def stat_sum_datasets(cls, datasets):
+        """Calculate -2 * sum log(L) summed over several datasets."""
+        return np.sum([cls.stat_sum_dataset(dataset) for dataset in datasets])
+
+    @classmethod
+    def stat_sum_gradient_dataset(cls, dataset, parameters):
+        """Calculate the derivatives of -2 * sum log(L) wrt the parameter values."""
+        raise NotImplementedError
+
+
+# dataset attributes whose data arrays are packed once, see `_PackedDatasets`
+PACKED_DATASETS_STATE_NAMES = [
+    "counts",
+    "counts_off",
+    "acceptance",
+    "acceptance_off",
+    "mask_safe",
+    "mask_fit",
+]
+
+PACKED_DATASETS_CACHE_MAX_BYTES = 64 * 1024**2
+
+PACKED_DATASETS_CACHE = LRUCache(max_bytes=PACKED_DATASETS_CACHE_MAX_BYTES)
+"""Cache of the packed data of datasets, used by `FitStatistic.stat_sum_datasets`.
+
+The counts, masks and other arrays which do not depend on the model parameters are
+packed once per group of datasets and reused as long as the data arrays of the datasets
+are the same objects, only the predicted counts are packed on each evaluation. The data
+are packed again if these arrays are replaced, e.g. by
+`~gammapy.datasets.MapDataset.fake` or by setting a new mask, but modifying the data of
+the maps in place after the first evaluation is not detected. Call
+``PACKED_DATASETS_CACHE.clear()`` in that case.
+"""
+
+
+def _get_data_state(dataset):
+    """Weak references to the data arrays the packed data depend on."""
+    state = []
+
+    for name in PACKED_DATASETS_STATE_NAMES:
+        value = getattr(dataset, name, None)
+        data = getattr(value, "data", None)
+        state.append(weakref.ref(data) if isinstance(data, np.ndarray) else None)
+
+    return state
+
+
+class _PackedDatasets:
+    """Data of several datasets packed into contiguous flat arrays.
+
+    Parameters
+    ----------
+    datasets : list of `~gammapy.datasets.Dataset`
+        Datasets.
+    names : list of str
+        Dataset attributes or methods returning a `~gammapy.maps.Map`, which do
+        not depend on the model parameters. If the attribute is None, the array
+        is filled with ones.
+    dtypes : list of `~numpy.dtype`
+        Data type of the packed arrays.
+    name_model : str
+        Dataset method returning the predicted counts, packed on each call of
+        `pack_model` into a preallocated buffer.
+    """
+
+    def __init__(self, datasets, names, dtypes, name_model):
+        self._datasets = [weakref.ref(dataset) for dataset in datasets]
+        self._states = [_get_data_state(dataset) for dataset in datasets]
+        self._sizes = [dataset.counts.data.size for dataset in datasets]
+        self.name_model = name_model
+
+        size = sum(self._sizes)
+        self.arrays = [np.empty(size, dtype=dtype) for dtype in dtypes]
+
+        for name, array in zip(names, self.arrays):
+            self._pack(datasets, name, array)
+
+        self._buffer_model = np.empty(size)
+
+    @property
+    def nbytes(self):
+        """Memory size of the packed arrays in bytes."""
+        return sum(_.nbytes for _ in self.arrays) + self._buffer_model.nbytes
+
+    def _pack(self, datasets, name, array):
+        """Pack a dataset attribute into an array."""
+        offset = 0
+        for dataset, size in zip(datasets, self._sizes):
+            idx = slice(offset, offset + size)
+            value = getattr(dataset, name)
+            value = value() if callable(value) else value
+            if value is None:
+                array[idx] = 1
+            else:
+                value = value.data if isinstance(value, Map) else value
+                array[idx] = value.ravel()
+            offset += size
+
+    def is_valid(self, datasets):
+        """Whether the packed data are up to date for the given datasets."""
+        if len(datasets) != len(self._datasets):
+            return False
+
+        for dataset, ref, state in zip(datasets, self._datasets, self._states):
+            if ref() is not dataset:
+                return False
+
+            for ref_data, ref_data_current in zip(state, _get_data_state(dataset)):
+                if ref_data is None or ref_data_current is None:
+                    if ref_data is not ref_data_current:
+                        return False
+                elif ref_data() is not ref_data_current():
+                    return False
+
+        return True
+
+    def pack_model(self, datasets):
+        """Pack the predicted counts of the datasets.
+
+        Parameters
+        ----------
+        datasets : list of `~gammapy.datasets.Dataset`
+            Datasets.
+
+        Returns
+        -------
+        array : `~numpy.ndarray`
+            Packed predicted counts, overwritten by the next call.
+        """
+        self._pack(datasets, self.name_model, self._buffer_model)
+        return self._buffer_model
+
+
+def _get_packed_datasets(datasets, names, dtypes, name_model="npred"):
+    """Get the packed data of datasets, cached in `PACKED_DATASETS_CACHE`."""
+    ids = tuple(id(dataset) for dataset in datasets)
+    key = (tuple(names), tuple(dtypes), name_model, ids)
+    packed = PACKED_DATASETS_CACHE.get(key)
+
+    if packed is None or not packed.is_valid(datasets):
+        packed = _PackedDatasets(
+            datasets, names=names, dtypes=dtypes, name_model=name_model
+        )
+        PACKED_DATASETS_CACHE.put(key, packed)
+
+    return packed
+
+
+def _cash_sum_gradient(dataset, parameters):
+    """Derivatives of the summed Cash statistic with respect to the parameter values.
+
+    The mask of the dataset is used as weights, so that this also applies to the
+    weighted Cash statistic.
+
+    Parameters
+    ----------
+    dataset : `~gammapy.datasets.MapDataset`
+        Dataset.
+    parameters : `~gammapy.modeling.Parameters`
+        Parameters.
+
+    Returns
+    -------
+    gradient : `~numpy.ndarray`
+        Derivatives of the statistic, one per parameter.
+    """
+    counts, npred = dataset.counts.data.astype(float), dataset.npred().data
+    truncation_value = get_fit_statistics_compiled()["TRUNCATION_VALUE"]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        weights = np.where(npred > truncation_value, 2 * (1 - counts / npred), 0)
+
+    if dataset.mask is not None:
+        weights = weights * dataset.mask.data
+
+    gradient = np.zeros(len(parameters))
+
+    for idx, npred_gradient in enumerate(dataset._npred_gradient(parameters)):
+        if npred_gradient is not None:
+            gradient[idx] = np.sum(weights * npred_gradient.data)
+
+    return gradient
+
 
 class CashFitStatistic(FitStatistic):
     """Cash statistic class for Poisson with known background."""
 
+    has_gradient = True
+
     @classmethod
     def stat_sum_dataset(cls, dataset):
         mask = dataset.mask
@@ -296,10 +486,33 @@ class CashFitStatistic(FitStatistic):
         counts, npred = dataset.counts.data, dataset.npred().data
         return cash(n_on=counts, mu_on=npred)
 
+    @classmethod
+    def stat_sum_gradient_dataset(cls, dataset, parameters):
+        return _cash_sum_gradient(dataset, parameters)
+
+    @classmethod
+    def stat_sum_datasets(cls, datasets):
+        """Calculate the summed Cash statistic of several datasets.
+
+        The counts, predicted counts and masks of all datasets are packed into
+        contiguous arrays and the statistic is computed with a single call to
+        the compiled weighted Cash function, using the masks as weights.
+        """
+        packed = _get_packed_datasets(
+            datasets, names=["counts", "mask"], dtypes=[float, float]
+        )
+        counts, weights = packed.arrays
+        npred = packed.pack_model(datasets)
+        return get_fit_statistics_compiled()["weighted_cash_sum_compiled"](
+            counts, npred, weights
+        )
+
 
 class WeightedCashFitStatistic(FitStatistic):
     """Cash statistic class for Poisson with known background applying weights."""
 
+    has_gradient = True
+
     @classmethod
     def stat_sum_dataset(cls, dataset):
         counts, npred = dataset.counts.data.astype(float), dataset.npred().data
@@ -327,6 +540,27 @@ class WeightedCashFitStatistic(FitStatistic):
             weights = dataset.mask.astype("float")
         return cash(n_on=counts, mu_on=npred) * weights
 
+    @classmethod
+    def stat_sum_gradient_dataset(cls, dataset, parameters):
+        return _cash_sum_gradient(dataset, parameters)
+
+    @classmethod
+    def stat_sum_datasets(cls, datasets):
+        """Calculate the summed weighted Cash statistic of several datasets.
+
+        The counts, predicted counts and weights of all datasets are packed into
+        contiguous arrays and the statistic is computed with a single call to
+        the compiled weighted Cash function.
+        """
+        packed = _get_packed_datasets(
+            datasets, names=["counts", "mask"], dtypes=[float, float]
+        )
+        counts, weights = packed.arrays
+        npred = packed.pack_model(datasets)
+        return get_fit_statistics_compiled()["weighted_cash_sum_compiled"](
+            counts, npred, weights
+        )
+
 
 class WStatFitStatistic(FitStatistic):
     """WStat fit statistic class for ON-OFF Poisson measurements."""
@@ -359,6 +593,35 @@ class WStatFitStatistic(FitStatistic):
                 stat_array = stat_array[dataset.mask.data]
             return np.sum(stat_array)
 
+    @classmethod
+    def stat_sum_datasets(cls, datasets):
+        """Calculate the summed WStat statistic of several datasets.
+
+        The data of all datasets are packed into contiguous arrays and the
+        statistic is computed with a single evaluation of `wstat`.
+        """
+        datasets_off = [_ for _ in datasets if _.counts_off is not None]
+
+        stat_sum = super().stat_sum_datasets(
+            [_ for _ in datasets if _.counts_off is None]
+        )
+
+        if datasets_off:
+            packed = _get_packed_datasets(
+                datasets_off,
+                names=["counts", "counts_off", "alpha", "mask"],
+                dtypes=[float, float, float, bool],
+                name_model="npred_signal",
+            )
+            counts, counts_off, alpha, mask = packed.arrays
+            npred_signal = packed.pack_model(datasets_off)
+            stat_array = wstat(
+                n_on=counts, n_off=counts_off, alpha=alpha, mu_sig=npred_signal
+            )
+            stat_sum += np.sum(np.nan_to_num(stat_array)[mask])
+
+        return stat_sum
+
 
 class Chi2FitStatistic(FitStatistic):
     """Chi2 fit statistic class for measurements with gaussian symmetric errors."""
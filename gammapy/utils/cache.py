@@ -4,7 +4,9 @@
 import functools
 import inspect
 import hashlib
+import threading
 import weakref
+from collections import OrderedDict
 from gammapy.utils.parallel import is_ray_available
 
 USE_INSTANCE_CACHE = False
@@ -150,3 +152,135 @@ class CacheInstanceMixin:
                 cache2 = cls._instances[cls] = {}
             out = cache2[argkey] = new
         return out
+
+
+def _get_nbytes(value):
+    """Memory size in bytes of an array, Quantity or Map, or a tuple of those."""
+    if isinstance(value, tuple):
+        return sum(_get_nbytes(_) for _ in value)
+
+    if hasattr(value, "nbytes"):
+        return value.nbytes
+    return getattr(getattr(value, "data", None), "nbytes", 0)
+
+
+class LRUCache:
+    """Least recently used cache bounded by the memory size of the cached values.
+
+    When the total size of the cached values exceeds ``max_bytes``, the least
+    recently used entries are discarded. The cached values are not copied and
+    should not be modified in place. The cache entries are not pickled. The cache
+    can be used from several threads.
+
+    Parameters
+    ----------
+    max_bytes : int
+        Maximum total size of the cached values in bytes. Nothing is cached if
+        it is 0.
+
+    Attributes
+    ----------
+    hits : int
+        Number of cache lookups that found a value.
+    misses : int
+        Number of cache lookups that did not find a value.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_data"] = OrderedDict()
+        state["_nbytes"] = 0
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def nbytes(self):
+        """Total size of the cached values in bytes."""
+        return self._nbytes
+
+    def get(self, key):
+        """Get a cached value and mark it as most recently used.
+
+        Parameters
+        ----------
+        key : hashable
+            Cache key.
+
+        Returns
+        -------
+        value : object
+            Cached value, or None if the key is not in the cache.
+        """
+        with self._lock:
+            try:
+                value, _ = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return None
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """Add a value to the cache and discard the least recently used entries.
+
+        Values larger than ``max_bytes`` are not cached.
+
+        Parameters
+        ----------
+        key : hashable
+            Cache key.
+        value : object
+            Value to cache.
+        """
+        nbytes = _get_nbytes(value)
+
+        with self._lock:
+            if key in self._data:
+                self._nbytes -= self._data.pop(key)[1]
+
+            if nbytes > self.max_bytes or self.max_bytes <= 0:
+                return
+
+            self._data[key] = (value, nbytes)
+            self._nbytes += nbytes
+
+            while self._nbytes > self.max_bytes:
+                _, (_, nbytes_discarded) = self._data.popitem(last=False)
+                self._nbytes -= nbytes_discarded
+
+    def clear(self):
+        """Remove all cached values. The hit and miss counters are kept."""
+        with self._lock:
+            self._data.clear()
+            self._nbytes = 0
+
+    @property
+    def info(self):
+        """Cache statistics (dict)."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self),
+            "nbytes": self.nbytes,
+            "max_bytes": self.max_bytes,
+        }
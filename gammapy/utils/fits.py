@@ -6,12 +6,23 @@ import astropy.units as u
 from astropy.coordinates import AltAz, Angle, EarthLocation, SkyCoord
 from astropy.io import fits
 from astropy.units import Quantity
+from .cache import LRUCache
 from .scripts import make_path
 
 log = logging.getLogger(__name__)
 
 __all__ = ["earth_location_from_dict", "LazyFitsData", "HDULocation"]
 
+IRF_CACHE_MAX_BYTES = 512 * 1024**2
+
+IRF_CACHE = LRUCache(max_bytes=IRF_CACHE_MAX_BYTES)
+"""Process-wide cache of the IRFs loaded by `HDULocation.load`.
+
+IRFs read from the same HDU of an unchanged file are shared between observations.
+They should therefore not be modified in place. The hit and miss statistics are
+given by ``IRF_CACHE.info``, the cache is disabled by setting ``max_bytes`` to 0.
+"""
+
 
 class HDULocation:
     """HDU localisation, loading and Gammapy object mapper.
@@ -78,6 +89,23 @@ class HDULocation:
         hdu_list = fits.open(str(filename), memmap=False)
         return hdu_list[self.hdu_name]
 
+    def _irf_cache_key(self):
+        """IRF cache key, None if the file cannot be found."""
+        filename = self.path()
+
+        try:
+            stat = filename.stat()
+        except OSError:
+            return None
+
+        return (
+            filename.resolve().as_posix(),
+            self.hdu_name,
+            self.hdu_class,
+            stat.st_size,
+            stat.st_mtime_ns,
+        )
+
     def load(self):
         """Load HDU as appropriate class."""
         from gammapy.irf import IRF_REGISTRY
@@ -112,7 +140,16 @@ class HDULocation:
         else:
             cls = IRF_REGISTRY.get_cls(hdu_class)
 
-            return cls.read(filename, hdu=hdu)
+            key = self._irf_cache_key()
+            irf = IRF_CACHE.get(key) if key is not None else None
+
+            if irf is None:
+                irf = cls.read(filename, hdu=hdu)
+
+                if key is not None:
+                    IRF_CACHE.put(key, irf)
+
+            return irf
 
 
 class LazyFitsData(object):
@@ -148,6 +185,21 @@ class LazyFitsData(object):
                 instance.__dict__[self.name] = value
             return value
 
+    def hdu_location(self, instance):
+        """HDU location of the data of an instance, None if not read from a file.
+
+        Parameters
+        ----------
+        instance : object
+            Instance owning the data.
+
+        Returns
+        -------
+        hdu_location : `HDULocation` or None
+            HDU location.
+        """
+        return instance.__dict__.get(f"_{self.name}_hdu")
+
     def __set__(self, instance, value):
         if isinstance(value, HDULocation):
             instance.__dict__[f"_{self.name}_hdu"] = value
@@ -1,9 +1,15 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 """Multiprocessing and multithreading setup."""
 
+import atexit
+import contextlib
+import functools
 import importlib
 import logging
+import os
+import sys
 from enum import Enum
+import numpy as np
 from gammapy.utils.pbar import progress_bar
 
 log = logging.getLogger(__name__)
@@ -16,6 +22,10 @@ __all__ = [
     "POOL_KWARGS_DEFAULT",
     "METHOD_DEFAULT",
     "METHOD_KWARGS_DEFAULT",
+    "PERSISTENT_POOL_DEFAULT",
+    "SHARED_MEMORY_DEFAULT",
+    "get_pool",
+    "shutdown_pool",
 ]
 
 
@@ -24,6 +34,7 @@ class ParallelBackendEnum(Enum):
 
     multiprocessing = "multiprocessing"
     ray = "ray"
+    threads = "threads"
 
     @classmethod
     def from_str(cls, value):
@@ -40,6 +51,7 @@ class PoolMethodEnum(Enum):
 
     starmap = "starmap"
     apply_async = "apply_async"
+    imap = "imap"
 
 
 BACKEND_DEFAULT = ParallelBackendEnum.multiprocessing
@@ -48,6 +60,27 @@ ALLOW_CHILD_JOBS = False
 POOL_KWARGS_DEFAULT = dict(processes=N_JOBS_DEFAULT)
 METHOD_DEFAULT = PoolMethodEnum.starmap
 METHOD_KWARGS_DEFAULT = {}
+PERSISTENT_POOL_DEFAULT = False
+WARMUP_MODULES_DEFAULT = (
+    "gammapy.datasets",
+    "gammapy.estimators",
+    "gammapy.makers",
+    "gammapy.modeling",
+)
+
+SHARED_MEMORY_DEFAULT = False
+# arrays smaller than this are pickled as usual
+SHARED_MEMORY_MIN_BYTES = 2**16
+
+# persistent pools by backend, see `get_pool` and `shutdown_pool`
+_POOLS = {}
+
+# persistent thread pools by number of threads, see `get_thread_pool`
+_THREAD_POOLS = {}
+
+# shared memory state, see `SharedMemoryRegistry`
+_SHARED_MEMORY_REGISTRY = None
+_SHARED_MEMORY_ATTACHED = {}
 
 
 def get_multiprocessing():
@@ -67,6 +100,20 @@ def get_multiprocessing_ray():
     return multiprocessing
 
 
+def get_multiprocessing_threads():
+    """Get multiprocessing module for threads backend."""
+    import multiprocessing.dummy as multiprocessing
+
+    return multiprocessing
+
+
+def is_worker_thread():
+    """Check if running in a worker thread of a threads backend pool."""
+    from multiprocessing.dummy import DummyProcess, current_process
+
+    return isinstance(current_process(), DummyProcess)
+
+
 def is_ray_initialized():
     """Check if ray is initialized."""
     try:
@@ -94,15 +141,34 @@ class multiprocessing_manager:
 
     Parameters
     ----------
-    backend : {'multiprocessing', 'ray'}
-        Backend to use.
+    backend : {'multiprocessing', 'ray', 'threads'}
+        Backend to use. The 'threads' backend runs the tasks in a thread pool
+        of the current process: inputs are not pickled and no process is started,
+        but only code releasing the GIL (e.g. Numpy, Scipy or Numba with
+        ``nogil=True``) runs concurrently.
     pool_kwargs : dict
         Keyword arguments passed to the pool. The number of processes is limited
         to the number of physical CPUs.
-    method : {'starmap', 'apply_async'}
-        Pool method to use.
+    method : {'starmap', 'apply_async', 'imap'}
+        Pool method to use. With 'imap', `run_multiprocessing` returns a generator
+        yielding the results in the order of the inputs as soon as they are
+        available.
     method_kwargs : dict
         Keyword arguments passed to the method
+    persistent_pool : bool
+        Whether to keep a single worker pool alive and reuse it across calls
+        of `run_multiprocessing`. The pool is started lazily on first use and
+        shut down when leaving the context manager, or explicitly with
+        `shutdown_pool`.
+    warmup_modules : list of str
+        Modules to import in each worker when the persistent pool is started.
+        Default is None, which imports the main Gammapy sub-packages.
+    shared_memory : bool
+        Whether to send map data, and other large arrays, to the workers
+        through shared memory blocks instead of pickling them. The workers
+        receive read-only views of the data. Only `~numpy.ndarray` and
+        `~astropy.units.Quantity` instances are shared, other array subclasses
+        are pickled as usual. Only used with the multiprocessing backend.
 
     Examples
     --------
@@ -118,20 +184,46 @@ class multiprocessing_manager:
                 pool_kwargs=dict(processes=2),
             ):
             fpe.run(datasets)
+
+    To reuse the same worker processes for several runs:
+
+    ::
+
+        with parallel.multiprocessing_manager(
+                pool_kwargs=dict(processes=4),
+                persistent_pool=True,
+            ):
+            for datasets in datasets_list:
+                fpe.run(datasets)
     """
 
-    def __init__(self, backend=None, pool_kwargs=None, method=None, method_kwargs=None):
+    def __init__(
+        self,
+        backend=None,
+        pool_kwargs=None,
+        method=None,
+        method_kwargs=None,
+        persistent_pool=None,
+        warmup_modules=None,
+        shared_memory=None,
+    ):
         global \
             BACKEND_DEFAULT, \
             POOL_KWARGS_DEFAULT, \
             METHOD_DEFAULT, \
             METHOD_KWARGS_DEFAULT, \
-            N_JOBS_DEFAULT
+            N_JOBS_DEFAULT, \
+            PERSISTENT_POOL_DEFAULT, \
+            WARMUP_MODULES_DEFAULT, \
+            SHARED_MEMORY_DEFAULT
         self._backend = BACKEND_DEFAULT
         self._pool_kwargs = POOL_KWARGS_DEFAULT
         self._method = METHOD_DEFAULT
         self._method_kwargs = METHOD_KWARGS_DEFAULT
         self._n_jobs = N_JOBS_DEFAULT
+        self._persistent_pool = PERSISTENT_POOL_DEFAULT
+        self._warmup_modules = WARMUP_MODULES_DEFAULT
+        self._shared_memory = SHARED_MEMORY_DEFAULT
         if backend is not None:
             BACKEND_DEFAULT = ParallelBackendEnum.from_str(backend).value
         if pool_kwargs is not None:
@@ -141,6 +233,12 @@ class multiprocessing_manager:
             METHOD_DEFAULT = PoolMethodEnum(method).value
         if method_kwargs is not None:
             METHOD_KWARGS_DEFAULT = method_kwargs
+        if persistent_pool is not None:
+            PERSISTENT_POOL_DEFAULT = persistent_pool
+        if warmup_modules is not None:
+            WARMUP_MODULES_DEFAULT = tuple(warmup_modules)
+        if shared_memory is not None:
+            SHARED_MEMORY_DEFAULT = shared_memory
 
     def __enter__(self):
         pass
@@ -151,17 +249,28 @@ class multiprocessing_manager:
             POOL_KWARGS_DEFAULT, \
             METHOD_DEFAULT, \
             METHOD_KWARGS_DEFAULT, \
-            N_JOBS_DEFAULT
+            N_JOBS_DEFAULT, \
+            PERSISTENT_POOL_DEFAULT, \
+            WARMUP_MODULES_DEFAULT, \
+            SHARED_MEMORY_DEFAULT
+        if PERSISTENT_POOL_DEFAULT and not self._persistent_pool:
+            shutdown_pool()
+
         BACKEND_DEFAULT = self._backend
         POOL_KWARGS_DEFAULT = self._pool_kwargs
         METHOD_DEFAULT = self._method
         METHOD_KWARGS_DEFAULT = self._method_kwargs
         N_JOBS_DEFAULT = self._n_jobs
+        PERSISTENT_POOL_DEFAULT = self._persistent_pool
+        WARMUP_MODULES_DEFAULT = self._warmup_modules
+        SHARED_MEMORY_DEFAULT = self._shared_memory
 
 
 class ParallelMixin:
     """Mixin class to handle parallel processing."""
 
+    _n_jobs = None
+    _parallel_backend = None
     _n_child_jobs = 1
 
     @property
@@ -215,6 +324,291 @@ class ParallelMixin:
             self._parallel_backend = ParallelBackendEnum.from_str(value).value
 
 
+def _warmup_worker(modules):
+    """Import modules in a worker process, used as pool initializer."""
+    for module in modules:
+        importlib.import_module(module)
+
+
+def get_pool(backend=None, pool_kwargs=None):
+    """Get the persistent pool of a backend, starting it if needed.
+
+    There is at most one persistent pool per backend. The pool is reused as
+    long as the pool keyword arguments do not change, otherwise the running
+    pool is shut down and a new one is started.
+
+    Parameters
+    ----------
+    backend : {'multiprocessing', 'ray', 'threads'}, optional
+        Backend to use. Default is None.
+    pool_kwargs : dict, optional
+        Keyword arguments passed to the pool. Default is None.
+
+    Returns
+    -------
+    pool : `~multiprocessing.pool.Pool`
+        Worker pool.
+    """
+    if backend is None:
+        backend = BACKEND_DEFAULT
+
+    if pool_kwargs is None:
+        pool_kwargs = POOL_KWARGS_DEFAULT
+
+    backend = ParallelBackendEnum.from_str(backend)
+    pool_kwargs = pool_kwargs.copy()
+
+    if (
+        backend != ParallelBackendEnum.threads
+        and "initializer" not in pool_kwargs
+        and WARMUP_MODULES_DEFAULT
+    ):
+        pool_kwargs["initializer"] = _warmup_worker
+        pool_kwargs["initargs"] = (WARMUP_MODULES_DEFAULT,)
+
+    key = repr(sorted(pool_kwargs.items()))
+
+    if backend in _POOLS and _POOLS[backend][0] != key:
+        shutdown_pool(backend=backend)
+
+    if backend not in _POOLS:
+        multiprocessing = PARALLEL_BACKEND_MODULES[backend]()
+        log.info(
+            f"Starting persistent {backend.value} pool with "
+            f"{pool_kwargs.get('processes')} processes"
+        )
+        _POOLS[backend] = (key, multiprocessing.Pool(**pool_kwargs))
+
+    return _POOLS[backend][1]
+
+
+def get_thread_pool(processes):
+    """Get a persistent thread pool with a given number of threads.
+
+    Contrary to `get_pool`, one thread pool is kept per number of threads, so
+    that callers using different numbers of threads do not restart each other's
+    pool. The pools are shut down by `shutdown_pool`.
+
+    Parameters
+    ----------
+    processes : int
+        Number of threads.
+
+    Returns
+    -------
+    pool : `~multiprocessing.pool.ThreadPool`
+        Thread pool.
+    """
+    if processes not in _THREAD_POOLS:
+        multiprocessing = get_multiprocessing_threads()
+        log.info(f"Starting persistent thread pool with {processes} threads")
+        _THREAD_POOLS[processes] = multiprocessing.Pool(processes=processes)
+
+    return _THREAD_POOLS[processes]
+
+
+def shutdown_pool(backend=None):
+    """Shut down the persistent pools, if they are running.
+
+    Parameters
+    ----------
+    backend : {'multiprocessing', 'ray', 'threads'}, optional
+        Backend of the pool to shut down. Default is None, which shuts down
+        the pools of all backends. The pools returned by `get_thread_pool` are
+        shut down with the "threads" backend.
+    """
+    if backend is None:
+        backends = list(ParallelBackendEnum)
+    else:
+        backends = [ParallelBackendEnum.from_str(backend)]
+
+    pools = [_POOLS.pop(backend)[1] for backend in backends if backend in _POOLS]
+
+    if ParallelBackendEnum.threads in backends:
+        pools.extend(_THREAD_POOLS.values())
+        _THREAD_POOLS.clear()
+
+    for pool in pools:
+        pool.close()
+        pool.join()
+
+
+atexit.register(shutdown_pool)
+
+
+def _open_shared_memory(**kwargs):
+    """Open a shared memory block not tracked by the resource tracker.
+
+    The blocks are explicitly unlinked by `SharedMemoryRegistry.close`, and
+    the workers must not unlink them when they exit.
+    """
+    from multiprocessing import resource_tracker, shared_memory
+
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(track=False, **kwargs)
+
+    shm = shared_memory.SharedMemory(**kwargs)
+    resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
+
+
+def _unlink_shared_memory(shm):
+    """Unlink a shared memory block opened with `_open_shared_memory`."""
+    from multiprocessing import resource_tracker
+
+    if sys.version_info < (3, 13):
+        # unlink unregisters the block, so it has to be registered again
+        resource_tracker.register(shm._name, "shared_memory")
+
+    shm.unlink()
+
+
+def _attach_shared_array(name, shape, dtype):
+    """Rebuild a read-only array from a shared memory block in a worker."""
+
+    # release blocks which are not referenced by any array anymore
+    for key, shm in list(_SHARED_MEMORY_ATTACHED.items()):
+        try:
+            shm.close()
+        except BufferError:
+            continue
+        del _SHARED_MEMORY_ATTACHED[key]
+
+    shm = _open_shared_memory(name=name)
+    _SHARED_MEMORY_ATTACHED[name] = shm
+
+    # the array holds a buffer export until it is garbage collected, which
+    # prevents the block from being closed above while it is still in use
+    array = np.frombuffer(shm.buf, dtype=dtype, count=int(np.prod(shape)))
+    array = array.reshape(shape)
+    array.flags.writeable = False
+    return array
+
+
+class SharedMemoryRegistry:
+    """Registry of the shared memory blocks created for a parallel run.
+
+    While the registry is active, numpy arrays and quantities sent to the
+    multiprocessing workers are copied into shared memory blocks, once per array,
+    and only the name of the block is pickled. The workers rebuild read-only views
+    on the blocks. The blocks are released when leaving the context. Other
+    subclasses of `~numpy.ndarray` are pickled as usual.
+    """
+
+    def __init__(self):
+        self._blocks = {}
+        self._pid = os.getpid()
+
+    @property
+    def nbytes(self):
+        """Total size of the shared memory blocks in bytes."""
+        return sum(shm.size for _, shm, _ in self._blocks.values())
+
+    def share(self, array):
+        """Copy array into a shared memory block.
+
+        Parameters
+        ----------
+        array : `~numpy.ndarray` or `~astropy.units.Quantity`
+            Array to share, only its values are copied.
+
+        Returns
+        -------
+        args : tuple
+            Arguments of `_attach_shared_array` to rebuild the array.
+        """
+        key = id(array)
+
+        if key not in self._blocks:
+            shm = _open_shared_memory(create=True, size=max(array.nbytes, 1))
+            data = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)
+            data[...] = np.asarray(array)
+            del data
+            args = (shm.name, array.shape, array.dtype)
+            # keep a reference to the array so that its id is not reused
+            self._blocks[key] = (array, shm, args)
+
+        return self._blocks[key][2]
+
+    def close(self):
+        """Release all shared memory blocks."""
+        for _, shm, _ in self._blocks.values():
+            shm.close()
+            _unlink_shared_memory(shm)
+
+        self._blocks = {}
+
+    def __enter__(self):
+        global _SHARED_MEMORY_REGISTRY
+        _SHARED_MEMORY_REGISTRY = self
+        return self
+
+    def __exit__(self, type, value, traceback):
+        global _SHARED_MEMORY_REGISTRY
+        _SHARED_MEMORY_REGISTRY = None
+        self.close()
+
+
+def _attach_shared_quantity(args, unit):
+    """Rebuild a read-only quantity from a shared memory block in a worker."""
+    import astropy.units as u
+
+    array = _attach_shared_array(*args)
+    return u.Quantity(array, unit, dtype=array.dtype, copy=False)
+
+
+def _get_shared_memory_registry(array):
+    """Registry used to share an array, None if it is pickled as usual."""
+    registry = _SHARED_MEMORY_REGISTRY
+
+    if (
+        registry is None
+        # workers forked while the registry is active must not share arrays
+        or registry._pid != os.getpid()
+        or array.dtype.hasobject
+        or array.nbytes < SHARED_MEMORY_MIN_BYTES
+    ):
+        return None
+
+    return registry
+
+
+def _reduce_array(array):
+    """Reduce numpy arrays sent to multiprocessing workers."""
+    registry = _get_shared_memory_registry(array)
+
+    if registry is None:
+        return array.__reduce__()
+
+    return _attach_shared_array, registry.share(array)
+
+
+def _reduce_quantity(quantity):
+    """Reduce quantities sent to multiprocessing workers."""
+    registry = _get_shared_memory_registry(quantity)
+
+    if registry is None:
+        return quantity.__reduce__()
+
+    return _attach_shared_quantity, (registry.share(quantity), quantity.unit)
+
+
+def _register_array_reducer():
+    """Register the shared memory reducers with the multiprocessing pickler.
+
+    The pickler dispatches on the exact type: subclasses of `~numpy.ndarray`
+    other than `~astropy.units.Quantity` are pickled as usual.
+    """
+    from multiprocessing.reduction import ForkingPickler
+    import astropy.units as u
+
+    ForkingPickler.register(np.ndarray, _reduce_array)
+    ForkingPickler.register(u.Quantity, _reduce_quantity)
+
+
+_register_array_reducer()
+
+
 def run_multiprocessing(
     func,
     inputs,
@@ -223,6 +617,8 @@ def run_multiprocessing(
     method=None,
     method_kwargs=None,
     task_name="",
+    persistent_pool=None,
+    shared_memory=None,
 ):
     """Run function in a loop or in Parallel.
 
@@ -236,21 +632,37 @@ def run_multiprocessing(
         Function to run.
     inputs : list
         List of arguments to pass to the function.
-    backend : {'multiprocessing', 'ray'}, optional
+    backend : {'multiprocessing', 'ray', 'threads'}, optional
         Backend to use. Default is None.
     pool_kwargs : dict, optional
         Keyword arguments passed to the pool. The number of processes is limited
         to the number of physical CPUs. Default is None.
-    method : {'starmap', 'apply_async'}
-        Pool method to use. Default is "starmap".
+    method : {'starmap', 'apply_async', 'imap'}
+        Pool method to use. With 'imap', a generator yielding the results in the
+        order of the inputs, as soon as they are available, is returned.
+        Default is "starmap".
     method_kwargs : dict, optional
         Keyword arguments passed to the method. Default is None.
     task_name : str, optional
         Name of the task to display in the progress bar. Default is "".
+    persistent_pool : bool, optional
+        Whether to run on the persistent pool returned by `get_pool` instead of
+        a pool created for this call only. Default is None, which uses
+        `PERSISTENT_POOL_DEFAULT`.
+    shared_memory : bool, optional
+        Whether to send map data to the workers through shared memory. Only
+        used with the multiprocessing backend. Default is None, which uses
+        `SHARED_MEMORY_DEFAULT`.
     """
     if backend is None:
         backend = BACKEND_DEFAULT
 
+    if persistent_pool is None:
+        persistent_pool = PERSISTENT_POOL_DEFAULT
+
+    if shared_memory is None:
+        shared_memory = SHARED_MEMORY_DEFAULT
+
     if method is None:
         method = METHOD_DEFAULT
 
@@ -270,19 +682,25 @@ def run_multiprocessing(
     backend = ParallelBackendEnum.from_str(backend)
     multiprocessing = PARALLEL_BACKEND_MODULES[backend]()
 
-    if backend == ParallelBackendEnum.multiprocessing:
-        cpu_count = multiprocessing.cpu_count()
+    if backend != ParallelBackendEnum.ray:
+        cpu_count = get_multiprocessing().cpu_count()
 
         if processes > cpu_count:
             log.info(f"Limiting number of processes from {processes} to {cpu_count}")
             processes = cpu_count
 
+    if backend == ParallelBackendEnum.multiprocessing:
         if multiprocessing.current_process().name != "MainProcess":
             # with multiprocessing subprocesses cannot have childs (but possible with ray)
             processes = 1
 
+    if backend == ParallelBackendEnum.threads and is_worker_thread():
+        # avoid starting nested thread pools from worker threads
+        processes = 1
+
     if processes == 1:
-        return run_loop(
+        loop_func = run_loop_imap if method_enum == PoolMethodEnum.imap else run_loop
+        return loop_func(
             func=func, inputs=inputs, method_kwargs=method_kwargs, task_name=task_name
         )
 
@@ -292,17 +710,57 @@ def run_multiprocessing(
 
     log.info(f"Using {processes} processes to compute {task_name}")
 
-    with multiprocessing.Pool(**pool_kwargs) as pool:
-        pool_func = POOL_METHODS[method_enum]
-        results = pool_func(
-            pool=pool,
-            func=func,
-            inputs=inputs,
-            method_kwargs=method_kwargs,
-            task_name=task_name,
+    pool_func = POOL_METHODS[method_enum]
+
+    if persistent_pool:
+        make_pool = functools.partial(
+            get_pool,
+            backend=backend,
+            pool_kwargs={**pool_kwargs, "processes": processes},
         )
+    else:
+        make_pool = functools.partial(multiprocessing.Pool, **pool_kwargs)
+
+    if shared_memory and backend == ParallelBackendEnum.multiprocessing:
+        context = SharedMemoryRegistry()
+    else:
+        context = contextlib.nullcontext()
+
+    run_func = _iter_pool if method_enum == PoolMethodEnum.imap else _run_pool
+    return run_func(
+        make_pool=make_pool,
+        pool_func=pool_func,
+        context=context,
+        terminate=not persistent_pool,
+        func=func,
+        inputs=inputs,
+        method_kwargs=method_kwargs,
+        task_name=task_name,
+    )
 
-    return results
+
+def _run_pool(make_pool, pool_func, context, terminate, **kwargs):
+    """Run pool method and terminate the pool if required."""
+    pool = make_pool()
+
+    try:
+        with context:
+            return pool_func(pool=pool, **kwargs)
+    finally:
+        if terminate:
+            pool.terminate()
+
+
+def _iter_pool(make_pool, pool_func, context, terminate, **kwargs):
+    """Iterate over results of a pool method and terminate the pool if required."""
+    pool = make_pool()
+
+    try:
+        with context:
+            yield from pool_func(pool=pool, **kwargs)
+    finally:
+        if terminate:
+            pool.terminate()
 
 
 def run_loop(func, inputs, method_kwargs=None, task_name=""):
@@ -322,6 +780,17 @@ def run_loop(func, inputs, method_kwargs=None, task_name=""):
     return results
 
 
+def run_loop_imap(func, inputs, method_kwargs=None, task_name=""):
+    """Loop over inputs and yield the function results."""
+    for arguments in progress_bar(inputs, desc=task_name):
+        yield func(*arguments)
+
+
+def _star_call(func, arguments):
+    """Call function with unpacked arguments, used by `run_pool_imap`."""
+    return func(*arguments)
+
+
 def run_pool_star_map(pool, func, inputs, method_kwargs=None, task_name=""):
     """Run function in parallel."""
     return pool.starmap(func, progress_bar(inputs, desc=task_name), **method_kwargs)
@@ -339,12 +808,23 @@ def run_pool_async(pool, func, inputs, method_kwargs=None, task_name=""):
     return results
 
 
+def run_pool_imap(pool, func, inputs, method_kwargs=None, task_name=""):
+    """Run function in parallel and yield results in order."""
+    return pool.imap(
+        functools.partial(_star_call, func),
+        progress_bar(inputs, desc=task_name),
+        **method_kwargs,
+    )
+
+
 POOL_METHODS = {
     PoolMethodEnum.starmap: run_pool_star_map,
     PoolMethodEnum.apply_async: run_pool_async,
+    PoolMethodEnum.imap: run_pool_imap,
 }
 
 PARALLEL_BACKEND_MODULES = {
     ParallelBackendEnum.multiprocessing: get_multiprocessing,
     ParallelBackendEnum.ray: get_multiprocessing_ray,
+    ParallelBackendEnum.threads: get_multiprocessing_threads,
 }
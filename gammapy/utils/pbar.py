@@ -32,12 +32,12 @@ SHOW_PROGRESS_BAR = False
 
 def progress_bar(iterable, desc=None):
     # Necessary because iterable may be a zip
-    iterable_to_list = list(iterable)
-    total = len(iterable_to_list)
+    if not hasattr(iterable, "__len__"):
+        iterable = list(iterable)
 
     return tqdm(
-        iterable_to_list,
-        total=total,
+        iterable,
+        total=len(iterable),
         disable=not SHOW_PROGRESS_BAR,
         desc=desc,
     )
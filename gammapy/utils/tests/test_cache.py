@@ -2,6 +2,7 @@
 
 import pickle
 import numpy as np
+from numpy.testing import assert_allclose
 import gammapy.utils.cache as cache
 from gammapy.utils.testing import requires_dependency
 
@@ -58,3 +59,46 @@ def test_dummy_cache():
 
     assert x is not y
     assert z is not y
+
+
+def test_lru_cache():
+    lru = cache.LRUCache(max_bytes=3 * 80)
+
+    for idx in range(3):
+        lru.put(idx, np.ones(10) * idx)
+
+    assert len(lru) == 3
+    assert lru.nbytes == 240
+    assert_allclose(lru.get(0), 0)
+
+    # 1 is now the least recently used entry
+    lru.put(3, np.ones(10))
+    assert 1 not in lru
+    assert 0 in lru
+    assert lru.get(1) is None
+
+    assert lru.info == {
+        "hits": 1,
+        "misses": 1,
+        "size": 3,
+        "nbytes": 240,
+        "max_bytes": 240,
+    }
+
+    lru.put(4, np.ones(100))
+    assert 4 not in lru
+
+    lru_new = pickle.loads(pickle.dumps(lru))
+    assert len(lru_new) == 0
+    assert lru_new.hits == 1
+
+    lru.clear()
+    assert len(lru) == 0
+    assert lru.nbytes == 0
+
+    lru_new.put(0, np.ones(10))
+    assert 0 in lru_new
+
+    lru_disabled = cache.LRUCache(max_bytes=0)
+    lru_disabled.put(0, 1.0)
+    assert len(lru_disabled) == 0
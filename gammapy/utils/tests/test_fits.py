@@ -1,10 +1,16 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+import os
 import pytest
 import numpy as np
 from numpy.testing import assert_allclose
 from astropy.io import fits
 from astropy.table import Column, Table
-from gammapy.utils.fits import earth_location_from_dict, earth_location_to_dict
+from gammapy.utils.cache import LRUCache
+from gammapy.utils.fits import (
+    HDULocation,
+    earth_location_from_dict,
+    earth_location_to_dict,
+)
 from gammapy.utils.scripts import make_path
 from gammapy.utils.testing import requires_data
 
@@ -73,3 +79,39 @@ def test_earth_location_to_dict(header):
     assert_allclose(loc_dict["GEOLON"], 16.50022, rtol=1e-4)
     assert_allclose(loc_dict["GEOLAT"], -23.271777, rtol=1e-4)
     assert_allclose(loc_dict["ALTITUDE"], 1834.999999, rtol=1e-4)
+
+
+@requires_data()
+def test_hdu_location_irf_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr("gammapy.utils.fits.IRF_CACHE", LRUCache(1024**3))
+    from gammapy.utils.fits import IRF_CACHE
+
+    filename = "hess_dl3_dr1_obs_id_023523.fits.gz"
+    path = make_path("$GAMMAPY_DATA/hess-dl3-dr1/data") / filename
+    (tmp_path / filename).write_bytes(path.read_bytes())
+
+    kwargs = dict(
+        hdu_class="aeff_2d",
+        base_dir=tmp_path,
+        file_dir=".",
+        file_name=filename,
+        hdu_name="AEFF",
+    )
+    aeff = HDULocation(**kwargs).load()
+    aeff_other = HDULocation(**kwargs).load()
+
+    assert aeff_other is aeff
+    assert IRF_CACHE.info["hits"] == 1
+    assert IRF_CACHE.info["misses"] == 1
+    assert IRF_CACHE.info["nbytes"] == aeff.data.nbytes
+
+    edisp = HDULocation(**{**kwargs, "hdu_class": "edisp_2d", "hdu_name": "EDISP"})
+    assert edisp.load() is not aeff
+    assert len(IRF_CACHE) == 2
+
+    stat = (tmp_path / filename).stat()
+    os.utime(tmp_path / filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    aeff_modified = HDULocation(**kwargs).load()
+    assert aeff_modified is not aeff
+    assert IRF_CACHE.info["misses"] == 3
@@ -1,9 +1,12 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import pytest
+import numpy as np
+from numpy.testing import assert_allclose
 import astropy.units as u
+from astropy.coordinates import Angle
 import gammapy.utils.parallel as parallel
 from gammapy.estimators import FluxPointsEstimator
-from gammapy.utils.testing import requires_dependency
+from gammapy.utils.testing import assert_quantity_allclose, requires_dependency
 
 
 def test_parallel_mixin():
@@ -146,3 +149,201 @@ def test_multiprocessing_manager():
     with parallel.multiprocessing_manager(backend="ray", pool_kwargs=dict(processes=3)):
         assert fpe.parallel_backend == "multiprocessing"
         assert fpe.n_jobs == 2
+
+
+def get_pid(x):
+    import os
+
+    return os.getpid()
+
+
+def test_run_multiprocessing_persistent_pool(monkeypatch):
+    import multiprocessing
+
+    # make sure the pool is used even on single core machines
+    monkeypatch.setattr(multiprocessing, "cpu_count", lambda: 2)
+    inputs = [(_,) for _ in range(4)]
+
+    with parallel.multiprocessing_manager(
+        pool_kwargs=dict(processes=2),
+        persistent_pool=True,
+        warmup_modules=["gammapy.utils.parallel"],
+    ):
+        assert parallel.PERSISTENT_POOL_DEFAULT
+
+        pids = parallel.run_multiprocessing(func=get_pid, inputs=inputs)
+        pool = parallel.get_pool(pool_kwargs=dict(processes=2))
+
+        pids_again = parallel.run_multiprocessing(func=get_pid, inputs=inputs)
+        assert parallel.get_pool(pool_kwargs=dict(processes=2)) is pool
+
+        worker_pids = set(worker.pid for worker in pool._pool)
+        assert set(pids) <= worker_pids
+        assert set(pids_again) <= worker_pids
+
+    assert not parallel.PERSISTENT_POOL_DEFAULT
+    assert parallel._POOLS == {}
+
+
+def test_shutdown_pool():
+    pool = parallel.get_pool(pool_kwargs=dict(processes=2))
+    assert parallel.get_pool(pool_kwargs=dict(processes=2)) is pool
+
+    new_pool = parallel.get_pool(pool_kwargs=dict(processes=1))
+    assert new_pool is not pool
+
+    parallel.shutdown_pool()
+    assert parallel._POOLS == {}
+
+    # calling it twice is fine
+    parallel.shutdown_pool()
+
+
+def test_get_thread_pool():
+    pool = parallel.get_thread_pool(processes=2)
+    other_pool = parallel.get_thread_pool(processes=3)
+
+    # pools of different sizes do not restart each other
+    assert other_pool is not pool
+    assert parallel.get_thread_pool(processes=2) is pool
+    assert pool.map(abs, [-1, -2]) == [1, 2]
+
+    parallel.shutdown_pool(backend="threads")
+    assert parallel._THREAD_POOLS == {}
+
+
+def test_shared_memory_registry():
+    import pickle
+    from multiprocessing.reduction import ForkingPickler
+
+    data = np.arange(2**14, dtype=float).reshape((128, 128))
+
+    with parallel.SharedMemoryRegistry() as registry:
+        buffer = ForkingPickler.dumps(data)
+        assert len(buffer) < 1000
+        assert registry.nbytes == data.nbytes
+
+        # the same array is only copied once
+        ForkingPickler.dumps(data)
+        assert registry.nbytes == data.nbytes
+
+        result = pickle.loads(buffer)
+        assert not result.flags.writeable
+        assert_allclose(result, data)
+        del result
+
+    assert parallel._SHARED_MEMORY_REGISTRY is None
+    assert len(ForkingPickler.dumps(data)) > data.nbytes
+
+
+def test_shared_memory_registry_quantity():
+    import pickle
+    from multiprocessing.reduction import ForkingPickler
+
+    quantity = np.arange(2**14, dtype=float) * u.m
+    angle = Angle(np.arange(2**14, dtype=float), "deg")
+
+    with parallel.SharedMemoryRegistry() as registry:
+        result = pickle.loads(ForkingPickler.dumps(quantity))
+        assert registry.nbytes == quantity.nbytes
+        assert not result.flags.writeable
+        assert_quantity_allclose(result, quantity)
+        del result
+
+        # other subclasses are pickled as usual
+        assert len(ForkingPickler.dumps(angle)) > angle.nbytes
+        assert registry.nbytes == quantity.nbytes
+
+
+def sum_array(array):
+    return array.sum(), array.flags.writeable
+
+
+def test_run_multiprocessing_shared_memory(monkeypatch):
+    import multiprocessing
+
+    monkeypatch.setattr(multiprocessing, "cpu_count", lambda: 2)
+    data = np.ones((128, 128))
+
+    with parallel.multiprocessing_manager(
+        pool_kwargs=dict(processes=2), shared_memory=True
+    ):
+        results = parallel.run_multiprocessing(
+            func=sum_array, inputs=[(data,), (2 * data,)]
+        )
+
+    assert_allclose([_[0] for _ in results], [128**2, 2 * 128**2])
+    assert not any(_[1] for _ in results)
+
+
+def get_thread_name(x):
+    import threading
+
+    return threading.current_thread().name
+
+
+def nested_square(x):
+    return sum(
+        parallel.run_multiprocessing(
+            func=square, inputs=[(x,)], pool_kwargs=dict(processes=2)
+        )
+    )
+
+
+def test_run_multiprocessing_threads(monkeypatch):
+    import multiprocessing
+
+    monkeypatch.setattr(multiprocessing, "cpu_count", lambda: 2)
+
+    N = 10
+    inputs = [(_,) for _ in range(N + 1)]
+
+    with parallel.multiprocessing_manager(
+        backend="threads", pool_kwargs=dict(processes=2)
+    ):
+        result = parallel.run_multiprocessing(func=square, inputs=inputs)
+        names = parallel.run_multiprocessing(func=get_thread_name, inputs=inputs)
+        nested = parallel.run_multiprocessing(func=nested_square, inputs=inputs)
+
+        task = MyTask()
+        parallel.run_multiprocessing(
+            func=task,
+            inputs=inputs,
+            method="apply_async",
+            method_kwargs=dict(callback=task.callback),
+        )
+
+    assert sum(result) == N * (N + 1) * (2 * N + 1) / 6
+    assert sum(nested) == N * (N + 1) * (2 * N + 1) / 6
+    assert task.sum_squared == N * (N + 1) * (2 * N + 1) / 6
+    assert "MainThread" not in names
+
+    p = parallel.ParallelMixin()
+    p.parallel_backend = "threads"
+    assert p.parallel_backend == "threads"
+
+
+@pytest.mark.parametrize("backend", ["multiprocessing", "threads"])
+def test_run_multiprocessing_imap(backend, monkeypatch):
+    import multiprocessing
+
+    monkeypatch.setattr(multiprocessing, "cpu_count", lambda: 2)
+    inputs = [(_,) for _ in range(11)]
+
+    results = parallel.run_multiprocessing(
+        func=square,
+        inputs=inputs,
+        backend=backend,
+        method="imap",
+        pool_kwargs=dict(processes=2),
+    )
+    assert not isinstance(results, list)
+    assert list(results) == [_**2 for _ in range(11)]
+
+    results = parallel.run_multiprocessing(
+        func=square,
+        inputs=inputs,
+        method="imap",
+        pool_kwargs=dict(processes=1),
+    )
+    assert list(results) == [_**2 for _ in range(11)]